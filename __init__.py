@@ -1,3 +1,3 @@
 __package__ = "Physics with Units"
-from classes import Unit, Vector, Quantity
+from classes import Unit, Vector, Quantity, QuantityArray, VectorArray, unit_checked
 from constants import Constant
@@ -0,0 +1,71 @@
+"""
+Run the benchmark suite and optionally compare it against a stored baseline.
+
+usage: python -m benchmarks [--quick] [--filter NAME] [--output FILE]
+                            [--baseline FILE] [--tolerance FRACTION]
+
+Results are written as JSON mapping case names to seconds per operation. With --baseline the
+process exits with status 1 if any case is slower than its baseline by more than the tolerance.
+It also exits with status 1 if a case run without unit checks is slower than the same case with
+checks by more than the tolerance.
+"""
+import argparse
+import json
+import platform
+import sys
+
+from .suite import UNCHECKED, run
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> dict[str, float]:
+    """cases slower than their baseline by more than tolerance, with their slowdown ratio"""
+    regressions = {}
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        if reference and seconds > reference * (1 + tolerance):
+            regressions[name] = seconds / reference
+    return regressions
+
+
+def compare_modes(results: dict, tolerance: float) -> dict[str, float]:
+    """unchecked cases slower than their checked counterpart by more than tolerance"""
+    regressions = {}
+    for name in UNCHECKED & results.keys():
+        reference = results.get(name.removesuffix(" unchecked"))
+        if reference and results[name] > reference * (1 + tolerance):
+            regressions[name] = results[name] / reference
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--quick", action="store_true", help="use small batch sizes")
+    parser.add_argument("--filter", default="", help="only run cases containing this")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results in this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": run(args.quick, args.filter),
+    }
+    report["regressions"] = compare_modes(report["results"], args.tolerance)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        report["regressions"].update(
+            compare(report["results"], baseline, args.tolerance)
+        )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    print(text)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
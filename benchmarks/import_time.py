@@ -0,0 +1,46 @@
+"""
+Measure the startup cost of importing the constants module.
+
+Every import runs in a fresh interpreter. "eager scipy" additionally imports scipy.constants,
+which is what importing the constants module used to cost.
+
+usage: python benchmarks/import_time.py [repeats]
+"""
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+CASES = {
+    "classes": "import classes",
+    "constants": "import constants",
+    "constants first use": "import constants; constants.Constant.coulomb",
+    "eager scipy": "import constants; import scipy.constants",
+}
+
+
+def time_import(statement: str, repeats: int) -> float:
+    """median wall time in seconds of running statement in a fresh interpreter"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=ROOT, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main(repeats: int = 10) -> dict[str, float]:
+    baseline = time_import("pass", repeats)
+    return {
+        name: time_import(statement, repeats) - baseline
+        for name, statement in CASES.items()
+    }
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(json.dumps(main(repeats), indent=2))
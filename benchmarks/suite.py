@@ -0,0 +1,211 @@
+"""
+Benchmark cases for the hot paths of Unit, Quantity, Vector and their array counterparts.
+
+Every case is a setup function returning the callable to be timed, so setup costs are excluded.
+Setups only run for the cases selected by the filter. A case repeating an operation several times
+per call registers that number, and its time is reported per operation. Cases registered without
+checks run with unit checks switched off, see classes.mode.
+"""
+import timeit
+from contextlib import nullcontext
+from functools import partial
+
+import numpy as np
+
+from classes import Quantity, QuantityArray, Unit, Vector, VectorArray, unchecked, lazy
+from classes import RotationArray
+from dynamics import ParticleSystem, UniformGravity, Coulomb, electric_field
+from storage import encode_many
+from .import_time import time_import
+
+
+SIZES = (10**3, 10**5, 10**6)
+QUICK_SIZES = (10**3, 10**4)
+
+CASES = {}
+OPERATIONS = {}
+UNCHECKED = set()
+
+
+def case(name: str, operations: int = 1, checks: bool = True):
+    """register a benchmark case under name, whose callable performs operations operations"""
+
+    def register(setup):
+        CASES[name] = setup
+        OPERATIONS[name] = operations
+        if not checks:
+            UNCHECKED.add(name)
+        return setup
+
+    return register
+
+
+@case("unit mul")
+def unit_mul():
+    kilo, meter = Unit([1]), Unit([0, 1])
+    return lambda: kilo * meter
+
+
+@case("unit get_name")
+def unit_get_name():
+    speed = Unit([0, 1, -1])
+    return speed.get_name
+
+
+@case("unit update_dimensions")
+def unit_update_dimensions():
+    return lambda: Unit.update_dimensions("mechanics")
+
+
+@case("quantity mul")
+@case("quantity mul unchecked", checks=False)
+def quantity_mul():
+    m = Quantity(2.0, Unit([1]))
+    a = Quantity(9.81, Unit([0, 1, -2]))
+    return lambda: m * a
+
+
+@case("quantity add")
+@case("quantity add unchecked", checks=False)
+def quantity_add():
+    a, b = Quantity(1.0, Unit([0, 1])), Quantity(2.0, Unit([0, 1]))
+    return lambda: a + b
+
+
+@case("quantity from string")
+def quantity_from_string():
+    return lambda: Quantity(3, "length")
+
+
+@case("vector cross")
+def vector_cross():
+    e = Vector(6.8, 0, 0, Unit([1, 1, -3, 0, -1]))
+    h = Vector(0, 9.3, 0, Unit([0, -1, 0, 0, 1]))
+    return lambda: e.cross(h)
+
+
+@case("vector angle")
+def vector_angle():
+    a, b = Vector(1, 2, 3, Unit([0, 1])), Vector(4, 5, 6, Unit([0, 1]))
+    return lambda: a.angle(b)
+
+
+@case("electric field [10000 points x 100 charges]")
+def field_on_points():
+    rng = np.random.default_rng(0)
+    points = VectorArray(rng.random((10**4, 3)), Unit([0, 1]))
+    positions = VectorArray(rng.random((100, 3)), Unit([0, 1]))
+    charges = QuantityArray(rng.normal(size=100), Unit([0, 0, 1, 0, 1]))
+    return lambda: electric_field(points, positions, charges)
+
+
+@case("rotate vectors [1000000]")
+def rotate_vectors():
+    rng = np.random.default_rng(0)
+    rotations = RotationArray(rng.normal(size=(10**6, 4)))
+    vectors = VectorArray(rng.normal(size=(10**6, 3)), Unit([0, 1]))
+    return lambda: rotations.apply(vectors)
+
+
+@case("binary encode [10000]")
+def binary_encode():
+    stream = [Quantity(float(i), Unit([0, 1, -1])) for i in range(10**4)]
+    return lambda: encode_many(stream)
+
+
+def _particles(n: int, forces) -> ParticleSystem:
+    rng = np.random.default_rng(0)
+    positions = VectorArray(rng.random((n, 3)), Unit([0, 1]))
+    velocities = VectorArray(np.zeros((n, 3)), Unit([0, 1, -1]))
+    return ParticleSystem(positions, velocities, Quantity(1.0, Unit([1])), forces)
+
+
+@case("particles verlet gravity [10000]")
+def particles_gravity():
+    system = _particles(10**4, [UniformGravity()])
+    return lambda: system.run(Quantity(1e-3, Unit([0, 0, 1])), 10)
+
+
+@case("particles verlet coulomb [500]")
+def particles_coulomb():
+    charges = QuantityArray(np.full(500, 1e-9), Unit([0, 0, 1, 0, 1]))
+    system = _particles(500, [Coulomb(charges)])
+    return lambda: system.run(Quantity(1e-6, Unit([0, 0, 1])), 1)
+
+
+def _quantity_array_mul(n: int):
+    rng = np.random.default_rng(0)
+    masses = QuantityArray(rng.random(n), Unit([1]))
+    accelerations = QuantityArray(rng.random(n), Unit([0, 1, -2]))
+    return lambda: masses * accelerations
+
+
+def _vector_arrays(n: int) -> tuple[VectorArray, VectorArray]:
+    rng = np.random.default_rng(0)
+    positions = VectorArray(rng.random((n, 3)), Unit([0, 1]))
+    forces = VectorArray(rng.random((n, 3)), Unit([1, 1, -2]))
+    return positions, forces
+
+
+def _vector_array_cross(n: int):
+    positions, forces = _vector_arrays(n)
+    return lambda: positions.cross(forces)
+
+
+def _vector_array_angle(n: int):
+    positions, forces = _vector_arrays(n)
+    return lambda: positions.angle(forces)
+
+
+def _coulomb_eager(n: int):
+    distances = QuantityArray(np.random.default_rng(0).random(n) + 1, Unit([0, 1]))
+    charge = Quantity(1e-9, Unit([0, 0, 1, 0, 1]))
+    return lambda: 8.99e9 * charge * charge / distances**2
+
+
+def _coulomb_lazy(n: int):
+    distances = QuantityArray(np.random.default_rng(0).random(n) + 1, Unit([0, 1]))
+    charge = Quantity(1e-9, Unit([0, 0, 1, 0, 1]))
+    return lambda: (8.99e9 * charge * charge / lazy(distances) ** 2).evaluate()
+
+
+BATCHED = {
+    "quantity array mul": _quantity_array_mul,
+    "vector array cross": _vector_array_cross,
+    "vector array angle": _vector_array_angle,
+    "coulomb eager": _coulomb_eager,
+    "coulomb lazy": _coulomb_lazy,
+}
+
+
+def batched_cases(sizes) -> dict:
+    """setups of the cases operating on whole arrays, one per size"""
+    return {
+        f"{name} [{n}]": partial(setup, n)
+        for n in sizes
+        for name, setup in BATCHED.items()
+    }
+
+
+def measure(function, repeats: int = 5) -> float:
+    """best time in seconds of a single call of function"""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeats, number)) / number
+
+
+def run(quick: bool = False, pattern: str = "") -> dict[str, float]:
+    """run all cases whose name contains pattern, return seconds per operation by case name"""
+    setups = dict(CASES)
+    setups.update(batched_cases(QUICK_SIZES if quick else SIZES))
+    repeats = 3 if quick else 5
+    results = {}
+    for name, setup in setups.items():
+        if pattern in name:
+            with unchecked() if name in UNCHECKED else nullcontext():
+                results[name] = measure(setup(), repeats) / OPERATIONS.get(name, 1)
+    if pattern in "import constants":
+        results["import constants"] = time_import(
+            "import constants", repeats
+        ) - time_import("pass", repeats)
+    return results
@@ -1,4 +1,71 @@
-from .unit import Unit, NO_UNIT
+from importlib import import_module
+
+from .unit import Unit, NO_UNIT, _env_flag
 from .quantity import Quantity
+from .quantity_array import QuantityArray
 from .vector import Vector
-from .errors import IncompatibleUnitsError
+from .vector_array import VectorArray
+from .scaled import ScaledUnit, convert, conversion_factor
+from .matrix import DimensionalMatrix
+from .tensor import Tensor, TensorArray
+from .rotation import Rotation, RotationArray
+from .checked import CheckedFunction, unit_checked
+from .mode import checked, unchecked, set_checks, checks_enabled
+from .errors import IncompatibleUnitsError, DimensionConflictError
+
+# submodules imported on first use of their names, so that importing classes stays cheap
+_LAZY = {
+    "UncertainQuantity": "uncertain",
+    "UncertainVector": "uncertain",
+    "monte_carlo": "uncertain",
+    "propagate": "uncertain",
+    "parallel_map": "parallel",
+    "Expression": "lazy",
+    "lazy": "lazy",
+    "instrument": "instrument",
+}
+
+
+__all__ = [
+    "Unit",
+    "NO_UNIT",
+    "Quantity",
+    "QuantityArray",
+    "Vector",
+    "VectorArray",
+    "ScaledUnit",
+    "convert",
+    "conversion_factor",
+    "DimensionalMatrix",
+    "Tensor",
+    "TensorArray",
+    "Rotation",
+    "RotationArray",
+    "CheckedFunction",
+    "unit_checked",
+    "checked",
+    "unchecked",
+    "set_checks",
+    "checks_enabled",
+    "IncompatibleUnitsError",
+    "DimensionConflictError",
+    *_LAZY,
+]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+    # importing a submodule binds its name here, e.g. lazy, so bind the attribute afterwards
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+# the environment variable has to take effect on import, see classes.instrument
+if _env_flag("PHYSICS_UNITS_INSTRUMENT"):
+    __getattr__("instrument")
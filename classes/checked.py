@@ -0,0 +1,159 @@
+from functools import update_wrapper
+
+import numpy as np
+
+from .quantity import Quantity
+from .quantity_array import QuantityArray
+from .unit import Unit, NO_UNIT
+from .vector import Vector
+from .vector_array import VectorArray
+
+
+# plain arguments that enter the cache key by value, as they may decide the unit, e.g. x**n
+_HASHABLE = (bool, int, float, complex, str, type(None))
+
+
+class _Uncacheable(Exception):
+    """raised for plain arguments that cannot be part of a cache key"""
+
+
+def _signature(value):
+    """key describing the unit-carrying type of an argument, or a plain argument by value"""
+    if isinstance(value, (Quantity, QuantityArray, Vector, VectorArray)):
+        return type(value), value.unit
+    if type(value) in _HASHABLE:
+        return type(value), value
+    raise _Uncacheable
+
+
+def _key(args, kwargs) -> tuple | None:
+    """cache key of the arguments, None if a plain argument is not hashable"""
+    try:
+        return tuple(_signature(a) for a in args) + tuple(
+            (k, _signature(v)) for k, v in sorted(kwargs.items())
+        )
+    except _Uncacheable:
+        return None
+
+
+def _strip(value, copy: bool = False):
+    """value of an argument without its unit, with copies of arrays if copy"""
+    if isinstance(value, (Quantity, QuantityArray)):
+        return np.copy(value.value) if copy else value.value
+    if isinstance(value, Vector):
+        return Vector(value._x, value._y, value._z)
+    if isinstance(value, VectorArray):
+        return VectorArray(np.copy(value.value) if copy else value.value)
+    return value
+
+
+def _template(result):
+    """record type and unit of a result so they can be reattached to raw values"""
+    if isinstance(result, tuple):
+        return tuple, tuple(_template(r) for r in result)
+    if isinstance(result, (Quantity, QuantityArray)):
+        return Quantity, result.unit
+    if isinstance(result, (Vector, VectorArray)):
+        return type(result), result.unit
+    return None, None
+
+
+def _attach(result, template):
+    """reattach the recorded units to a result computed on raw values"""
+    kind, unit = template
+    if kind is tuple:
+        return tuple(_attach(r, t) for r, t in zip(result, unit))
+    if kind is Quantity:
+        value = (
+            result.value if isinstance(result, (Quantity, QuantityArray)) else result
+        )
+        if np.ndim(value) == 0:
+            return Quantity(value, unit)
+        return QuantityArray(value, unit)
+    if kind is Vector:
+        return Vector(result._x, result._y, result._z, unit)
+    if kind is VectorArray:
+        return VectorArray(result.value, unit)
+    return result
+
+
+class CheckedFunction:
+    """
+    Function whose dimensions are checked once per signature of argument units.
+
+    The first call with a new combination of argument units and plain arguments runs the function
+    on the quantities themselves, so every operation is checked by Unit and an
+    IncompatibleUnitsError is raised on mismatch. The unit of the result is recorded, and later
+    calls with the same signature run the function on the raw values and reattach that unit.
+    Plain numbers and strings are part of the signature by value; calls with other plain
+    arguments, such as lists or arrays, are not cached and always run with units.
+
+    Functions combining their arguments with unit-carrying values of their own, e.g. t + 1 s,
+    fail on raw values. With probe, the first call of every signature also runs the function on
+    copies of the raw values, and signatures for which that fails keep running with units.
+    Side effects of the function then happen twice on that first call.
+    """
+
+    def __init__(self, function, probe: bool = False) -> None:
+        self.function = function
+        self.probe = probe
+        self.signatures: dict[tuple, tuple] = {}
+        self._with_units: set[tuple] = set()
+        update_wrapper(self, function)
+
+    def __call__(self, *args, **kwargs):
+        key = _key(args, kwargs)
+        if key is None:
+            return self.function(*args, **kwargs)
+        template = self.signatures.get(key)
+        if template is None:
+            result = self.function(*args, **kwargs)
+            self.signatures[key] = _template(result)
+            if self.probe:
+                self._probe(key, args, kwargs)
+            return result
+        if key in self._with_units:
+            return self.function(*args, **kwargs)
+        result = self.function(
+            *(_strip(a) for a in args),
+            **{k: _strip(v) for k, v in kwargs.items()},
+        )
+        return _attach(result, template)
+
+    def _probe(self, key: tuple, args: tuple, kwargs: dict) -> None:
+        """decide once whether calls with these units can run on raw values"""
+        try:
+            self.function(
+                *(_strip(a, True) for a in args),
+                **{k: _strip(v, True) for k, v in kwargs.items()},
+            )
+        except Exception:
+            # e.g. the function mixes its arguments with unit-carrying values of its own
+            self._with_units.add(key)
+
+    def check(self, *units: Unit, **kwunits: Unit) -> Unit | tuple | None:
+        """
+        Check the function for scalar arguments of the given units without real data and return
+        the unit of the result. The function is evaluated once with all values set to 1.
+        """
+        args = [Quantity(1.0, u) for u in units]
+        kwargs = {k: Quantity(1.0, u) for k, u in kwunits.items()}
+        self(*args, **kwargs)
+        return _result_units(self.signatures[_key(args, kwargs)])
+
+
+def _result_units(template):
+    kind, unit = template
+    if kind is tuple:
+        return tuple(_result_units(t) for t in unit)
+    return NO_UNIT if unit is None else unit
+
+
+def unit_checked(function=None, *, probe: bool = False):
+    """
+    Decorator checking the dimensions of a function once per signature of argument units,
+    used as @unit_checked or @unit_checked(probe=True), see CheckedFunction
+    """
+    if function is None:
+        return lambda function: CheckedFunction(function, probe)
+    return CheckedFunction(function, probe)
@@ -2,3 +2,13 @@ class IncompatibleUnitsError(Exception):
     def __init__(self, operator: str, unit1: str, unit2: str, *args: object) -> None:
         self.message = f"Incompatible Units: cannot {operator} {unit1} and {unit2}"
         super().__init__(self.message, *args)
+
+
+class DimensionConflictError(Exception):
+    def __init__(
+        self, name: str, definition1: str, definition2: str, *args: object
+    ) -> None:
+        self.message = (
+            f"Conflicting definitions of {name}: {definition1} and {definition2}"
+        )
+        super().__init__(self.message, *args)
@@ -0,0 +1,171 @@
+import atexit
+import sys
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from time import perf_counter_ns
+
+from . import quantity, vector
+from .errors import IncompatibleUnitsError
+from .quantity import Quantity
+from .quantity_array import QuantityArray
+from .unit import Unit, _env_flag
+from .vector import Vector
+from .vector_array import VectorArray
+
+
+ENV_VARIABLE = "PHYSICS_UNITS_INSTRUMENT"
+_PACKAGE = str(Path(__file__).resolve().parent)
+
+# (class or module, function, event) of every instrumented function
+_TARGETS = [
+    (Unit, "__new__", "unit construction"),
+    (Unit, "__add__", "unit add"),
+    (Unit, "__sub__", "unit subtract"),
+    (Unit, "__mul__", "unit multiply"),
+    (Unit, "__rmul__", "unit multiply"),
+    (Unit, "__truediv__", "unit divide"),
+    (Unit, "__rtruediv__", "unit divide"),
+    (Unit, "__pow__", "unit power"),
+    (Unit, "invert", "unit power"),
+    (Unit, "get_name", "dimension lookup"),
+    (Unit, "check_dimensions", "dimension lookup"),
+    (Unit, "from_dict", "dimension lookup"),
+    (IncompatibleUnitsError, "__init__", "incompatible units"),
+    (Quantity, "__init__", "quantity construction"),
+    (quantity, "_new", "quantity construction"),
+    (QuantityArray, "__init__", "quantity array construction"),
+    (Vector, "__init__", "vector construction"),
+    (vector, "_new", "vector construction"),
+    (VectorArray, "__init__", "vector array construction"),
+]
+_originals: dict[tuple[object, str], object] = {}
+_active: list["Profile"] = []
+
+
+class Profile:
+    """Counts and inclusive times of instrumented operations by event and call site"""
+
+    def __init__(self) -> None:
+        self.stats: dict[tuple[str, str], list[int]] = {}
+
+    def record(self, event: str, site: str, nanoseconds: int) -> None:
+        entry = self.stats.get((event, site))
+        if entry is None:
+            self.stats[(event, site)] = [1, nanoseconds]
+        else:
+            entry[0] += 1
+            entry[1] += nanoseconds
+
+    def summary(self, by_site: bool = True) -> dict:
+        """
+        by_site: {event: {site: {"count": n, "seconds": t}}}
+        otherwise: {event: {"count": n, "seconds": t}}
+        """
+        result = {}
+        for (event, site), (count, ns) in sorted(self.stats.items()):
+            if by_site:
+                result.setdefault(event, {})[site] = {
+                    "count": count,
+                    "seconds": ns / 1e9,
+                }
+            else:
+                total = result.setdefault(event, {"count": 0, "seconds": 0.0})
+                total["count"] += count
+                total["seconds"] += ns / 1e9
+        return result
+
+    def table(self, by_site: bool = True) -> str:
+        """summary as a text table, most expensive entries first"""
+        rows = []
+        if by_site:
+            for (event, site), (count, ns) in self.stats.items():
+                rows.append((event, site, count, ns / 1e9))
+        else:
+            for event, total in self.summary(by_site=False).items():
+                rows.append((event, "", total["count"], total["seconds"]))
+        rows.sort(key=lambda row: row[3], reverse=True)
+        lines = [f"{'event':<28} {'count':>10} {'seconds':>12}  site"]
+        for event, site, count, seconds in rows:
+            lines.append(f"{event:<28} {count:>10} {seconds:>12.6f}  {site}")
+        return "\n".join(lines)
+
+
+def _call_site() -> str:
+    """file and line of the innermost caller outside of this package"""
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE):
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+def _wrap(function, event: str):
+    @wraps(function)
+    def instrumented(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            site = _call_site()
+            for profile in _active:
+                profile.record(event, site, elapsed)
+
+    return instrumented
+
+
+def _patch() -> None:
+    for cls, name, event in _TARGETS:
+        original = cls.__dict__[name]
+        _originals[(cls, name)] = original
+        if isinstance(original, (staticmethod, classmethod)):
+            wrapped = type(original)(_wrap(original.__func__, event))
+        else:
+            wrapped = _wrap(original, event)
+        setattr(cls, name, wrapped)
+
+
+def _unpatch() -> None:
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+
+
+def start() -> Profile:
+    """start recording into a new profile; the methods are only patched while a profile is active"""
+    profile = Profile()
+    if not _active:
+        _patch()
+    _active.append(profile)
+    return profile
+
+
+def stop(profile: Profile) -> None:
+    _active.remove(profile)
+    if not _active:
+        _unpatch()
+
+
+@contextmanager
+def instrument():
+    """
+    Record counts and times of unit arithmetic, dimension lookups, unit errors and constructions
+    of quantities and vectors within the block. Times are inclusive of nested instrumented calls.
+    Outside of the block the original methods are in place, so there is no overhead.
+    """
+    profile = start()
+    try:
+        yield profile
+    finally:
+        stop(profile)
+
+
+def _report_at_exit(profile: Profile) -> None:
+    stop(profile)
+    print(profile.table(), file=sys.stderr)
+
+
+if _env_flag(ENV_VARIABLE):
+    atexit.register(_report_at_exit, start())
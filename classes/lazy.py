@@ -0,0 +1,254 @@
+"""
+Lazy evaluation of formulas over quantities.
+
+Operators on Expression objects build a graph instead of computing values. Units are resolved and
+checked while the graph is built. Subexpressions that only depend on scalars, such as products of
+constants, are computed right away. Nodes are shared: building the same operation on the same
+operands twice gives the same node, so common subexpressions are evaluated once.
+
+evaluate walks the arrays in blocks with np.nditer and runs the whole formula on each block, using
+scratch buffers of the block size. No temporary array of the full size is created.
+"""
+from weakref import WeakValueDictionary
+
+import numpy as np
+
+from .quantity import Quantity
+from .quantity_array import QuantityArray, _wrap
+from .unit import Unit, NO_UNIT
+
+
+BLOCK = 4096
+
+_FUNCTIONS = {
+    "add": np.add,
+    "subtract": np.subtract,
+    "multiply": np.multiply,
+    "divide": np.true_divide,
+    "power": np.power,
+    "negative": np.negative,
+    "absolute": np.absolute,
+}
+# ufuncs that need and give dimensionless values
+_DIMENSIONLESS = {np.exp, np.log, np.log10, np.sin, np.cos, np.tan, np.arctan}
+_SYMBOLS = {"add": "+", "subtract": "-", "multiply": "*", "divide": "/", "power": "**"}
+
+# every node by its operation and the identities of its operands
+_nodes = WeakValueDictionary()
+
+
+class Expression:
+    """Node of a lazily evaluated formula with a unit known at build time"""
+
+    __slots__ = ("op", "args", "unit", "value", "name", "__weakref__")
+    # operators with arrays and quantities build nodes instead of being run by numpy
+    __array_ufunc__ = None
+
+    def __init__(
+        self, op: str, args: tuple, unit: Unit, value=None, name: str | None = None
+    ) -> None:
+        self.op = op
+        self.args = args
+        self.unit = unit
+        self.value = value
+        self.name = name
+
+    @property
+    def is_constant(self) -> bool:
+        return self.op == "constant"
+
+    def __str__(self) -> str:
+        if self.name:
+            return self.name
+        if self.op in ("constant", "array"):
+            return repr(self.value)
+        if self.op in _SYMBOLS:
+            left, right = self.args
+            return f"({left} {_SYMBOLS[self.op]} {right})"
+        return f"{self.op}({', '.join(str(arg) for arg in self.args)})"
+
+    def __repr__(self) -> str:
+        return f"Expression({str(self)!r}, {str(self.unit)!r})"
+
+    def __add__(self, other) -> "Expression":
+        other = lazy(other)
+        return _node("add", (self, other), self.unit + other.unit)
+
+    def __radd__(self, other) -> "Expression":
+        other = lazy(other)
+        return _node("add", (other, self), other.unit + self.unit)
+
+    def __sub__(self, other) -> "Expression":
+        other = lazy(other)
+        return _node("subtract", (self, other), self.unit - other.unit)
+
+    def __rsub__(self, other) -> "Expression":
+        other = lazy(other)
+        return _node("subtract", (other, self), other.unit - self.unit)
+
+    def __mul__(self, other) -> "Expression":
+        other = lazy(other)
+        return _node("multiply", (self, other), self.unit * other.unit)
+
+    def __rmul__(self, other) -> "Expression":
+        other = lazy(other)
+        return _node("multiply", (other, self), other.unit * self.unit)
+
+    def __truediv__(self, other) -> "Expression":
+        other = lazy(other)
+        return _node("divide", (self, other), self.unit / other.unit)
+
+    def __rtruediv__(self, other) -> "Expression":
+        other = lazy(other)
+        return _node("divide", (other, self), other.unit / self.unit)
+
+    def __pow__(self, exponent: int | float) -> "Expression":
+        if isinstance(exponent, Expression) or np.ndim(exponent) != 0:
+            raise TypeError("exponent must be a dimensionless scalar")
+        return _node(
+            "power", (self, _constant(exponent, NO_UNIT)), self.unit**exponent
+        )
+
+    def __neg__(self) -> "Expression":
+        return _node("negative", (self,), self.unit)
+
+    def __abs__(self) -> "Expression":
+        return _node("absolute", (self,), self.unit)
+
+    def sqrt(self) -> "Expression":
+        return self**0.5
+
+    def apply(self, ufunc: np.ufunc) -> "Expression":
+        """apply a ufunc of dimensionless values like np.exp or np.sin"""
+        if ufunc not in _DIMENSIONLESS:
+            raise ValueError(f"Unsupported function: {ufunc.__name__}")
+        if Unit.checks and self.unit is not NO_UNIT:
+            raise TypeError(f"{ufunc.__name__} requires a dimensionless argument")
+        return _node(ufunc.__name__, (self,), NO_UNIT, ufunc)
+
+    def evaluate(self, block: int = BLOCK):
+        """compute the value, giving a Quantity, a QuantityArray or for no unit a number or ndarray"""
+        if self.op in ("constant", "array"):
+            return _wrap(self.value, self.unit)
+        return _wrap(_run(self, block), self.unit)
+
+
+def _shared(key: tuple, op: str, args: tuple, unit: Unit, value=None, name=None):
+    """the node stored under key, created if there is none"""
+    node = _nodes.get(key)
+    if node is None:
+        node = _nodes.setdefault(key, Expression(op, args, unit, value, name))
+    return node
+
+
+def _constant(value, unit: Unit, name: str | None = None) -> Expression:
+    # the type keeps 2 and 2.0 apart, which are equal as keys
+    key = ("constant", type(value), value, unit, name)
+    return _shared(key, "constant", (), unit, value, name)
+
+
+def _fold(function, args: tuple):
+    """value of function on constants, computed as in evaluate on at least float precision"""
+    values = (np.asarray(arg.value, np.result_type(float, arg.value)) for arg in args)
+    return function(*values).item()
+
+
+def _named(node: Expression, name: str) -> Expression:
+    """node labelled name; named nodes are shared by name, so naming never renames others"""
+    if node.op == "constant":
+        return _constant(node.value, node.unit, name)
+    if node.op == "array":
+        key = ("array", id(node.value), node.unit, name)
+    else:
+        key = ("named", name, node.op, *(id(arg) for arg in node.args))
+    return _shared(key, node.op, node.args, node.unit, node.value, name)
+
+
+def lazy(value, name: str | None = None) -> Expression:
+    """expression for a Quantity, QuantityArray, ndarray or number, labelled name if given"""
+    if isinstance(value, Expression):
+        node = value
+    else:
+        if isinstance(value, (Quantity, QuantityArray)):
+            raw, unit = value.value, value.unit
+        else:
+            raw, unit = value, NO_UNIT
+        if np.ndim(raw) == 0:
+            raw = np.asarray(raw)[()] if hasattr(raw, "ndim") else raw
+            node = _constant(raw, unit)
+        else:
+            raw = np.asarray(raw)
+            node = _shared(("array", id(raw), unit, None), "array", (), unit, raw)
+    if name:
+        node = _named(node, name)
+    return node
+
+
+def _node(op: str, args: tuple, unit: Unit, function=None) -> Expression:
+    """shared node for op on args; if all args are constants the value is computed right away"""
+    function = function or _FUNCTIONS[op]
+    if all(arg.is_constant for arg in args):
+        return _constant(_fold(function, args), unit)
+    return _shared((op, *(id(arg) for arg in args)), op, args, unit, function)
+
+
+def _compile(root: Expression) -> tuple[list, list]:
+    """
+    arrays and instructions of the graph in evaluation order; an instruction is the ufunc and its
+    operands, each given as ("input", i), ("register", i) or ("constant", value)
+    """
+    arrays, slots, program = [], {}, []
+
+    def operand(node: Expression) -> tuple:
+        if node.op == "constant":
+            return ("constant", node.value)
+        if id(node) not in slots:
+            if node.op == "array":
+                slots[id(node)] = ("input", len(arrays))
+                arrays.append(node.value)
+            else:
+                operands = [operand(arg) for arg in node.args]
+                slots[id(node)] = ("register", len(program))
+                program.append((node.value, operands))
+        return slots[id(node)]
+
+    operand(root)
+    return arrays, program
+
+
+def _run(root: Expression, block: int) -> np.ndarray:
+    arrays, program = _compile(root)
+    constants = [
+        value
+        for _, operands in program
+        for kind, value in operands
+        if kind == "constant"
+    ]
+    dtype = np.result_type(float, *arrays, *constants)
+    iterator = np.nditer(
+        arrays + [None],
+        flags=["external_loop", "buffered", "zerosize_ok"],
+        op_flags=[["readonly"]] * len(arrays) + [["writeonly", "allocate"]],
+        op_dtypes=[dtype] * (len(arrays) + 1),
+        buffersize=block,
+    )
+    registers = [np.empty(block, dtype) for _ in program]
+    last = len(program) - 1
+    with iterator:
+        for chunk in iterator:
+            inputs, out = chunk[:-1], chunk[-1]
+            size = len(out)
+            for i, (function, operands) in enumerate(program):
+                values = []
+                for kind, value in operands:
+                    if kind == "input":
+                        values.append(inputs[value])
+                    elif kind == "register":
+                        values.append(registers[value][:size])
+                    else:
+                        values.append(value)
+                function(*values, out=out if i == last else registers[i][:size])
+        result = iterator.operands[-1]
+    if result.ndim == 0:
+        return result[()]
+    return result
@@ -0,0 +1,164 @@
+import numpy as np
+
+from .quantity import Quantity
+from .unit import Unit, IncompatibleUnitsError, NO_UNIT
+
+
+def _units(units, length: int) -> tuple[Unit, ...]:
+    """tuple of Units from Units or dimension names, a single one is repeated"""
+    if units is None:
+        units = NO_UNIT
+    if isinstance(units, (Unit, str)):
+        units = [units] * length
+    units = tuple(Unit.from_dict(u) if type(u) == str else u for u in units)
+    if len(units) != length:
+        raise ValueError(f"expected {length} units, got {len(units)}")
+    return units
+
+
+def _common_ratio(units1, units2, operator: str) -> Unit:
+    """the unit u with units2[i] == u * units1[i] for all i"""
+    ratio = units2[0] / units1[0] if units1 else NO_UNIT
+    if Unit.checks:
+        for unit1, unit2 in zip(units1, units2):
+            if unit2 / unit1 is not ratio:
+                raise IncompatibleUnitsError(operator, str(unit1), str(unit2))
+    return ratio
+
+
+class DimensionalMatrix:
+    """Matrix of floats whose element (i, j) has the unit rows[i] / columns[j]
+
+    Storing one unit per row and per column covers the matrices of linear systems with mixed
+    units, and lets every operation derive and check the units in O(rows + columns).
+    A vector of mixed units is a matrix with a single, dimensionless column.
+    """
+
+    def __init__(self, values, rows=None, columns=None) -> None:
+        """
+        values: 2D array-like of values in SI units
+        rows: units of the rows, as Units or dimension names; a single one applies to all rows
+        columns: units of the columns, as for rows
+        """
+        self.value = np.asarray(values, dtype=float)
+        if self.value.ndim != 2:
+            raise ValueError("values must be two-dimensional")
+        self.rows = _units(rows, self.value.shape[0])
+        self.columns = _units(columns, self.value.shape[1])
+
+    @classmethod
+    def vector(cls, quantities) -> "DimensionalMatrix":
+        """column vector from a sequence of Quantities or numbers"""
+        values = [getattr(q, "value", q) for q in quantities]
+        units = [getattr(q, "unit", NO_UNIT) for q in quantities]
+        return cls(np.reshape(values, (-1, 1)), units, NO_UNIT)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.value.shape
+
+    def unit(self, row: int, column: int) -> Unit:
+        return self.rows[row] / self.columns[column]
+
+    def __getitem__(self, key: tuple[int, int]) -> Quantity:
+        row, column = key
+        return Quantity(self.value[row, column], self.unit(row, column))
+
+    def column(self, index: int = 0) -> list:
+        """column as list of Quantities"""
+        return [self[row, index] for row in range(self.shape[0])]
+
+    def __str__(self) -> str:
+        rows = " ".join(str(u) or "1" for u in self.rows)
+        columns = " ".join(str(u) or "1" for u in self.columns)
+        return f"{self.value}\nrows: {rows}\ncolumns: {columns}"
+
+    def __repr__(self) -> str:
+        return f"DimensionalMatrix({self.value!r}, {self.rows}, {self.columns})"
+
+    @property
+    def T(self) -> "DimensionalMatrix":
+        return self.transpose()
+
+    def transpose(self) -> "DimensionalMatrix":
+        return DimensionalMatrix(
+            self.value.T,
+            [u.invert() for u in self.columns],
+            [u.invert() for u in self.rows],
+        )
+
+    def _same_units(self, other: "DimensionalMatrix", operator: str) -> None:
+        if self.shape != other.shape:
+            raise ValueError(
+                f"cannot {operator} matrices of shape {self.shape} and {other.shape}"
+            )
+        # rows[i] / columns[j] agree for all i, j if rows and columns differ by the same unit
+        row_ratio = _common_ratio(self.rows, other.rows, operator)
+        column_ratio = _common_ratio(self.columns, other.columns, operator)
+        if Unit.checks and row_ratio is not column_ratio:
+            raise IncompatibleUnitsError(
+                operator, str(self.unit(0, 0)), str(other.unit(0, 0))
+            )
+
+    def __add__(self, other: "DimensionalMatrix") -> "DimensionalMatrix":
+        self._same_units(other, "add")
+        return DimensionalMatrix(self.value + other.value, self.rows, self.columns)
+
+    def __sub__(self, other: "DimensionalMatrix") -> "DimensionalMatrix":
+        self._same_units(other, "subtract")
+        return DimensionalMatrix(self.value - other.value, self.rows, self.columns)
+
+    def __neg__(self) -> "DimensionalMatrix":
+        return DimensionalMatrix(-self.value, self.rows, self.columns)
+
+    def __mul__(self, number) -> "DimensionalMatrix":
+        if isinstance(number, DimensionalMatrix):
+            return NotImplemented
+        unit = getattr(number, "unit", NO_UNIT)
+        value = getattr(number, "value", number)
+        return DimensionalMatrix(
+            self.value * value, [u * unit for u in self.rows], self.columns
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, number) -> "DimensionalMatrix":
+        if isinstance(number, DimensionalMatrix):
+            return NotImplemented
+        unit = getattr(number, "unit", NO_UNIT)
+        value = getattr(number, "value", number)
+        return DimensionalMatrix(
+            self.value / value, [u / unit for u in self.rows], self.columns
+        )
+
+    def __matmul__(self, other: "DimensionalMatrix") -> "DimensionalMatrix":
+        if not isinstance(other, DimensionalMatrix):
+            return NotImplemented
+        # A[i, j] B[j, k] has the unit rows[i] / columns[j] * other.rows[j] / other.columns[k],
+        # which only sums up if other.rows[j] / columns[j] is the same for all j
+        ratio = _common_ratio(self.columns, other.rows, "multiply")
+        return DimensionalMatrix(
+            self.value @ other.value,
+            [u * ratio for u in self.rows],
+            other.columns,
+        )
+
+    def inverse(self) -> "DimensionalMatrix":
+        return DimensionalMatrix(np.linalg.inv(self.value), self.columns, self.rows)
+
+    def solve(self, b: "DimensionalMatrix") -> "DimensionalMatrix":
+        """x with self @ x == b"""
+        # x has rows columns[j] * ratio, so that self @ x has the rows rows[i] * ratio of b
+        ratio = _common_ratio(self.rows, b.rows, "solve")
+        return DimensionalMatrix(
+            np.linalg.solve(self.value, b.value),
+            [u * ratio for u in self.columns],
+            b.columns,
+        )
+
+    def det(self) -> Quantity:
+        """determinant with the unit product(rows) / product(columns)"""
+        unit = NO_UNIT
+        for row, column in zip(self.rows, self.columns):
+            unit = unit * row / column
+        return Quantity(np.linalg.det(self.value), unit)
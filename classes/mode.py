@@ -0,0 +1,40 @@
+from contextlib import contextmanager
+
+from .unit import Unit
+
+
+def set_checks(enabled: bool) -> None:
+    """
+    Switch unit checks on or off globally.
+
+    Without checks, quantities and vectors still carry their units, but adding, subtracting,
+    comparing and assigning skip the test for matching units, and results are not named.
+    The default can be set with the environment variable PHYSICS_UNITS_UNCHECKED.
+    """
+    Unit.checks = bool(enabled)
+
+
+def checks_enabled() -> bool:
+    return Unit.checks
+
+
+@contextmanager
+def unchecked():
+    """skip unit checks and naming within the block"""
+    previous = Unit.checks
+    Unit.checks = False
+    try:
+        yield
+    finally:
+        Unit.checks = previous
+
+
+@contextmanager
+def checked():
+    """enforce unit checks within the block, e.g. in tests of code running unchecked"""
+    previous = Unit.checks
+    Unit.checks = True
+    try:
+        yield
+    finally:
+        Unit.checks = previous
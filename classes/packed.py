@@ -0,0 +1,61 @@
+"""
+Compact encoding of the seven SI exponents of a unit into a single integer.
+
+Every exponent occupies a signed bit field of FIELD_BITS bits, the exponent of BASE_SI[i] starting
+at bit FIELD_BITS * i. The encoding is linear, so multiplying or dividing two units is adding or
+subtracting their codes, raising a unit to an integer power is multiplying its code, and two
+units are equal if their codes are. This holds as long as all exponents stay within
+[-2**(FIELD_BITS - 1), 2**(FIELD_BITS - 1)); only integer exponents can be packed.
+The codes fit into int64, so arrays of them can serve as dimension columns.
+"""
+import numpy as np
+
+
+FIELD_BITS = 8
+_MASK = (1 << FIELD_BITS) - 1
+_HALF = 1 << (FIELD_BITS - 1)
+
+
+def pack(numbers) -> int:
+    """pack up to seven integer exponents into one integer"""
+    code = 0
+    for i, num in enumerate(numbers):
+        if num != int(num):
+            raise ValueError(f"cannot pack non-integer exponent {num}")
+        if not -_HALF <= num < _HALF:
+            raise ValueError(f"exponent {num} does not fit into {FIELD_BITS} bits")
+        code += int(num) << (FIELD_BITS * i)
+    return code
+
+
+def unpack(code: int) -> tuple[int, ...]:
+    """unpack an integer into the seven exponents"""
+    nums = []
+    for _ in range(7):
+        low = code & _MASK
+        num = low - ((low & _HALF) << 1)
+        nums.append(num)
+        code = (code - num) >> FIELD_BITS
+    return tuple(nums)
+
+
+def pack_array(numbers) -> np.ndarray:
+    """pack an (..., 7) array of integer exponents into an int64 array of codes"""
+    numbers = np.asarray(numbers)
+    if np.any(numbers != np.round(numbers)):
+        raise ValueError("cannot pack non-integer exponents")
+    if np.any((numbers < -_HALF) | (numbers >= _HALF)):
+        raise ValueError(f"exponents do not fit into {FIELD_BITS} bits")
+    shifts = FIELD_BITS * np.arange(numbers.shape[-1], dtype=np.int64)
+    return np.sum(numbers.astype(np.int64) << shifts, axis=-1)
+
+
+def unpack_array(codes) -> np.ndarray:
+    """unpack an int64 array of codes into an (..., 7) array of exponents"""
+    codes = np.asarray(codes, dtype=np.int64)
+    nums = np.empty(codes.shape + (7,), dtype=np.int64)
+    for i in range(7):
+        low = codes & _MASK
+        nums[..., i] = low - ((low & _HALF) << 1)
+        codes = (codes - nums[..., i]) >> FIELD_BITS
+    return nums
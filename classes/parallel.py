@@ -0,0 +1,199 @@
+"""
+Evaluation of functions over QuantityArray and VectorArray inputs on a pool of processes.
+
+The inputs are copied once into shared memory, and every task only receives the names of the
+memory blocks, the range of rows to work on and the units as metadata. Workers view their rows
+without copying, call the function and write the result into a shared output block.
+"""
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import shared_memory
+import os
+
+import numpy as np
+
+from .errors import IncompatibleUnitsError
+from .quantity import Quantity
+from .quantity_array import QuantityArray
+from .unit import Unit, NO_UNIT
+from .vector import Vector
+from .vector_array import VectorArray
+
+
+def _share(shape: tuple, dtype: np.dtype, memories: list) -> np.ndarray:
+    """array of the given shape in a new shared memory block, which is appended to memories"""
+    dtype = np.dtype(dtype)
+    size = max(int(np.prod(shape, dtype=int)) * dtype.itemsize, 1)
+    memory = shared_memory.SharedMemory(create=True, size=size)
+    memories.append(memory)
+    return np.ndarray(shape, dtype, buffer=memory.buf)
+
+
+def _attach(spec: tuple, memories: list) -> np.ndarray:
+    _, name, shape, dtype, _ = spec
+    memory = shared_memory.SharedMemory(name=name)
+    memories.append(memory)
+    return np.ndarray(shape, dtype, buffer=memory.buf)
+
+
+def _parts(result) -> tuple[str, np.ndarray, Unit]:
+    """kind, values and unit of a result"""
+    if isinstance(result, VectorArray):
+        return "vector", result.value, result.unit
+    if isinstance(result, QuantityArray):
+        return "quantity", result.value, result.unit
+    if isinstance(result, (Quantity, Vector)):
+        raise ValueError("function must return one result per input row")
+    return "quantity", np.asarray(result), NO_UNIT
+
+
+def _wrap(kind: str, values: np.ndarray, unit: Unit):
+    if kind == "vector":
+        return VectorArray(values, unit)
+    return QuantityArray(values, unit)
+
+
+def _rows(arg, start: int, stop: int):
+    """rows start:stop of a split argument as the type it was given as"""
+    if isinstance(arg, (QuantityArray, VectorArray)):
+        return _wrap(
+            "vector" if isinstance(arg, VectorArray) else "quantity",
+            arg.value[start:stop],
+            arg.unit,
+        )
+    if isinstance(arg, np.ndarray):
+        return arg[start:stop]
+    return arg
+
+
+def _encode(arg, memories: list):
+    """
+    task argument for arg: arrays are copied into shared memory and described by
+    ("shared", name, shape, dtype, (kind, unit)); Quantity and Vector travel as value and unit
+    """
+    if isinstance(arg, (QuantityArray, VectorArray, np.ndarray)):
+        kind, values, unit = _parts(arg)
+        if isinstance(arg, np.ndarray):
+            kind = "ndarray"
+        shared = _share(values.shape, values.dtype, memories)
+        shared[...] = values
+        return (
+            "shared",
+            memories[-1].name,
+            values.shape,
+            values.dtype.str,
+            (kind, unit),
+        )
+    if isinstance(arg, Quantity):
+        return ("quantity", arg.value, arg.unit)
+    if isinstance(arg, Vector):
+        return ("vector", (arg._x, arg._y, arg._z), arg.unit)
+    return ("value", arg)
+
+
+def _decode(spec: tuple, start: int, stop: int, memories: list):
+    if spec[0] == "shared":
+        kind, unit = spec[4]
+        values = _attach(spec, memories)[start:stop]
+        if kind == "ndarray":
+            return values
+        return _wrap(kind, values, unit)
+    if spec[0] == "quantity":
+        return Quantity(spec[1], spec[2])
+    if spec[0] == "vector":
+        return Vector(*spec[1], spec[2])
+    return spec[1]
+
+
+def _close(memories: list, unlink: bool = False) -> None:
+    for memory in memories:
+        try:
+            memory.close()
+        except BufferError:
+            # a view is still referenced, e.g. by a traceback; the mapping goes with the process
+            pass
+        if unlink:
+            memory.unlink()
+
+
+def _run_chunk(function, specs: list, output: tuple, bounds: tuple[int, int]) -> Unit:
+    """evaluate function on rows start:stop and write the values to the output block"""
+    start, stop = bounds
+    memories = []
+    try:
+        args = [_decode(spec, start, stop, memories) for spec in specs]
+        _, values, unit = _parts(function(*args))
+        target = _attach(output, memories)[start:stop]
+        if values.shape != target.shape:
+            raise ValueError("function must return one result per input row")
+        target[...] = values
+        del args, values, target
+        return unit
+    finally:
+        _close(memories)
+
+
+def parallel_map(
+    function,
+    *args,
+    chunk_size: int | None = None,
+    executor: Executor | None = None,
+    processes: int | None = None,
+):
+    """
+    Evaluate function row by row over QuantityArray, VectorArray and ndarray arguments on a
+    process pool and return the combined result as QuantityArray, VectorArray or ndarray.
+
+    function: picklable function, i.e. defined at module level, taking chunks of the array
+              arguments and returning one result row per input row; other arguments, including
+              Quantity and Vector, are passed unchanged to every call
+    chunk_size: rows per task; by default the rows are split into four tasks per process
+    executor: pool to reuse across calls; by default a ProcessPoolExecutor is started and shut down
+    processes: number of processes of the default pool
+
+    The unit of the result is determined by calling function on the first row and every chunk
+    must give the same unit.
+    """
+    arrays = [
+        arg for arg in args if isinstance(arg, (QuantityArray, VectorArray, np.ndarray))
+    ]
+    if not arrays:
+        raise ValueError("at least one argument must be an array")
+    length = len(arrays[0])
+    if any(len(array) != length for array in arrays):
+        raise ValueError("array arguments must have the same length")
+    kind, values, unit = _parts(function(*(_rows(arg, 0, 1) for arg in args)))
+    if len(values) != 1:
+        raise ValueError("function must return one result per input row")
+
+    workers = processes or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(-(-length // (4 * workers)), 1)
+    bounds = [
+        (start, min(start + chunk_size, length))
+        for start in range(0, length, chunk_size)
+    ]
+
+    memories = []
+    try:
+        specs = [_encode(arg, memories) for arg in args]
+        shared = _share((length,) + values.shape[1:], values.dtype, memories)
+        output = ("shared", memories[-1].name, shared.shape, shared.dtype.str, None)
+        pool = executor or ProcessPoolExecutor(workers)
+        try:
+            units = list(
+                pool.map(
+                    _run_chunk, repeat(function), repeat(specs), repeat(output), bounds
+                )
+            )
+        finally:
+            if executor is None:
+                pool.shutdown()
+        for chunk_unit in units:
+            if Unit.checks and chunk_unit is not unit:
+                raise IncompatibleUnitsError("combine", str(unit), str(chunk_unit))
+        result = shared.copy()
+        del shared
+    finally:
+        _close(memories, unlink=True)
+    return _wrap(kind, result, unit)
@@ -1,42 +1,82 @@
+from .scaled import ScaledUnit, convert, resolve
 from .unit import Unit, IncompatibleUnitsError, NO_UNIT
 
 
+# marks a name that has not been looked up yet
+_UNNAMED = object()
+_SCALARS = frozenset((int, float, complex))
+
+
 class Quantity:
     """Quantity with value and unit"""
 
+    __slots__ = ("value", "unit", "_name")
+
     def __new__(
         cls,
         value: int | float | complex,
-        unit: Unit | str | None,
+        unit: Unit | ScaledUnit | str | None,
         name: str | None = None,
     ) -> None:
-        if unit == NO_UNIT or unit is None:
+        if unit is NO_UNIT or unit is None:
             return value
+        if type(unit) != Unit:
+            si_unit, scale, _ = resolve(unit)
+            if si_unit is NO_UNIT:
+                return value * scale
         instance = super().__new__(cls)
         return instance
 
     def __init__(
         self,
         value: int | float | complex,
-        unit: Unit | str | None,
+        unit: Unit | ScaledUnit | str | None,
         name: str | None = None,
     ) -> None:
         """
         value: value of the quantity
-        unit: unit of the quantity; if str is given use Unit.from_dict to determine unit; if no unit is given
-              no quantity will be created but instead only the value is returned
+        unit: unit of the quantity; if str is given use Unit.from_dict to determine unit, or if it is no
+              dimension name parse it as a scaled unit like "km" or "mV" and convert value to SI;
+              if no unit is given no quantity will be created but instead only the value is returned
         name: name of the quantity; if None the dictionary will be checked to find a suitable name
+              when the name is first needed
         """
         self.value = value
         if type(unit) == Unit:
             self.unit = unit
-            if name:
-                self.name = name
+            if name or not Unit.checks:
+                self._name = name
+            else:
+                self._name = _UNNAMED
+        else:
+            self.unit, scale, dimension = resolve(unit)
+            if scale != 1.0:
+                self.value = value * scale
+            if dimension:
+                self._name = dimension
             else:
-                self.name = unit.get_name()
-        elif type(unit) == str:
-            self.unit = Unit.from_dict(unit)
-            self.name = unit
+                self._name = name if name or not Unit.checks else _UNNAMED
+
+    @property
+    def name(self) -> str | None:
+        name = self._name
+        if name is _UNNAMED:
+            name = self._name = self.unit.get_name()
+        return name
+
+    @name.setter
+    def name(self, name: str | None) -> None:
+        self._name = name
+
+    def __reduce__(self):
+        """pickle value and unit only; a name that was not given explicitly is looked up again"""
+        if self._name is _UNNAMED or self._name is None:
+            return _restore, (self.value, self.unit)
+        return Quantity, (self.value, self.unit, self._name)
+
+    def to(self, unit: Unit | ScaledUnit | str) -> int | float | complex:
+        """value in the given unit, e.g. km or eV"""
+        return convert(self.value, self.unit, unit)
 
     def __str__(self) -> str:
         s = ""
@@ -45,76 +85,112 @@ class Quantity:
         s += f"{self.value} {str(self.unit)}"
         return s
 
+    def __neg__(self) -> "Quantity":
+        return _new(-self.value, self.unit)
+
     def __add__(self, other: "Quantity") -> "Quantity":
         if type(other) != Quantity:
-            raise TypeError
-        return Quantity(self.value + other.value, self.unit + other.unit)
+            return NotImplemented
+        if not Unit.checks:
+            return _new(self.value + other.value, self.unit)
+        return _new(self.value + other.value, self.unit + other.unit)
 
     def __sub__(self, other: "Quantity") -> "Quantity":
         if type(other) != Quantity:
-            raise TypeError
-        return Quantity(self.value - other.value, self.unit - other.unit)
+            return NotImplemented
+        if not Unit.checks:
+            return _new(self.value - other.value, self.unit)
+        return _new(self.value - other.value, self.unit - other.unit)
 
     def __mul__(self, other) -> "Quantity":
         if isinstance(other, Quantity):
-            return Quantity(self.value * other.value, self.unit * other.unit)
-        elif type(other) in [int, float, complex]:
-            return Quantity(self.value * other, self.unit)
+            return _new(self.value * other.value, self.unit * other.unit)
+        elif type(other) in _SCALARS:
+            return _new(self.value * other, self.unit)
         else:
             return NotImplemented
 
     def __truediv__(self, other) -> "Quantity":
         if isinstance(other, Quantity):
-            return Quantity(self.value / other.value, self.unit / other.unit)
-        return Quantity(self.value / other, self.unit)
+            return _new(self.value / other.value, self.unit / other.unit)
+        elif isinstance(other, (int, float, complex)):
+            return _new(self.value / other, self.unit)
+        else:
+            return NotImplemented
 
     def __rmul__(self, other) -> "Quantity":
         if isinstance(other, Quantity):
-            return Quantity(self.value * other.value, self.unit * other.unit)
-        return Quantity(self.value * other, self.unit)
+            return _new(self.value * other.value, self.unit * other.unit)
+        return _new(self.value * other, self.unit)
 
     def __rtruediv__(self, other) -> "Quantity":
         if isinstance(other, Quantity):
-            return Quantity(other.value / self.value, other.unit / self.unit)
-        return Quantity(other / self.value, self.unit.invert())
+            return _new(other.value / self.value, other.unit / self.unit)
+        return _new(other / self.value, self.unit.invert())
 
     def __eq__(self, other) -> bool:
         if type(other) != Quantity:
+            if hasattr(other, "__array_ufunc__"):
+                return NotImplemented
             raise TypeError
-        if not self.unit == other.unit:
+        if Unit.checks and self.unit is not other.unit:
             raise IncompatibleUnitsError("compare", str(self.unit), str(other.unit))
         return self.value == other.value
 
     def __gt__(self, other) -> bool:
         if type(other) != Quantity:
+            if hasattr(other, "__array_ufunc__"):
+                return NotImplemented
             raise TypeError
-        if not self.unit == other.unit:
+        if Unit.checks and self.unit is not other.unit:
             raise IncompatibleUnitsError("compare", str(self.unit), str(other.unit))
         return self.value > other.value
 
     def __lt__(self, other) -> bool:
         if type(other) != Quantity:
+            if hasattr(other, "__array_ufunc__"):
+                return NotImplemented
             raise TypeError
-        if not self.unit == other.unit:
+        if Unit.checks and self.unit is not other.unit:
             raise IncompatibleUnitsError("compare", str(self.unit), str(other.unit))
         return self.value < other.value
 
     def __ge__(self, other) -> bool:
         if type(other) != Quantity:
+            if hasattr(other, "__array_ufunc__"):
+                return NotImplemented
             raise TypeError
-        if not self.unit == other.unit:
+        if Unit.checks and self.unit is not other.unit:
             raise IncompatibleUnitsError("compare", str(self.unit), str(other.unit))
         return self.value >= other.value
 
     def __le__(self, other) -> bool:
         if type(other) != Quantity:
+            if hasattr(other, "__array_ufunc__"):
+                return NotImplemented
             raise TypeError
-        if not self.unit == other.unit:
+        if Unit.checks and self.unit is not other.unit:
             raise IncompatibleUnitsError("compare", str(self.unit), str(other.unit))
         return self.value <= other.value
 
     def __pow__(self, exponent: int | float) -> "Quantity":
-        return Quantity(self.value**exponent, self.unit**exponent)
+        return _new(self.value**exponent, self.unit**exponent)
 
     def __round__(self, ndigits: int = 0) -> "Quantity":
-        return Quantity(round(self.value, ndigits), self.unit)
+        return _new(round(self.value, ndigits), self.unit)
+
+
+def _new(value, unit: Unit) -> Quantity:
+    """result of trusted arithmetic, skipping the validation and naming of Quantity()"""
+    if unit is NO_UNIT:
+        return value
+    quantity = object.__new__(Quantity)
+    quantity.value = value
+    quantity.unit = unit
+    quantity._name = _UNNAMED if Unit.checks else None
+    return quantity
+
+
+def _restore(value, unit: Unit) -> Quantity:
+    """unpickle a quantity; a stable reference, as classes.instrument replaces _new"""
+    return _new(value, unit)
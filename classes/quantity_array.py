@@ -0,0 +1,244 @@
+import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
+
+from .quantity import Quantity
+from .scaled import ScaledUnit, convert, resolve
+from .unit import Unit, IncompatibleUnitsError, NO_UNIT
+
+
+# ufuncs whose operands must share a unit and whose result keeps it
+_SAME_UNIT = {
+    np.add: "add",
+    np.subtract: "subtract",
+    np.maximum: "compare",
+    np.minimum: "compare",
+    np.fmax: "compare",
+    np.fmin: "compare",
+    np.hypot: "add",
+    np.remainder: "divide",
+    np.fmod: "divide",
+}
+# ufuncs whose operands must share a unit and whose result is a boolean mask
+_COMPARISON = {
+    np.equal,
+    np.not_equal,
+    np.less,
+    np.less_equal,
+    np.greater,
+    np.greater_equal,
+}
+# unary ufuncs that keep the unit of their operand
+_PRESERVE = {
+    np.negative,
+    np.positive,
+    np.absolute,
+    np.fabs,
+    np.rint,
+    np.floor,
+    np.ceil,
+    np.trunc,
+    np.conjugate,
+}
+# unary ufuncs with a dimensionless result
+_UNITLESS = {np.isfinite, np.isinf, np.isnan, np.signbit, np.sign}
+# unary ufuncs that raise the unit to a fixed power
+_POWER = {np.sqrt: 0.5, np.square: 2, np.cbrt: 1 / 3, np.reciprocal: -1}
+
+
+def _unit_of(obj) -> Unit:
+    if isinstance(obj, (QuantityArray, Quantity)):
+        return obj.unit
+    return NO_UNIT
+
+
+def _value_of(obj):
+    if isinstance(obj, QuantityArray):
+        return obj.value
+    if isinstance(obj, Quantity):
+        return obj.value
+    return obj
+
+
+def _wrap(value, unit: Unit):
+    """wrap a raw result, giving a Quantity for scalars and a QuantityArray otherwise"""
+    if np.ndim(value) == 0:
+        return Quantity(value, unit)
+    return QuantityArray(value, unit)
+
+
+class QuantityArray(NDArrayOperatorsMixin):
+    """Array of values sharing a single unit
+
+    Supports the operators of Quantity as well as NumPy ufuncs, slicing and broadcasting.
+    Units are checked once per operation, not once per element.
+    """
+
+    def __new__(
+        cls,
+        values,
+        unit: Unit | ScaledUnit | str | None,
+        name: str | None = None,
+    ) -> "QuantityArray":
+        if unit is None or unit is NO_UNIT:
+            return np.asarray(values)
+        if type(unit) != Unit:
+            si_unit, scale, _ = resolve(unit)
+            if si_unit is NO_UNIT:
+                return np.asarray(values) * scale
+        instance = super().__new__(cls)
+        return instance
+
+    def __init__(
+        self,
+        values,
+        unit: Unit | ScaledUnit | str | None,
+        name: str | None = None,
+    ) -> None:
+        """
+        values: array-like of values
+        unit: unit shared by all values; if str is given use Unit.from_dict to determine unit, or if it
+              is no dimension name parse it as a scaled unit like "mV" and convert values to SI in one
+              multiplication; if no unit is given no array of quantities will be created but instead
+              only the ndarray is returned
+        name: name of the quantity; if None the dictionary will be checked to find a suitable name
+        """
+        self.value = np.asarray(values)
+        if type(unit) == Unit:
+            self.unit = unit
+            if name or not Unit.checks:
+                self.name = name
+            else:
+                self.name = unit.get_name()
+        else:
+            self.unit, scale, dimension = resolve(unit)
+            if scale != 1.0:
+                self.value = self.value * scale
+            if dimension:
+                self.name = dimension
+            elif name or not Unit.checks:
+                self.name = name
+            else:
+                self.name = self.unit.get_name()
+
+    @classmethod
+    def from_quantities(cls, quantities, name: str | None = None) -> "QuantityArray":
+        """Build an array from a sequence of Quantity objects sharing one unit"""
+        quantities = list(quantities)
+        unit = quantities[0].unit
+        for q in quantities:
+            if q.unit != unit:
+                raise IncompatibleUnitsError("stack", str(unit), str(q.unit))
+        return cls([q.value for q in quantities], unit, name)
+
+    def to(self, unit: Unit | ScaledUnit | str) -> np.ndarray:
+        """values in the given unit, e.g. "mV", converted in a single multiplication"""
+        return convert(self.value, self.unit, unit)
+
+    def __str__(self) -> str:
+        s = ""
+        if self.name:
+            s += f"{self.name}: "
+        s += f"{self.value} {str(self.unit)}"
+        return s
+
+    def __repr__(self) -> str:
+        return f"QuantityArray({self.value!r}, {str(self.unit)!r})"
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.value.shape
+
+    @property
+    def ndim(self) -> int:
+        return self.value.ndim
+
+    @property
+    def size(self) -> int:
+        return self.value.size
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.value.dtype
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, key):
+        return _wrap(self.value[key], self.unit)
+
+    def __setitem__(self, key, item) -> None:
+        if Unit.checks and _unit_of(item) != self.unit:
+            raise IncompatibleUnitsError("assign", str(self.unit), str(_unit_of(item)))
+        self.value[key] = _value_of(item)
+
+    def __round__(self, ndigits: int = 0) -> "QuantityArray":
+        return QuantityArray(np.round(self.value, ndigits), self.unit)
+
+    def reshape(self, *shape) -> "QuantityArray":
+        return QuantityArray(self.value.reshape(*shape), self.unit, self.name)
+
+    def copy(self) -> "QuantityArray":
+        return QuantityArray(self.value.copy(), self.unit, self.name)
+
+    def sum(self, axis=None, **kwargs):
+        return _wrap(self.value.sum(axis=axis, **kwargs), self.unit)
+
+    def mean(self, axis=None, **kwargs):
+        return _wrap(self.value.mean(axis=axis, **kwargs), self.unit)
+
+    def std(self, axis=None, **kwargs):
+        return _wrap(self.value.std(axis=axis, **kwargs), self.unit)
+
+    def min(self, axis=None, **kwargs):
+        return _wrap(self.value.min(axis=axis, **kwargs), self.unit)
+
+    def max(self, axis=None, **kwargs):
+        return _wrap(self.value.max(axis=axis, **kwargs), self.unit)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        units = [_unit_of(i) for i in inputs]
+        if method == "__call__":
+            unit = self._result_unit(ufunc, inputs, units)
+        elif method in ("reduce", "accumulate", "reduceat") and ufunc in _SAME_UNIT:
+            unit = units[0]
+        else:
+            return NotImplemented
+        if unit is NotImplemented:
+            return NotImplemented
+
+        out = kwargs.get("out")
+        if out:
+            for o in out:
+                if isinstance(o, QuantityArray) and o.unit != unit:
+                    raise IncompatibleUnitsError("assign", str(unit), str(o.unit))
+            kwargs["out"] = tuple(_value_of(o) for o in out)
+
+        result = getattr(ufunc, method)(*(_value_of(i) for i in inputs), **kwargs)
+        if out:
+            return out[0] if len(out) == 1 else out
+        if ufunc in _COMPARISON or ufunc in _UNITLESS:
+            return result
+        return _wrap(result, unit)
+
+    @staticmethod
+    def _result_unit(ufunc, inputs, units) -> Unit:
+        """determine the unit of a ufunc result, checking the operands once"""
+        if ufunc in _SAME_UNIT or ufunc in _COMPARISON:
+            operator = _SAME_UNIT.get(ufunc, "compare")
+            if Unit.checks and units[0] != units[1]:
+                raise IncompatibleUnitsError(operator, str(units[0]), str(units[1]))
+            return units[0]
+        if ufunc is np.multiply:
+            return units[0] * units[1]
+        if ufunc in (np.divide, np.floor_divide):
+            return units[0] / units[1]
+        if ufunc is np.power:
+            exponent = inputs[1]
+            if units[1] != NO_UNIT or np.ndim(exponent) != 0:
+                raise TypeError("exponent must be a dimensionless scalar")
+            return units[0] ** _value_of(exponent)
+        if ufunc in _PRESERVE or ufunc in _UNITLESS:
+            return units[0]
+        if ufunc in _POWER:
+            return units[0] ** _POWER[ufunc]
+        return NotImplemented
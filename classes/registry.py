@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .errors import DimensionConflictError
+
+
+DIMENSIONS_DIR = Path(__file__).resolve().parent.parent / "dimensions"
+CACHE_DIR = Path(
+    os.environ.get("PHYSICS_UNITS_CACHE", Path.home() / ".cache" / "physics-with-units")
+)
+SUFFIXES = {"json": (".json",), "yaml": (".yaml", ".yml")}
+# compiled registries of this process by cache key
+_compiled: dict[str, dict] = {}
+
+
+def resolve(name: str, filetype: str = "json") -> Path:
+    """path of a dimension file, given as a path or by name inside the dimensions folder"""
+    if filetype not in SUFFIXES:
+        raise TypeError("Invalid file type given, use json or yaml instead.")
+    path = Path(name)
+    if path.suffix in SUFFIXES[filetype] and path.is_file():
+        return path.resolve()
+    for suffix in SUFFIXES[filetype]:
+        path = DIMENSIONS_DIR / f"{name}{suffix}"
+        if path.is_file():
+            return path
+    raise FileNotFoundError(f"No {filetype} dimension file {name} in {DIMENSIONS_DIR}")
+
+
+def _parse(path: Path) -> dict:
+    if path.suffix == ".json":
+        with open(path) as file:
+            return json.load(file)
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError(
+            "Loading yaml dimension files requires PyYAML, install the yaml extra"
+        ) from e
+    with open(path) as file:
+        return yaml.safe_load(file) or {}
+
+
+def compile_files(paths: list[Path]) -> dict:
+    """
+    Merge dimension files into one registry, raising DimensionConflictError if a name is
+    defined with different exponents. The result holds the merged "dimensions" and the
+    reverse "index" from exponent tuples to names.
+    """
+    dimensions = {}
+    origins = {}
+    for path in paths:
+        for name, nums in _parse(path).items():
+            nums = list(nums) + [0] * (7 - len(nums))
+            if name in dimensions and dimensions[name] != nums:
+                raise DimensionConflictError(
+                    name,
+                    f"{dimensions[name]} in {origins[name].name}",
+                    f"{nums} in {path.name}",
+                )
+            dimensions[name] = nums
+            origins[name] = path
+    index = {}
+    for name, nums in dimensions.items():
+        index.setdefault(tuple(nums), []).append(name)
+    return {"dimensions": dimensions, "index": index}
+
+
+def _cache_key(paths: list[Path]) -> str:
+    stats = [(str(p), p.stat().st_mtime_ns, p.stat().st_size) for p in paths]
+    return hashlib.sha256(json.dumps(stats).encode()).hexdigest()
+
+
+def _encode(compiled: dict) -> dict:
+    """registry as JSON data, the index as list of exponents and names"""
+    index = [[list(nums), names] for nums, names in compiled["index"].items()]
+    return {"dimensions": compiled["dimensions"], "index": index}
+
+
+def _number(n) -> int | float:
+    """exponent read from the cache, keeping fractional exponents like 0.5"""
+    n = float(n)
+    return int(n) if n.is_integer() else n
+
+
+def _decode(data: dict) -> dict:
+    dimensions = {
+        str(name): [_number(n) for n in nums]
+        for name, nums in data["dimensions"].items()
+    }
+    index = {
+        tuple(_number(n) for n in nums): [str(n) for n in names]
+        for nums, names in data["index"]
+    }
+    return {"dimensions": dimensions, "index": index}
+
+
+def load(names: list[str], filetype: str = "json") -> dict:
+    """
+    Compiled registry of the given dimension files. Compiled registries are cached in memory
+    and in CACHE_DIR, keyed on the paths, modification times and sizes of the files.
+    """
+    paths = [resolve(name, filetype) for name in names]
+    key = _cache_key(paths)
+    compiled = _compiled.get(key)
+    if compiled is not None:
+        return compiled
+    cache_file = CACHE_DIR / f"{key}.json"
+    try:
+        with open(cache_file) as file:
+            compiled = _decode(json.load(file))
+    except Exception:
+        # missing, unreadable or corrupt cache files are compiled again
+        compiled = compile_files(paths)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            partial = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(partial, "w") as file:
+                json.dump(_encode(compiled), file)
+            os.replace(partial, cache_file)
+        except OSError:
+            pass
+    _compiled[key] = compiled
+    return compiled
@@ -0,0 +1,190 @@
+import numpy as np
+
+from .tensor import Tensor, TensorArray, _Tensors, _tensors, _vectors
+from .vector import Vector
+from .vector_array import VectorArray, _vector_parts
+
+
+def _product(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
+    """Hamilton products of quaternions (w, x, y, z), broadcast over leading axes"""
+    w1, x1, y1, z1 = np.moveaxis(q1, -1, 0)
+    w2, x2, y2, z2 = np.moveaxis(q2, -1, 0)
+    return np.stack(
+        [
+            w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+            w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+            w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+        ],
+        axis=-1,
+    )
+
+
+def _matrix(q: np.ndarray) -> np.ndarray:
+    """rotation matrices of unit quaternions"""
+    w, x, y, z = np.moveaxis(q, -1, 0)
+    m = np.empty(q.shape[:-1] + (3, 3))
+    m[..., 0, 0] = 1 - 2 * (y * y + z * z)
+    m[..., 0, 1] = 2 * (x * y - w * z)
+    m[..., 0, 2] = 2 * (x * z + w * y)
+    m[..., 1, 0] = 2 * (x * y + w * z)
+    m[..., 1, 1] = 1 - 2 * (x * x + z * z)
+    m[..., 1, 2] = 2 * (y * z - w * x)
+    m[..., 2, 0] = 2 * (x * z - w * y)
+    m[..., 2, 1] = 2 * (y * z + w * x)
+    m[..., 2, 2] = 1 - 2 * (x * x + y * y)
+    return m
+
+
+def _from_matrix(m: np.ndarray) -> np.ndarray:
+    """quaternions of rotation matrices, computed from the largest of w, x, y, z for accuracy"""
+    shape = m.shape[:-2]
+    m = m.reshape(-1, 3, 3)
+    trace = np.trace(m, axis1=-2, axis2=-1)
+    diagonal = np.diagonal(m, axis1=-2, axis2=-1)
+    choice = np.argmax(np.concatenate([trace[..., None], diagonal], axis=-1), axis=-1)
+    q = np.empty((len(m), 4))
+    q[..., 0] = 1 + trace
+    q[..., 1] = m[..., 2, 1] - m[..., 1, 2]
+    q[..., 2] = m[..., 0, 2] - m[..., 2, 0]
+    q[..., 3] = m[..., 1, 0] - m[..., 0, 1]
+    for i in range(3):
+        j, k = (i + 1) % 3, (i + 2) % 3
+        rows = choice == i + 1
+        r = m[rows]
+        q[rows, 0] = r[..., k, j] - r[..., j, k]
+        q[rows, i + 1] = 1 + 2 * r[..., i, i] - np.trace(r, axis1=-2, axis2=-1)
+        q[rows, j + 1] = r[..., j, i] + r[..., i, j]
+        q[rows, k + 1] = r[..., k, i] + r[..., i, k]
+    return q.reshape(shape + (4,))
+
+
+def _rotations(q: np.ndarray) -> "Rotation | RotationArray":
+    if q.ndim == 1:
+        return Rotation(q)
+    return RotationArray(q)
+
+
+class _Rotations:
+    """operations shared by Rotation and RotationArray, on unit quaternions of shape (..., 4)"""
+
+    __array_ufunc__ = None
+
+    def __init__(self, quaternion) -> None:
+        q = np.asarray(quaternion, dtype=float)
+        if q.ndim == 0 or q.shape[-1] != 4:
+            raise ValueError("quaternion must have shape (..., 4)")
+        norm = np.sqrt(np.einsum("...i,...i->...", q, q))
+        if np.any(norm == 0):
+            raise ValueError("quaternion must not be zero")
+        self.quaternion = q / norm[..., None]
+
+    @classmethod
+    def from_axis_angle(cls, axis, angle, degs: bool = False):
+        """rotation by angle (radians, or degrees if degs) counterclockwise around axis"""
+        if isinstance(axis, (Vector, VectorArray)):
+            axis, _ = _vector_parts(axis)
+        axis = np.asarray(axis, dtype=float)
+        angle = np.radians(angle) if degs else np.asarray(angle, dtype=float)
+        length = np.sqrt(np.einsum("...i,...i->...", axis, axis))
+        half = angle / 2
+        q = np.concatenate(
+            [
+                np.cos(half)[..., None],
+                (np.sin(half) / length)[..., None] * axis,
+            ],
+            axis=-1,
+        )
+        return cls(q)
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """rotation from orthogonal matrices or a dimensionless Tensor(Array), shape (..., 3, 3)"""
+        if isinstance(matrix, _Tensors):
+            matrix = matrix.value
+        return cls(_from_matrix(np.asarray(matrix, dtype=float)))
+
+    @classmethod
+    def identity(cls):
+        return cls([1.0, 0.0, 0.0, 0.0])
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the batch, without the quaternion axis"""
+        return self.quaternion.shape[:-1]
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """rotation matrices of shape (..., 3, 3)"""
+        return _matrix(self.quaternion)
+
+    def as_tensor(self) -> Tensor | TensorArray:
+        """dimensionless rotation tensor"""
+        return _tensors(self.matrix, None)
+
+    @property
+    def angle(self) -> float | np.ndarray:
+        """rotation angle in radians, between 0 and pi"""
+        q = self.quaternion
+        return 2 * np.arctan2(np.linalg.norm(q[..., 1:], axis=-1), np.abs(q[..., 0]))
+
+    @property
+    def axis(self) -> np.ndarray:
+        """unit rotation axes belonging to angle, the x axis for no rotation"""
+        q = self.quaternion
+        xyz = np.where(q[..., :1] < 0, -q[..., 1:], q[..., 1:])
+        length = np.linalg.norm(xyz, axis=-1)[..., None]
+        return np.where(length > 0, xyz / np.where(length > 0, length, 1.0), [1, 0, 0])
+
+    def inverse(self) -> "Rotation | RotationArray":
+        return _rotations(self.quaternion * [1.0, -1.0, -1.0, -1.0])
+
+    def __mul__(self, other) -> "Rotation | RotationArray":
+        """composition, self * other rotates by other first and then by self"""
+        if not isinstance(other, _Rotations):
+            return NotImplemented
+        return _rotations(_product(self.quaternion, other.quaternion))
+
+    def apply(self, other):
+        """
+        rotate Vectors, VectorArrays, Tensors or TensorArrays; units are kept and batches of
+        rotations and objects are broadcast against each other
+        """
+        matrix = self.matrix
+        if isinstance(other, _Tensors):
+            values = matrix @ other.value @ np.swapaxes(matrix, -1, -2)
+            return _tensors(values, other.unit)
+        values, unit = _vector_parts(other)
+        if matrix.ndim == 2:
+            # one rotation for many vectors is a single matrix product
+            result = values @ matrix.T
+        else:
+            result = (matrix @ values[..., None])[..., 0]
+        return _vectors(result, unit)
+
+    def __str__(self) -> str:
+        return f"rotation {np.array2string(self.quaternion, precision=3)}"
+
+
+class Rotation(_Rotations):
+    """Rotation in 3D stored as a unit quaternion (w, x, y, z)"""
+
+    def __init__(self, quaternion) -> None:
+        """quaternion: array-like (w, x, y, z), normalized to unit length"""
+        super().__init__(quaternion)
+        if self.quaternion.shape != (4,):
+            raise ValueError("quaternion must have shape (4,)")
+
+
+class RotationArray(_Rotations):
+    """Array of rotations stored as one (..., 4) array of unit quaternions"""
+
+    def __init__(self, quaternion) -> None:
+        """quaternion: array-like of shape (..., 4) holding w, x, y and z"""
+        super().__init__(quaternion)
+
+    def __len__(self) -> int:
+        return len(self.quaternion)
+
+    def __getitem__(self, key) -> "Rotation | RotationArray":
+        return _rotations(self.quaternion[key])
@@ -0,0 +1,159 @@
+from functools import lru_cache
+from math import pi
+
+from .unit import Unit, IncompatibleUnitsError, NO_UNIT
+
+
+PREFIXES = {
+    "Y": 1e24,
+    "Z": 1e21,
+    "E": 1e18,
+    "P": 1e15,
+    "T": 1e12,
+    "G": 1e9,
+    "M": 1e6,
+    "k": 1e3,
+    "h": 1e2,
+    "da": 1e1,
+    "d": 1e-1,
+    "c": 1e-2,
+    "m": 1e-3,
+    "u": 1e-6,
+    "µ": 1e-6,
+    "n": 1e-9,
+    "p": 1e-12,
+    "f": 1e-15,
+    "a": 1e-18,
+    "z": 1e-21,
+    "y": 1e-24,
+}
+
+# symbol: (scale, SI exponents); prefixes may be combined with these symbols
+SYMBOLS = {
+    "g": (1e-3, [1]),
+    "m": (1.0, [0, 1]),
+    "s": (1.0, [0, 0, 1]),
+    "K": (1.0, [0, 0, 0, 1]),
+    "A": (1.0, [0, 0, 0, 0, 1]),
+    "mol": (1.0, [0, 0, 0, 0, 0, 1]),
+    "cd": (1.0, [0, 0, 0, 0, 0, 0, 1]),
+    "Hz": (1.0, [0, 0, -1]),
+    "N": (1.0, [1, 1, -2]),
+    "Pa": (1.0, [1, -1, -2]),
+    "J": (1.0, [1, 2, -2]),
+    "W": (1.0, [1, 2, -3]),
+    "C": (1.0, [0, 0, 1, 0, 1]),
+    "V": (1.0, [1, 2, -3, 0, -1]),
+    "F": (1.0, [-1, -2, 4, 0, 2]),
+    "Ohm": (1.0, [1, 2, -3, 0, -2]),
+    "Ω": (1.0, [1, 2, -3, 0, -2]),
+    "S": (1.0, [-1, -2, 3, 0, 2]),
+    "Wb": (1.0, [1, 2, -2, 0, -1]),
+    "T": (1.0, [1, 0, -2, 0, -1]),
+    "H": (1.0, [1, 2, -2, 0, -2]),
+    "eV": (1.602176634e-19, [1, 2, -2]),
+    "bar": (1e5, [1, -1, -2]),
+    "L": (1e-3, [0, 3]),
+    "t": (1e3, [1]),
+    "cal": (4.184, [1, 2, -2]),
+    "rad": (1.0, []),
+}
+# symbol: (scale, SI exponents); these take no prefixes
+UNPREFIXED = {
+    "min": (60.0, [0, 0, 1]),
+    "h": (3600.0, [0, 0, 1]),
+    "d": (86400.0, [0, 0, 1]),
+    "deg": (pi / 180, []),
+    "atm": (101325.0, [1, -1, -2]),
+    "Å": (1e-10, [0, 1]),
+    "au": (1.495978707e11, [0, 1]),
+}
+
+
+class ScaledUnit:
+    """Unit given as a multiple of an SI unit, e.g. km, mA, eV or bar"""
+
+    __slots__ = ("symbol", "scale", "unit")
+
+    def __init__(self, symbol: str, scale: float, unit: Unit) -> None:
+        self.symbol = symbol
+        self.scale = scale
+        self.unit = unit
+
+    def __str__(self) -> str:
+        return self.symbol
+
+    def __repr__(self) -> str:
+        return f"ScaledUnit({self.symbol!r}, {self.scale!r}, {str(self.unit)!r})"
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get(text: str) -> "ScaledUnit":
+        """
+        Parse a unit like "km", "mV", "eV", "km/h" or "kg m s^-2"; symbols are separated by
+        spaces, may carry an exponent after ^, and everything after a / is divided by.
+        """
+        scale, unit = 1.0, NO_UNIT
+        numerator, _, denominator = text.partition("/")
+        for sign, part in ((1, numerator), (-1, denominator)):
+            for token in part.split():
+                symbol, _, exponent = token.partition("^")
+                power = sign * (float(exponent) if exponent else 1)
+                factor, base = _symbol(symbol)
+                scale *= factor**power
+                unit = unit * base**power
+        return ScaledUnit(text, scale, unit)
+
+
+def _symbol(symbol: str) -> tuple[float, Unit]:
+    """scale and unit of a single, possibly prefixed symbol"""
+    for table in (SYMBOLS, UNPREFIXED):
+        if symbol in table:
+            scale, nums = table[symbol]
+            return scale, Unit(nums)
+    for length in (2, 1):
+        prefix, rest = symbol[:length], symbol[length:]
+        if prefix in PREFIXES and rest in SYMBOLS:
+            scale, nums = SYMBOLS[rest]
+            return PREFIXES[prefix] * scale, Unit(nums)
+    raise ValueError(f"Unknown unit: {symbol}")
+
+
+def _scaled(unit: "ScaledUnit | Unit | str") -> ScaledUnit:
+    if type(unit) == ScaledUnit:
+        return unit
+    if type(unit) == Unit:
+        return _si(unit)
+    return ScaledUnit.get(unit)
+
+
+@lru_cache(maxsize=None)
+def _si(unit: Unit) -> ScaledUnit:
+    return ScaledUnit(str(unit), 1.0, unit)
+
+
+@lru_cache(maxsize=1024)
+def conversion_factor(
+    source: "ScaledUnit | Unit | str", target: "ScaledUnit | Unit | str"
+) -> float:
+    """factor converting values from source to target units, computed once per pair"""
+    source, target = _scaled(source), _scaled(target)
+    if source.unit is not target.unit:
+        raise IncompatibleUnitsError("convert", str(source), str(target))
+    return source.scale / target.scale
+
+
+def convert(values, source, target):
+    """convert numbers or arrays from source to target units with a single multiplication"""
+    factor = conversion_factor(source, target)
+    if factor == 1.0:
+        return values
+    return values * factor
+
+
+def resolve(unit: "ScaledUnit | str") -> tuple[Unit, float, str | None]:
+    """SI unit, scale to SI and dimension name of a dimension name or a scaled unit"""
+    if type(unit) == str and unit in Unit.dimensions:
+        return Unit.from_dict(unit), 1.0, unit
+    scaled = _scaled(unit)
+    return scaled.unit, scaled.scale, None
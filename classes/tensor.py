@@ -0,0 +1,225 @@
+import numpy as np
+
+from .quantity import Quantity
+from .quantity_array import QuantityArray, _unit_of, _value_of
+from .scaled import ScaledUnit, resolve
+from .unit import Unit, IncompatibleUnitsError, NO_UNIT
+from . import vector
+from .vector import Vector
+from .vector_array import VectorArray, _vector_parts
+
+
+def _vectors(values: np.ndarray, unit: Unit) -> Vector | VectorArray:
+    """Vector for a single (3,) result, VectorArray otherwise"""
+    if values.ndim == 1:
+        # called through the module, so that classes.instrument sees it
+        return vector._new(*values.tolist(), unit if unit is not NO_UNIT else None)
+    return VectorArray(values, unit)
+
+
+def _tensors(values: np.ndarray, unit: Unit) -> "Tensor | TensorArray":
+    """Tensor for a single (3, 3) result, TensorArray otherwise"""
+    if values.ndim == 2:
+        return Tensor(values, unit)
+    return TensorArray(values, unit)
+
+
+def _quantities(values, unit: Unit) -> Quantity | QuantityArray:
+    if np.ndim(values) == 0:
+        return Quantity(float(values), unit)
+    return QuantityArray(values, unit)
+
+
+class _Tensors:
+    """operations shared by Tensor and TensorArray, on values of shape (..., 3, 3)"""
+
+    __array_ufunc__ = None
+
+    def __init__(
+        self,
+        values,
+        unit: Unit | ScaledUnit | str | None = None,
+        name: str | None = None,
+    ) -> None:
+        self.value = np.asarray(values, dtype=float)
+        if self.value.ndim < 2 or self.value.shape[-2:] != (3, 3):
+            raise ValueError("values must have shape (..., 3, 3)")
+        if type(unit) == Unit:
+            self.unit = unit
+        elif type(unit) == str or type(unit) == ScaledUnit:
+            self.unit, scale, dimension = resolve(unit)
+            if scale != 1.0:
+                self.value = self.value * scale
+            name = name or dimension
+        else:
+            self.unit = NO_UNIT
+        self.name = name
+
+    @classmethod
+    def from_rows(cls, a, b, c, name: str | None = None):
+        """tensor with the given Vectors (or VectorArrays) as rows"""
+        rows = [_vector_parts(v) for v in (a, b, c)]
+        unit = rows[0][1]
+        for _, row_unit in rows:
+            if Unit.checks and row_unit is not unit:
+                raise IncompatibleUnitsError("stack", str(unit), str(row_unit))
+        values = np.stack(np.broadcast_arrays(*(v for v, _ in rows)), axis=-2)
+        return cls(values, unit, name)
+
+    @classmethod
+    def outer(cls, a, b, name: str | None = None):
+        """dyadic product a b^T of two Vectors or VectorArrays"""
+        a_values, a_unit = _vector_parts(a)
+        b_values, b_unit = _vector_parts(b)
+        values = a_values[..., :, None] * b_values[..., None, :]
+        return cls(values, a_unit * b_unit, name)
+
+    @classmethod
+    def identity(cls, unit: Unit | str | None = None, name: str | None = None):
+        return cls(np.eye(3), unit, name)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the batch, without the two component axes"""
+        return self.value.shape[:-2]
+
+    @property
+    def T(self) -> "Tensor | TensorArray":
+        return _tensors(np.swapaxes(self.value, -1, -2), self.unit)
+
+    @property
+    def trace(self) -> Quantity | QuantityArray:
+        return _quantities(np.trace(self.value, axis1=-2, axis2=-1), self.unit)
+
+    def det(self) -> Quantity | QuantityArray:
+        return _quantities(np.linalg.det(self.value), self.unit**3)
+
+    def inverse(self) -> "Tensor | TensorArray":
+        return _tensors(np.linalg.inv(self.value), self.unit.invert())
+
+    def symmetric(self) -> "Tensor | TensorArray":
+        """symmetric part (T + T^T) / 2"""
+        return _tensors((self.value + np.swapaxes(self.value, -1, -2)) / 2, self.unit)
+
+    def principal(self) -> tuple[Quantity | QuantityArray, np.ndarray]:
+        """
+        principal values in ascending order and principal axes as columns of a rotation matrix,
+        of the symmetric part, e.g. principal moments of inertia or principal stresses
+        """
+        values, axes = np.linalg.eigh(self.symmetric().value)
+        return _quantities(values, self.unit), axes
+
+    def __str__(self) -> str:
+        s = ""
+        if self.name:
+            s += f"{self.name}: "
+        s += np.array2string(self.value, precision=2)
+        if self.unit != NO_UNIT:
+            s += f" {str(self.unit)}"
+        return s
+
+    def __neg__(self) -> "Tensor | TensorArray":
+        return _tensors(-self.value, self.unit)
+
+    def __add__(self, other) -> "Tensor | TensorArray":
+        if not isinstance(other, _Tensors):
+            return NotImplemented
+        return _tensors(self.value + other.value, self.unit + other.unit)
+
+    def __sub__(self, other) -> "Tensor | TensorArray":
+        if not isinstance(other, _Tensors):
+            return NotImplemented
+        return _tensors(self.value - other.value, self.unit - other.unit)
+
+    def __mul__(self, number) -> "Tensor | TensorArray":
+        if isinstance(number, (_Tensors, Vector, VectorArray)):
+            return NotImplemented
+        value = _value_of(number)
+        if np.ndim(value) != 0:
+            value = np.asarray(value)[..., None, None]
+        return _tensors(self.value * value, self.unit * _unit_of(number))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, number) -> "Tensor | TensorArray":
+        if isinstance(number, (_Tensors, Vector, VectorArray)):
+            return NotImplemented
+        value = _value_of(number)
+        if np.ndim(value) != 0:
+            value = np.asarray(value)[..., None, None]
+        return _tensors(self.value / value, self.unit / _unit_of(number))
+
+    def __matmul__(self, other):
+        """tensor @ vector gives vectors, tensor @ tensor gives tensors, broadcast over batches"""
+        if isinstance(other, _Tensors):
+            return _tensors(self.value @ other.value, self.unit * other.unit)
+        if not isinstance(other, (Vector, VectorArray)):
+            return NotImplemented
+        values, unit = _vector_parts(other)
+        if self.value.ndim == 2:
+            # one tensor for many vectors is a single matrix product
+            result = values @ self.value.T
+        else:
+            result = (self.value @ values[..., None])[..., 0]
+        return _vectors(result, self.unit * unit)
+
+    def __eq__(self, other) -> bool | np.ndarray:
+        """check for equality, tensor by tensor"""
+        if not isinstance(other, _Tensors):
+            return NotImplemented
+        equal = np.all(self.value == other.value, axis=(-2, -1))
+        return equal & (self.unit == other.unit)
+
+    __hash__ = None
+
+
+class Tensor(_Tensors):
+    """3x3 tensor of rank 2 with a unit, e.g. an inertia or stress tensor"""
+
+    def __init__(
+        self,
+        values,
+        unit: Unit | ScaledUnit | str | None = None,
+        name: str | None = None,
+    ) -> None:
+        """
+        values: array-like of shape (3, 3)
+        unit: unit of all components; if str is given use Unit.from_dict to determine unit
+        name: name of the tensor
+        """
+        super().__init__(values, unit, name)
+        if self.value.shape != (3, 3):
+            raise ValueError("values must have shape (3, 3)")
+
+    def __getitem__(self, key: tuple[int, int]) -> Quantity:
+        row, column = key
+        return Quantity(float(self.value[row, column]), self.unit)
+
+    def row(self, index: int) -> Vector:
+        return _vectors(self.value[index], self.unit)
+
+    def column(self, index: int) -> Vector:
+        return _vectors(self.value[:, index], self.unit)
+
+
+class TensorArray(_Tensors):
+    """Array of 3x3 tensors sharing a single unit, stored as one (..., 3, 3) float array"""
+
+    def __init__(
+        self,
+        values,
+        unit: Unit | ScaledUnit | str | None = None,
+        name: str | None = None,
+    ) -> None:
+        """
+        values: array-like of shape (..., 3, 3)
+        unit: unit shared by all tensors; if str is given use Unit.from_dict to determine unit
+        name: name of the tensors
+        """
+        super().__init__(values, unit, name)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, key) -> "Tensor | TensorArray":
+        return _tensors(self.value[key], self.unit)
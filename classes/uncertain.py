@@ -0,0 +1,401 @@
+"""
+Quantities and vectors with standard deviations.
+
+Uncertainties are propagated to first order assuming independent operands: for f(a, b) the
+standard deviation is sqrt((df/da * std_a)**2 + (df/db * std_b)**2). Only an operand combined with
+itself, as in x * x, is recognized as correlated. Values and standard deviations
+may be numbers or arrays; all formulas are evaluated on whole arrays at once. For nonlinear
+functions or large uncertainties monte_carlo samples the inputs in bulk instead.
+"""
+import numpy as np
+
+from .quantity import Quantity
+from .quantity_array import QuantityArray, _wrap
+from .scaled import ScaledUnit, resolve
+from .unit import Unit, NO_UNIT
+from .vector import Vector
+from .vector_array import VectorArray
+
+
+def _parts(other) -> tuple:
+    """value, standard deviation and unit of any scalar operand; exact operands have std 0"""
+    if isinstance(other, UncertainQuantity):
+        return other.value, other.std, other.unit
+    if isinstance(other, (Quantity, QuantityArray)):
+        return other.value, 0.0, other.unit
+    if isinstance(other, (UncertainVector, Vector, VectorArray)):
+        raise TypeError(f"expected a scalar operand, got {type(other).__name__}")
+    return other, 0.0, NO_UNIT
+
+
+def _vector_parts(other) -> tuple:
+    """value, standard deviation and unit of any vector operand; exact operands have std 0"""
+    if isinstance(other, UncertainVector):
+        return other.value, other.std, other.unit
+    if isinstance(other, VectorArray):
+        return other.value, 0.0, other.unit
+    if isinstance(other, Vector):
+        unit = other.unit if other.unit is not None else NO_UNIT
+        return np.array([other._x, other._y, other._z], dtype=float), 0.0, unit
+    raise TypeError(f"expected a vector operand, got {type(other).__name__}")
+
+
+def _resolve(value, std, unit) -> tuple:
+    """value, std and unit converted to SI for a unit given as str or ScaledUnit"""
+    if unit is None:
+        return value, std, NO_UNIT, None
+    if type(unit) == Unit:
+        return value, std, unit, None
+    unit, scale, dimension = resolve(unit)
+    if scale != 1.0:
+        value, std = value * scale, std * scale
+    return value, std, unit, dimension
+
+
+class UncertainQuantity:
+    """Value with standard deviation and unit; value and std may be numbers or arrays"""
+
+    __slots__ = ("value", "std", "unit", "name")
+    __array_ufunc__ = None
+
+    def __init__(
+        self,
+        value,
+        std,
+        unit: Unit | ScaledUnit | str | None = None,
+        name: str | None = None,
+    ) -> None:
+        """
+        value: nominal value, number or array-like
+        std: standard deviation, number or array-like broadcastable to value
+        unit: unit of value and std; str and ScaledUnit are resolved as for Quantity
+        name: name of the quantity
+        """
+        if np.ndim(value) or np.ndim(std):
+            value, std = np.asarray(value), np.asarray(std)
+        self.value, self.std, self.unit, dimension = _resolve(value, std, unit)
+        self.name = name or dimension
+
+    @property
+    def nominal(self):
+        """value as Quantity or QuantityArray"""
+        return _wrap(self.value, self.unit)
+
+    @property
+    def uncertainty(self):
+        """standard deviation as Quantity or QuantityArray"""
+        return _wrap(self.std, self.unit)
+
+    @property
+    def relative(self):
+        """relative standard deviation, no unit"""
+        return self.std / np.abs(self.value)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return np.shape(self.value)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, key) -> "UncertainQuantity":
+        std = np.broadcast_to(self.std, self.shape)[key]
+        return UncertainQuantity(self.value[key], std, self.unit)
+
+    def __str__(self) -> str:
+        s = ""
+        if self.name:
+            s += f"{self.name}: "
+        s += f"{self.value} ± {self.std}"
+        if self.unit is not NO_UNIT:
+            s += f" {str(self.unit)}"
+        return s
+
+    def __repr__(self) -> str:
+        return f"UncertainQuantity({self.value!r}, {self.std!r}, {str(self.unit)!r})"
+
+    def __neg__(self) -> "UncertainQuantity":
+        return UncertainQuantity(-self.value, self.std, self.unit)
+
+    def __add__(self, other) -> "UncertainQuantity":
+        if other is self:
+            return self * 2
+        value, std, unit = _parts(other)
+        return UncertainQuantity(
+            self.value + value, np.hypot(self.std, std), self.unit + unit
+        )
+
+    def __radd__(self, other) -> "UncertainQuantity":
+        value, std, unit = _parts(other)
+        return UncertainQuantity(
+            value + self.value, np.hypot(std, self.std), unit + self.unit
+        )
+
+    def __sub__(self, other) -> "UncertainQuantity":
+        if other is self:
+            return UncertainQuantity(self.value * 0, self.std * 0, self.unit)
+        value, std, unit = _parts(other)
+        return UncertainQuantity(
+            self.value - value, np.hypot(self.std, std), self.unit - unit
+        )
+
+    def __rsub__(self, other) -> "UncertainQuantity":
+        value, std, unit = _parts(other)
+        return UncertainQuantity(
+            value - self.value, np.hypot(std, self.std), unit - self.unit
+        )
+
+    def __mul__(self, other):
+        if isinstance(other, UncertainVector):
+            return other * self
+        if isinstance(other, (Vector, VectorArray)):
+            return UncertainVector.from_vector(other, 0.0) * self
+        if other is self:
+            return self**2
+        value, std, unit = _parts(other)
+        return UncertainQuantity(
+            self.value * value,
+            np.hypot(self.std * value, self.value * std),
+            self.unit * unit,
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> "UncertainQuantity":
+        if other is self:
+            return UncertainQuantity(self.value / self.value, self.std * 0, NO_UNIT)
+        value, std, unit = _parts(other)
+        result = self.value / value
+        return UncertainQuantity(
+            result, np.hypot(self.std / value, result * std / value), self.unit / unit
+        )
+
+    def __rtruediv__(self, other):
+        if isinstance(other, (Vector, VectorArray)):
+            return UncertainVector.from_vector(other, 0.0) / self
+        value, std, unit = _parts(other)
+        result = value / self.value
+        return UncertainQuantity(
+            result,
+            np.hypot(std / self.value, result * self.std / self.value),
+            unit / self.unit,
+        )
+
+    def __pow__(self, exponent: int | float) -> "UncertainQuantity":
+        if isinstance(exponent, (UncertainQuantity, Quantity, QuantityArray)):
+            raise TypeError("exponent must be a dimensionless number")
+        return UncertainQuantity(
+            self.value**exponent,
+            np.abs(exponent * self.value ** (exponent - 1)) * self.std,
+            self.unit**exponent,
+        )
+
+    def sqrt(self) -> "UncertainQuantity":
+        return self**0.5
+
+
+def _cross_sum(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """like the cross product a x b, but with both terms added instead of subtracted"""
+    return a[..., [1, 2, 0]] * b[..., [2, 0, 1]] + a[..., [2, 0, 1]] * b[..., [1, 2, 0]]
+
+
+class UncertainVector:
+    """3D vectors with independent standard deviations per component
+
+    value and std are (..., 3) float arrays; a single vector has shape (3,).
+    """
+
+    __slots__ = ("value", "std", "unit", "name")
+    __array_ufunc__ = None
+
+    def __init__(
+        self,
+        values,
+        std,
+        unit: Unit | ScaledUnit | str | None = None,
+        name: str | None = None,
+    ) -> None:
+        """
+        values: array-like of shape (..., 3) holding the x, y and z components
+        std: standard deviations broadcastable to values; a number applies to all components
+        unit: unit of values and std; str and ScaledUnit are resolved as for Vector
+        name: name of the vectors
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 0 or values.shape[-1] != 3:
+            raise ValueError("values must have shape (..., 3)")
+        std = np.broadcast_to(np.asarray(std, dtype=float), values.shape)
+        self.value, self.std, self.unit, dimension = _resolve(values, std, unit)
+        self.name = name or dimension
+
+    @classmethod
+    def from_vector(cls, vector, std, name: str | None = None) -> "UncertainVector":
+        """attach standard deviations to a Vector or VectorArray"""
+        values, _, unit = _vector_parts(vector)
+        return cls(values, std, unit, name)
+
+    @property
+    def nominal(self) -> Vector | VectorArray:
+        """values as Vector or VectorArray"""
+        if self.value.ndim == 1:
+            unit = self.unit if self.unit is not NO_UNIT else None
+            return Vector(*self.value.tolist(), unit)
+        return VectorArray(self.value, self.unit)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the batch, without the component axis"""
+        return self.value.shape[:-1]
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, key) -> "UncertainVector":
+        return UncertainVector(self.value[key], self.std[key], self.unit)
+
+    @property
+    def x(self) -> UncertainQuantity:
+        return UncertainQuantity(self.value[..., 0], self.std[..., 0], self.unit)
+
+    @property
+    def y(self) -> UncertainQuantity:
+        return UncertainQuantity(self.value[..., 1], self.std[..., 1], self.unit)
+
+    @property
+    def z(self) -> UncertainQuantity:
+        return UncertainQuantity(self.value[..., 2], self.std[..., 2], self.unit)
+
+    def __str__(self) -> str:
+        s = ""
+        if self.name:
+            s += f"{self.name}: "
+        s += f"{np.array2string(self.value, precision=2)} ± "
+        s += np.array2string(self.std, precision=2)
+        if self.unit is not NO_UNIT:
+            s += f" {str(self.unit)}"
+        return s
+
+    def __neg__(self) -> "UncertainVector":
+        return UncertainVector(-self.value, self.std, self.unit)
+
+    def __add__(self, other) -> "UncertainVector":
+        values, std, unit = _vector_parts(other)
+        return UncertainVector(
+            self.value + values, np.hypot(self.std, std), self.unit + unit
+        )
+
+    def __radd__(self, other) -> "UncertainVector":
+        values, std, unit = _vector_parts(other)
+        return UncertainVector(
+            values + self.value, np.hypot(std, self.std), unit + self.unit
+        )
+
+    def __sub__(self, other) -> "UncertainVector":
+        values, std, unit = _vector_parts(other)
+        return UncertainVector(
+            self.value - values, np.hypot(self.std, std), self.unit - unit
+        )
+
+    def __rsub__(self, other) -> "UncertainVector":
+        values, std, unit = _vector_parts(other)
+        return UncertainVector(
+            values - self.value, np.hypot(std, self.std), unit - self.unit
+        )
+
+    def __mul__(self, number) -> "UncertainVector":
+        value, std, unit = _parts(number)
+        value, std = np.asarray(value)[..., None], np.asarray(std)[..., None]
+        return UncertainVector(
+            self.value * value,
+            np.hypot(self.std * value, self.value * std),
+            self.unit * unit,
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, number) -> "UncertainVector":
+        value, std, unit = _parts(number)
+        value, std = np.asarray(value)[..., None], np.asarray(std)[..., None]
+        result = self.value / value
+        return UncertainVector(
+            result, np.hypot(self.std / value, result * std / value), self.unit / unit
+        )
+
+    @property
+    def magnitude(self) -> UncertainQuantity:
+        """Magnitudes of the vectors with unit"""
+        length = np.sqrt(np.einsum("...i,...i->...", self.value, self.value))
+        variance = ((self.value * self.std) ** 2).sum(axis=-1)
+        return UncertainQuantity(length, np.sqrt(variance) / length, self.unit)
+
+    def dot(self, other) -> UncertainQuantity:
+        """Dot products"""
+        values, std, unit = _vector_parts(other)
+        std = np.broadcast_to(std, np.shape(values))
+        variance = ((self.std * values) ** 2 + (self.value * std) ** 2).sum(axis=-1)
+        return UncertainQuantity(
+            np.einsum("...i,...i->...", self.value, values),
+            np.sqrt(variance),
+            self.unit * unit,
+        )
+
+    def cross(self, other) -> "UncertainVector":
+        """Cross products"""
+        values, std, unit = _vector_parts(other)
+        std = np.broadcast_to(std, np.shape(values))
+        variance = _cross_sum(self.std**2, values**2) + _cross_sum(
+            self.value**2, std**2
+        )
+        return UncertainVector(
+            np.cross(self.value, values), np.sqrt(variance), self.unit * unit
+        )
+
+
+def _sample(arg, samples: int, rng: np.random.Generator):
+    if isinstance(arg, UncertainQuantity):
+        shape = (samples,) + np.shape(arg.value)
+        values = arg.value + arg.std * rng.standard_normal(shape)
+        return QuantityArray(values, arg.unit, arg.name)
+    if isinstance(arg, UncertainVector):
+        shape = (samples,) + arg.value.shape
+        values = arg.value + arg.std * rng.standard_normal(shape)
+        return VectorArray(values, arg.unit, arg.name)
+    return arg
+
+
+def _summarize(result):
+    if isinstance(result, tuple):
+        return tuple(_summarize(r) for r in result)
+    if isinstance(result, VectorArray):
+        return UncertainVector(
+            result.value.mean(axis=0), result.value.std(axis=0, ddof=1), result.unit
+        )
+    values, _, unit = _parts(result)
+    values = np.asarray(values)
+    return UncertainQuantity(values.mean(axis=0), values.std(axis=0, ddof=1), unit)
+
+
+def monte_carlo(function, *args, samples: int = 10000, seed=None):
+    """
+    Propagate uncertainties through function by sampling: every UncertainQuantity and
+    UncertainVector argument is replaced by a QuantityArray or VectorArray of normally
+    distributed samples along a new leading axis, function is called once on these arrays and
+    mean and standard deviation of its result are returned as uncertain types.
+    function must therefore broadcast over a leading axis; units are checked as usual.
+    """
+    rng = np.random.default_rng(seed)
+    drawn = [_sample(arg, samples, rng) for arg in args]
+    return _summarize(function(*drawn))
+
+
+def propagate(function, *args, method: str = "linear", **kwargs):
+    """
+    Evaluate function on uncertain arguments.
+    method: "linear" applies function directly, propagating to first order;
+            "monte_carlo" samples the arguments, keyword arguments are passed to monte_carlo
+    """
+    if method == "linear":
+        return function(*args)
+    if method == "monte_carlo":
+        return monte_carlo(function, *args, **kwargs)
+    raise ValueError(f"Unknown method: {method}")
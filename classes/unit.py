@@ -1,13 +1,32 @@
-import json
+import os
+from functools import lru_cache
 
-from .errors import IncompatibleUnitsError
+from .errors import IncompatibleUnitsError, DimensionConflictError
+from .packed import pack, unpack
 
 
 BASE_SI = ["kg", "m", "s", "K", "A", "mol", "cd"]
+# maximum number of memoized unit products, quotients and powers
+CACHE_SIZE = 4096
+# ways to resolve a unit matching several dimension names, see Unit.set_name_policy
+NAME_POLICIES = ("first", "preferred", "all", None)
+# values of an environment variable that leave its switch off
+_FALSE_VALUES = ("", "0", "false", "no", "off")
+
+
+def _env_flag(name: str) -> bool:
+    """whether the environment variable name is set to a value other than 0, false, no or off"""
+    return os.environ.get(name, "").strip().lower() not in _FALSE_VALUES
 
 
 class Unit:
-    """represents the basic SI units"""
+    """represents the basic SI units
+
+    Units are immutable and interned: equal exponent vectors share a single instance,
+    so equality is an identity check and units can be used as dictionary keys.
+    """
+
+    __slots__ = ("_nums", "_packed")
 
     dimensions = {
         "mass": [1, 0, 0, 0, 0, 0, 0],
@@ -20,42 +39,131 @@ class Unit:
         "amount": [0, 0, 0, 0, 0, 1, 0],
         "luminous intensity": [0, 0, 0, 0, 0, 0, 1],
     }
+    _interned: dict[tuple, "Unit"] = {}
+    _by_code: dict[int, "Unit"] = {}
+    # reverse index of dimensions: unit -> names, in registration order
+    _names: dict["Unit", list[str]] = {}
+    _preferred: dict["Unit", str] = {}
+    name_policy: str | None = "first"
+    # whether operations check units and name their results, see classes.mode
+    checks: bool = not _env_flag("PHYSICS_UNITS_UNCHECKED")
 
     @staticmethod
     def update_dimensions(dimdict: dict | str, filetype: str = "json") -> None:
         if type(dimdict) == dict:
-            Unit.dimensions.update(dimdict)
+            Unit._register(dimdict)
         elif type(dimdict) == str:
-            if filetype == "json":
-                try:
-                    with open(f"dimensions/{dimdict}.json") as file:
-                        dic = json.load(file)
-                except FileNotFoundError:
-                    print(
-                        "No file found, update failed. Please enter a valid file name."
-                    )
-                    return
-                Unit.dimensions.update(dic)
-            elif filetype == "yaml":
-                raise NotImplementedError
-            else:
-                raise TypeError("Invalid file type given, use json or yaml instead.")
+            Unit.load_dimensions(dimdict, filetype=filetype, override=True)
         else:
             raise TypeError("no valid type given for update")
 
+    @staticmethod
+    def load_dimensions(
+        *names: str, filetype: str = "json", override: bool = False
+    ) -> None:
+        """
+        Load dimension files by name from the dimensions folder or by path, see classes.registry.
+        Conflicting definitions between the files raise DimensionConflictError, as do
+        conflicts with registered dimensions unless override is set.
+        """
+        from . import registry
+
+        compiled = registry.load(list(names), filetype)
+        dimensions = compiled["dimensions"]
+        if not any(name in Unit.dimensions for name in dimensions):
+            Unit.dimensions.update(dimensions)
+            for nums, new_names in compiled["index"].items():
+                Unit._names.setdefault(Unit(nums), []).extend(new_names)
+            return
+        if not override:
+            for name, nums in dimensions.items():
+                old = Unit.dimensions.get(name)
+                if old is not None and Unit(old) is not Unit(nums):
+                    raise DimensionConflictError(name, str(old), str(nums))
+        Unit._register(dimensions)
+
+    @staticmethod
+    def _register(dimdict: dict) -> None:
+        """add dimensions and keep the reverse name index in sync"""
+        for name, nums in dimdict.items():
+            unit = Unit(nums)
+            old = Unit.dimensions.get(name)
+            Unit.dimensions[name] = nums
+            if old is not None:
+                if Unit(old) is unit:
+                    continue
+                Unit._names[Unit(old)].remove(name)
+            Unit._names.setdefault(unit, []).append(name)
+
+    @staticmethod
+    def set_name_policy(policy: str | None, preferred: list[str] | None = None) -> None:
+        """
+        Choose how units matching several dimension names are named:
+        "first": the name registered first
+        "preferred": the name given in preferred for that unit, otherwise the first one
+        "all": all matching names, separated by commas
+        None: no name at all
+        """
+        if policy not in NAME_POLICIES:
+            raise ValueError(
+                f"Invalid name policy {policy!r}, use one of {NAME_POLICIES}"
+            )
+        Unit.name_policy = policy
+        for name in preferred or []:
+            Unit._preferred[Unit.from_dict(name)] = name
+
     @classmethod
     def from_dict(cls, dim):
         if dim in cls.dimensions.keys():
             return Unit(cls.dimensions[dim])
         raise ValueError
 
-    def __init__(self, numbers: list[int]) -> None:
-        if len(numbers) > 7:
+    def __new__(cls, numbers: list[int] | tuple[int, ...]) -> "Unit":
+        nums = tuple(numbers)
+        unit = cls._interned.get(nums)
+        if unit is not None:
+            return unit
+        if len(nums) > 7:
             raise ValueError
-        while len(numbers) < 7:
-            numbers.append(0)
-        self._nums = numbers
-        # self.rename()
+        nums = tuple(
+            int(n) if isinstance(n, float) and n.is_integer() else n for n in nums
+        ) + (0,) * (7 - len(nums))
+        unit = cls._interned.get(nums)
+        if unit is None:
+            unit = super().__new__(cls)
+            unit._nums = nums
+            try:
+                unit._packed = pack(nums)
+            except ValueError:
+                unit._packed = None
+            unit = cls._interned.setdefault(nums, unit)
+            if unit._packed is not None:
+                cls._by_code.setdefault(unit._packed, unit)
+        return unit
+
+    @classmethod
+    def from_packed(cls, code: int) -> "Unit":
+        """unit from its packed integer code, see classes.packed"""
+        unit = cls._by_code.get(code)
+        if unit is None:
+            unit = Unit(unpack(code))
+        return unit
+
+    @property
+    def packed(self) -> int:
+        """exponents packed into a single integer, see classes.packed"""
+        if self._packed is None:
+            try:
+                pack(self._nums)
+            except ValueError as error:
+                raise ValueError(f"cannot pack {self}: {error}") from None
+        return self._packed
+
+    def __reduce__(self):
+        """pickle as the packed code if possible, so equal units always give the same bytes"""
+        if self._packed is not None:
+            return Unit.from_packed, (self._packed,)
+        return Unit, (self._nums,)
 
     def __str__(self) -> str:
         """If name is given, return name, else base SI composition"""
@@ -70,12 +178,12 @@ class Unit:
         return " ".join(s)
 
     def __add__(self, other: "Unit") -> "Unit":
-        if self == other:
+        if self is other or not Unit.checks:
             return self
         raise IncompatibleUnitsError("add", str(self), str(other))
 
     def __sub__(self, other: "Unit") -> "Unit":
-        if self == other:
+        if self is other or not Unit.checks:
             return self
         raise IncompatibleUnitsError("subtract", str(self), str(other))
 
@@ -83,71 +191,83 @@ class Unit:
         """multiply two units"""
         if other is None:
             return self
-        nums = [i + j for i, j in zip(self._nums, other._nums)]
-        u = Unit(nums)
-        print(u)
-        return u
+        return _product(self, other)
 
     def __truediv__(self, other: "Unit") -> "Unit":
         """divide two units"""
         if other is None:
             return self
-        nums = [i - j for i, j in zip(self._nums, other._nums)]
-        return Unit(nums)
+        return _quotient(self, other)
 
     def __rmul__(self, other: "Unit") -> "Unit":
         """multiply two units"""
         if other is None:
             return self
-        nums = [i + j for i, j in zip(self._nums, other._nums)]
-        return Unit(nums)
+        return _product(other, self)
 
     def __rtruediv__(self, other: "Unit") -> "Unit":
         """divide two units"""
         if other is None:
             return self.invert()
-        nums = [j - i for i, j in zip(self._nums, other._nums)]
-        return Unit(nums)
+        return _quotient(other, self)
 
     def __pow__(self, exponent: int | float) -> "Unit":
-        new_nums = [i * exponent for i in self._nums]
-        return Unit(new_nums)
+        return _power(self, exponent)
 
     def __eq__(self, other) -> bool:
-        """compare two units if equal"""
-        if other is None:
-            return self is None
-        if type(other) != Unit:
-            return False
-        if self._nums != other._nums:
-            return False
-        return True
+        """compare two units if equal; units are interned, so this is an identity check"""
+        return self is other
+
+    __hash__ = object.__hash__
 
     def check_dimensions(self, dims: dict = dimensions) -> list[str]:
+        if dims is Unit.dimensions:
+            return list(Unit._names.get(self, ()))
         answer = []
         for k, v in dims.items():
-            if self._nums == v:
+            if self._nums == tuple(v):
                 answer.append(k)
         return answer
 
     def invert(self) -> "Unit":
-        nums = [-i for i in self._nums]
-        return Unit(nums)
+        return _power(self, -1)
 
     def get_name(self, dimdict: dict | None = None) -> str | None:
         if dimdict:
             dims = self.check_dimensions(dimdict)
         else:
-            dims = self.check_dimensions()
+            dims = Unit._names.get(self, ())
         if len(dims) == 1:
             return dims[0]
         elif len(dims) == 0:
             return None
-        else:
-            for i, d in enumerate(dims):
-                print(f"{i+1}: {d}")
-            num = int(input("Enter the number of the chosen dimension: ")) - 1
-            return dims[num]
+        elif Unit.name_policy == "first":
+            return dims[0]
+        elif Unit.name_policy == "preferred":
+            preferred = Unit._preferred.get(self)
+            return preferred if preferred in dims else dims[0]
+        elif Unit.name_policy == "all":
+            return ", ".join(dims)
+        return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _product(unit1: Unit, unit2: Unit) -> Unit:
+    return Unit([i + j for i, j in zip(unit1._nums, unit2._nums)])
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _quotient(unit1: Unit, unit2: Unit) -> Unit:
+    return Unit([i - j for i, j in zip(unit1._nums, unit2._nums)])
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _power(unit: Unit, exponent: int | float) -> Unit:
+    return Unit([i * exponent for i in unit._nums])
+
 
+Unit._names.clear()
+for _name, _nums in Unit.dimensions.items():
+    Unit._names.setdefault(Unit(_nums), []).append(_name)
 
 NO_UNIT = Unit([])
@@ -1,30 +1,65 @@
 from math import sqrt, acos, degrees
+from numbers import Number
 
-from .quantity import Quantity
+from .quantity import Quantity, _UNNAMED
+from .scaled import ScaledUnit, convert, resolve
 from .unit import Unit
 
 
 class Vector:
     """3D Vector"""
 
+    __slots__ = ("_x", "_y", "_z", "unit", "_name")
+
     def __init__(
-        self, x, y, z, unit: Unit | str | None = None, name: str | None = None
+        self,
+        x,
+        y,
+        z,
+        unit: Unit | ScaledUnit | str | None = None,
+        name: str | None = None,
     ) -> None:
         self._x = x
         self._y = y
         self._z = z
         if type(unit) == Unit:
             self.unit = unit
-            if name:
-                self.name = name
+            if name or not Unit.checks:
+                self._name = name
+            else:
+                self._name = _UNNAMED
+        elif type(unit) == str or type(unit) == ScaledUnit:
+            self.unit, scale, dimension = resolve(unit)
+            if scale != 1.0:
+                self._x, self._y, self._z = x * scale, y * scale, z * scale
+            if dimension:
+                self._name = dimension
             else:
-                self.name = unit.get_name()
-        elif type(unit) == str:
-            self.unit = Unit.from_dict(unit)
-            self.name = unit
+                self._name = name if name or not Unit.checks else _UNNAMED
         else:
             self.unit = None
-            self.name = name
+            self._name = name
+
+    @property
+    def name(self) -> str | None:
+        name = self._name
+        if name is _UNNAMED:
+            name = self._name = self.unit.get_name()
+        return name
+
+    @name.setter
+    def name(self, name: str | None) -> None:
+        self._name = name
+
+    def __reduce__(self):
+        """pickle components and unit only; a name that was not given explicitly is looked up again"""
+        if self._name is _UNNAMED or self._name is None:
+            return _restore, (self._x, self._y, self._z, self.unit)
+        return _restore, (self._x, self._y, self._z, self.unit, self._name)
+
+    def to(self, unit: Unit | ScaledUnit | str) -> tuple:
+        """components in the given unit, e.g. km"""
+        return tuple(convert(c, self.unit, unit) for c in (self._x, self._y, self._z))
 
     @property
     def x(self) -> Quantity:
@@ -63,7 +98,7 @@ class Vector:
         return self.length
 
     def __neg__(self) -> "Vector":
-        return Vector(-self._x, -self._y, -self._z, self.unit, self.name)
+        return _new(-self._x, -self._y, -self._z, self.unit, self._name)
 
     def __str__(self) -> str:
         s = ""
@@ -75,52 +110,60 @@ class Vector:
         return s
 
     def __add__(self, other: "Vector") -> "Vector":
-        if not self.unit and not other.unit:
-            unit = None
+        if type(other) != Vector:
+            return NotImplemented
+        if not Unit.checks or (not self.unit and not other.unit):
+            unit = self.unit
         else:
             unit = self.unit + other.unit
 
-        return Vector(self._x + other._x, self._y + other._y, self._z + other._z, unit)
+        return _new(self._x + other._x, self._y + other._y, self._z + other._z, unit)
 
     def __sub__(self, other: "Vector") -> "Vector":
-        if not self.unit and not other.unit:
-            unit = None
+        if type(other) != Vector:
+            return NotImplemented
+        if not Unit.checks or (not self.unit and not other.unit):
+            unit = self.unit
         else:
             unit = self.unit - other.unit
 
-        return Vector(self._x - other._x, self._y - other._y, self._z - other._z, unit)
+        return _new(self._x - other._x, self._y - other._y, self._z - other._z, unit)
 
     def __mul__(self, number) -> "Vector":
         if type(number) == Quantity:
-            return Vector(
+            return _new(
                 self._x * number.value,
                 self._y * number.value,
                 self._z * number.value,
                 self.unit * number.unit,
             )
-
-        return Vector(self._x * number, self._y * number, self._z * number, self.unit)
+        if not isinstance(number, Number):
+            return NotImplemented
+        return _new(self._x * number, self._y * number, self._z * number, self.unit)
 
     def __truediv__(self, number) -> "Vector":
         if type(number) == Quantity:
-            return Vector(
+            return _new(
                 self._x / number.value,
                 self._y / number.value,
                 self._z / number.value,
                 self.unit / number.unit,
             )
-
-        return Vector(self._x / number, self._y / number, self._z / number, self.unit)
+        if not isinstance(number, Number):
+            return NotImplemented
+        return _new(self._x / number, self._y / number, self._z / number, self.unit)
 
     def __rmul__(self, number) -> "Vector":
         if type(number) == Quantity:
-            return Vector(
+            return _new(
                 self._x * number.value,
                 self._y * number.value,
                 self._z * number.value,
                 self.unit * number.unit,
             )
-        return Vector(self._x * number, self._y * number, self._z * number, self.unit)
+        if not isinstance(number, Number):
+            return NotImplemented
+        return _new(self._x * number, self._y * number, self._z * number, self.unit)
 
     def __eq__(self, other: "Vector") -> bool:
         """check for equality"""
@@ -137,7 +180,7 @@ class Vector:
         new_x = round(self._x, ndigits)
         new_y = round(self._y, ndigits)
         new_z = round(self._z, ndigits)
-        return Vector(new_x, new_y, new_z, self.unit, self.name)
+        return _new(new_x, new_y, new_z, self.unit, self._name)
 
     def normalize(self) -> "Vector":
         """Normalize vector to unit length"""
@@ -145,6 +188,11 @@ class Vector:
 
     def dot(self, other: "Vector") -> float:
         """Dot product"""
+        if type(other) != Vector:
+            if not hasattr(other, "dot"):
+                raise TypeError(f"cannot take dot product with {type(other).__name__}")
+            # dot products commute, arrays of vectors broadcast a single vector
+            return other.dot(self)
         dot_v = self._x * other._x + self._y * other._y + self._z * other._z
         if self.unit or other.unit:
             dot_u = self.unit * other.unit
@@ -174,9 +222,34 @@ class Vector:
 
     def cross(self, other: "Vector") -> "Vector":
         """Cross product"""
+        if type(other) != Vector:
+            if not hasattr(other, "cross"):
+                raise TypeError(
+                    f"cannot take cross product with {type(other).__name__}"
+                )
+            # a x b = -(b x a), arrays of vectors broadcast a single vector
+            return -other.cross(self)
         unit = self.unit * other.unit
 
         x = self._y * other._z - self._z * other._y
         y = self._z * other._x - self._x * other._z
         z = self._x * other._y - self._y * other._x
-        return Vector(x, y, z, unit)
+        return _new(x, y, z, unit)
+
+
+def _new(x, y, z, unit: Unit | None, name=_UNNAMED) -> Vector:
+    """result of trusted arithmetic, skipping the validation and naming of Vector()"""
+    vector = object.__new__(Vector)
+    vector._x = x
+    vector._y = y
+    vector._z = z
+    vector.unit = unit
+    if name is _UNNAMED and (unit is None or not Unit.checks):
+        name = None
+    vector._name = name
+    return vector
+
+
+def _restore(x, y, z, unit: Unit | None, name=_UNNAMED) -> Vector:
+    """unpickle a vector; a stable reference, as classes.instrument replaces _new"""
+    return _new(x, y, z, unit, name)
@@ -0,0 +1,251 @@
+from numbers import Number
+
+import numpy as np
+
+from .quantity import Quantity
+from .quantity_array import QuantityArray, _unit_of, _value_of, _wrap
+from .scaled import ScaledUnit, convert, resolve
+from .unit import Unit, IncompatibleUnitsError, NO_UNIT
+from .vector import Vector
+
+
+# indices of the x, y and z components along the last axis
+_COMPONENTS = np.arange(3)
+# operands VectorArray can be multiplied or divided by, others get to handle the operation
+_FACTORS = (Number, np.ndarray, list, tuple, Quantity, QuantityArray)
+
+
+def _vector_parts(other) -> tuple[np.ndarray, Unit]:
+    """values and unit of a Vector or VectorArray operand"""
+    if isinstance(other, VectorArray):
+        return other.value, other.unit
+    if isinstance(other, Vector):
+        unit = other.unit if other.unit is not None else NO_UNIT
+        return np.array([other._x, other._y, other._z], dtype=float), unit
+    raise TypeError(f"expected Vector or VectorArray, got {type(other).__name__}")
+
+
+class VectorArray:
+    """Array of 3D vectors sharing a single unit
+
+    The components are stored as one contiguous (..., 3) float array, all methods of Vector are
+    vectorized and broadcast over the leading axes.
+    """
+
+    __array_ufunc__ = None
+
+    def __init__(
+        self,
+        values,
+        unit: Unit | ScaledUnit | str | None = None,
+        name: str | None = None,
+    ) -> None:
+        """
+        values: array-like of shape (..., 3) holding the x, y and z components
+        unit: unit shared by all vectors; if str is given use Unit.from_dict to determine unit
+        name: name of the vectors; if None the dictionary will be checked to find a suitable name
+        """
+        self.value = np.asarray(values, dtype=float)
+        if self.value.ndim == 0 or self.value.shape[-1] != 3:
+            raise ValueError("values must have shape (..., 3)")
+        if type(unit) == Unit:
+            self.unit = unit
+            if name or not Unit.checks:
+                self.name = name
+            else:
+                self.name = unit.get_name()
+        elif type(unit) == str or type(unit) == ScaledUnit:
+            self.unit, scale, dimension = resolve(unit)
+            if scale != 1.0:
+                self.value = self.value * scale
+            if dimension:
+                self.name = dimension
+            elif name or not Unit.checks:
+                self.name = name
+            else:
+                self.name = self.unit.get_name()
+        else:
+            self.unit = NO_UNIT
+            self.name = name
+
+    @classmethod
+    def from_components(
+        cls, x, y, z, unit: Unit | str | None = None, name: str | None = None
+    ) -> "VectorArray":
+        return cls(np.stack(np.broadcast_arrays(x, y, z), axis=-1), unit, name)
+
+    @classmethod
+    def from_vectors(cls, vectors, name: str | None = None) -> "VectorArray":
+        """Build an array from a sequence of Vector objects sharing one unit"""
+        vectors = list(vectors)
+        unit = vectors[0].unit
+        for v in vectors:
+            if v.unit != unit:
+                raise IncompatibleUnitsError("stack", str(unit), str(v.unit))
+        return cls([[v._x, v._y, v._z] for v in vectors], unit, name)
+
+    def to(self, unit: Unit | ScaledUnit | str) -> np.ndarray:
+        """components in the given unit, e.g. "km", converted in a single multiplication"""
+        return convert(self.value, self.unit, unit)
+
+    @property
+    def x(self) -> QuantityArray:
+        return QuantityArray(self.value[..., 0], self.unit)
+
+    @x.setter
+    def x(self, value) -> None:
+        self.value[..., 0] = value
+
+    @property
+    def y(self) -> QuantityArray:
+        return QuantityArray(self.value[..., 1], self.unit)
+
+    @y.setter
+    def y(self, value) -> None:
+        self.value[..., 1] = value
+
+    @property
+    def z(self) -> QuantityArray:
+        return QuantityArray(self.value[..., 2], self.unit)
+
+    @z.setter
+    def z(self, value) -> None:
+        self.value[..., 2] = value
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the batch, without the component axis"""
+        return self.value.shape[:-1]
+
+    @property
+    def length(self) -> np.ndarray:
+        """Lengths of the vectors, no unit"""
+        return np.sqrt(np.einsum("...i,...i->...", self.value, self.value))
+
+    @property
+    def magnitude(self) -> QuantityArray:
+        """Magnitudes of the vectors with unit"""
+        return QuantityArray(self.length, self.unit)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, key) -> "Vector | VectorArray | QuantityArray":
+        """
+        vectors if the key keeps the component axis whole, e.g. va[0] or va[1:], otherwise the
+        selected components, e.g. va[:, 0], as QuantityArray or Quantity
+        """
+        values = self.value[key]
+        components = np.broadcast_to(_COMPONENTS, self.value.shape)[key]
+        if values.shape[-1:] != (3,) or np.any(components != _COMPONENTS):
+            return _wrap(values, self.unit)
+        if values.ndim == 1:
+            unit = self.unit if self.unit != NO_UNIT else None
+            return Vector(*values.tolist(), unit, self.name)
+        return VectorArray(values, self.unit, self.name)
+
+    def __neg__(self) -> "VectorArray":
+        return VectorArray(-self.value, self.unit, self.name)
+
+    def __str__(self) -> str:
+        s = ""
+        if self.name:
+            s += f"{self.name}: "
+        s += np.array2string(self.value, precision=2)
+        if self.unit != NO_UNIT:
+            s += f" {str(self.unit)}"
+        return s
+
+    def __add__(self, other) -> "VectorArray":
+        if not isinstance(other, (Vector, VectorArray)):
+            return NotImplemented
+        values, unit = _vector_parts(other)
+        return VectorArray(self.value + values, self.unit + unit)
+
+    def __radd__(self, other) -> "VectorArray":
+        if not isinstance(other, (Vector, VectorArray)):
+            return NotImplemented
+        values, unit = _vector_parts(other)
+        return VectorArray(values + self.value, unit + self.unit)
+
+    def __sub__(self, other) -> "VectorArray":
+        if not isinstance(other, (Vector, VectorArray)):
+            return NotImplemented
+        values, unit = _vector_parts(other)
+        return VectorArray(self.value - values, self.unit - unit)
+
+    def __rsub__(self, other) -> "VectorArray":
+        if not isinstance(other, (Vector, VectorArray)):
+            return NotImplemented
+        values, unit = _vector_parts(other)
+        return VectorArray(values - self.value, unit - self.unit)
+
+    def __mul__(self, number) -> "VectorArray":
+        if not isinstance(number, _FACTORS):
+            return NotImplemented
+        value = _value_of(number)
+        if np.ndim(value) != 0:
+            value = np.asarray(value)[..., None]
+        return VectorArray(self.value * value, self.unit * _unit_of(number))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, number) -> "VectorArray":
+        if not isinstance(number, _FACTORS):
+            return NotImplemented
+        value = _value_of(number)
+        if np.ndim(value) != 0:
+            value = np.asarray(value)[..., None]
+        return VectorArray(self.value / value, self.unit / _unit_of(number))
+
+    def __eq__(self, other) -> np.ndarray:
+        """check for equality, vector by vector"""
+        values, unit = _vector_parts(other)
+        if self.unit != unit:
+            return np.zeros(np.broadcast_shapes(self.shape, values.shape[:-1]), bool)
+        return np.all(self.value == values, axis=-1)
+
+    __hash__ = None
+
+    def __round__(self, ndigits: int = 0) -> "VectorArray":
+        """Elementwise rounding"""
+        return VectorArray(np.round(self.value, ndigits), self.unit, self.name)
+
+    def normalize(self) -> "VectorArray":
+        """Normalize vectors to unit length"""
+        return VectorArray(self.value / self.length[..., None], self.unit)
+
+    def dot(self, other) -> QuantityArray | np.ndarray:
+        """Dot products"""
+        values, unit = _vector_parts(other)
+        dot_v = np.einsum("...i,...i->...", self.value, values)
+        return QuantityArray(dot_v, self.unit * unit)
+
+    def angle(self, other, degs: bool = False) -> np.ndarray:
+        """Angles between two sets of vectors"""
+        values, _ = _vector_parts(other)
+        dot_v = np.einsum("...i,...i->...", self.value, values)
+        lengths = self.length * np.sqrt(np.einsum("...i,...i->...", values, values))
+        rad = np.arccos(np.clip(dot_v / lengths, -1.0, 1.0))
+        if degs:
+            return np.degrees(rad)
+        return rad
+
+    def project(self, other) -> "VectorArray":
+        """Projection of vectors onto others"""
+        values, _ = _vector_parts(other)
+        coeff = np.einsum("...i,...i->...", self.value, values) / np.einsum(
+            "...i,...i->...", values, values
+        )
+        return VectorArray(coeff[..., None] * values, self.unit)
+
+    def split_parallel_orthogonal(self, other) -> tuple["VectorArray", "VectorArray"]:
+        """split vectors in two parts parallel and orthogonal to other vectors"""
+        parallel = self.project(other)
+        orthogonal = self - parallel
+        return parallel, orthogonal
+
+    def cross(self, other) -> "VectorArray":
+        """Cross products"""
+        values, unit = _vector_parts(other)
+        return VectorArray(np.cross(self.value, values), self.unit * unit)
@@ -1,21 +1,83 @@
-from scipy import constants as sc
+from math import pi
 
 from classes import Unit, Quantity, Vector
 
 
+# CODATA 2022 values as published in scipy.constants, in SI base units
+CODATA = {
+    "g": 9.80665,
+    "c": 299792458.0,
+    "epsilon_0": 8.8541878188e-12,
+    "mu_0": 1.25663706127e-06,
+    "Planck": 6.62607015e-34,
+    "elementary_charge": 1.602176634e-19,
+    "R": 8.31446261815324,
+    "Boltzmann": 1.380649e-23,
+    "N_A": 6.02214076e23,
+}
+
+
+class _lazy:
+    """class attribute built on first access and then cached on the owning class"""
+
+    def __init__(self, factory) -> None:
+        self.factory = factory
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner):
+        value = self.factory()
+        setattr(owner, self.name, value)
+        return value
+
+
 class Constant:
-    g = Quantity(sc.g, Unit([0, 1, -2]), "gravitational constant")
-    g_vector = Vector(0, 0, -sc.g, Unit([0, 1, -2]), "gravitational vector")
-    pi = sc.pi
-    c = Quantity(sc.c, Unit([0, 1, -1]), "speed of light")
-    e_0 = Quantity(sc.epsilon_0, Unit([-1, -3, 4, 0, 2]), "dielectric constant")
-    coulomb = 1 / (4 * pi * e_0)
-    mu_0 = Quantity(sc.mu_0, Unit([1, 1, -2, 0, -2]), "magnetic constant")
-    planck = Quantity(sc.Planck, Unit([1, 2, -1]), "Planck constant")
-    hbar = planck / (2 * pi)
-    el_charge = Quantity(
-        sc.elementary_charge, Unit([0, 0, 1, 0, 1]), "elementary charge"
-    )
-    gas_constant = Quantity(sc.R, Unit([1, 2, -2, -1, 0, -1]), "gas constant")
-    boltzmann = Quantity(sc.Boltzmann, Unit([1, 2, -2, -1]), "Boltzmann constant")
-    avogadro = Quantity(sc.N_A, Unit([0, 0, 0, 0, 0, -1]), "Avogadro constant")
+    g = _lazy(lambda: Quantity(CODATA["g"], Unit([0, 1, -2]), "gravitational constant"))
+    g_vector = _lazy(
+        lambda: Vector(0, 0, -CODATA["g"], Unit([0, 1, -2]), "gravitational vector")
+    )
+    pi = pi
+    c = _lazy(lambda: Quantity(CODATA["c"], Unit([0, 1, -1]), "speed of light"))
+    e_0 = _lazy(
+        lambda: Quantity(
+            CODATA["epsilon_0"], Unit([-1, -3, 4, 0, 2]), "dielectric constant"
+        )
+    )
+    coulomb = _lazy(lambda: 1 / (4 * Constant.pi * Constant.e_0))
+    mu_0 = _lazy(
+        lambda: Quantity(CODATA["mu_0"], Unit([1, 1, -2, 0, -2]), "magnetic constant")
+    )
+    planck = _lazy(
+        lambda: Quantity(CODATA["Planck"], Unit([1, 2, -1]), "Planck constant")
+    )
+    hbar = _lazy(lambda: Constant.planck / (2 * Constant.pi))
+    el_charge = _lazy(
+        lambda: Quantity(
+            CODATA["elementary_charge"], Unit([0, 0, 1, 0, 1]), "elementary charge"
+        )
+    )
+    gas_constant = _lazy(
+        lambda: Quantity(CODATA["R"], Unit([1, 2, -2, -1, 0, -1]), "gas constant")
+    )
+    boltzmann = _lazy(
+        lambda: Quantity(
+            CODATA["Boltzmann"], Unit([1, 2, -2, -1]), "Boltzmann constant"
+        )
+    )
+    avogadro = _lazy(
+        lambda: Quantity(CODATA["N_A"], Unit([0, 0, 0, 0, 0, -1]), "Avogadro constant")
+    )
+
+    @staticmethod
+    def use_scipy() -> None:
+        """Replace the embedded CODATA values by those of the installed scipy.constants"""
+        from scipy import constants as sc
+
+        for key in CODATA:
+            CODATA[key] = getattr(sc, key)
+        for name, attribute in _LAZY.items():
+            setattr(Constant, name, attribute)
+
+
+_LAZY = {k: v for k, v in vars(Constant).items() if isinstance(v, _lazy)}
@@ -0,0 +1,6 @@
+from .forces import Force, UniformGravity, Coulomb
+from .integrators import INTEGRATORS
+from .spatial import SpatialIndex
+from .fields import grid, electric_field, magnetic_field, poynting, energy_density
+from .ode import solve, Solution
+from .system import ParticleSystem
@@ -0,0 +1,129 @@
+"""
+Electric and magnetic fields of point sources evaluated over many points.
+
+Units are checked once per call and the sums run on raw SI arrays. The pairwise terms are
+evaluated in blocks of at most chunk_size point-source pairs, so besides the result the memory
+stays bounded by the block size, however large grid and sources are.
+"""
+import numpy as np
+
+from classes import Unit, QuantityArray, VectorArray
+from constants import Constant
+from .forces import CHARGE, LENGTH, expect
+
+
+ELECTRIC_FIELD = Unit([1, 1, -3, 0, -1])
+MAGNETIC_FIELD = Unit([0, -1, 0, 0, 1])
+CURRENT_ELEMENT = Unit([0, 1, 0, 0, 1])
+CHUNK_SIZE = 2**20
+
+
+def grid(x, y, z) -> VectorArray:
+    """VectorArray of shape (len(x), len(y), len(z), 3) from coordinate QuantityArrays"""
+    unit = x.unit
+    axes = [expect(axis, unit, "coordinate") for axis in (x, y, z)]
+    return VectorArray(np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1), unit)
+
+
+def _blocks(count: int, sources: int, chunk_size: int):
+    """slices of points and sources holding at most chunk_size pairs"""
+    source_step = min(sources, chunk_size) or 1
+    point_step = max(chunk_size // source_step, 1)
+    for start in range(0, count, point_step):
+        points = slice(start, min(start + point_step, count))
+        for source_start in range(0, sources, source_step):
+            yield points, slice(source_start, source_start + source_step)
+
+
+def _distances(points: np.ndarray, sources: np.ndarray) -> tuple:
+    """vectors from sources to points and their inverse cubed lengths, 0 where they coincide"""
+    distances = points[:, None, :] - sources[None, :, :]
+    squared = np.einsum("ijk,ijk->ij", distances, distances)
+    with np.errstate(divide="ignore"):
+        inverse = squared**-1.5
+    inverse[squared == 0] = 0.0
+    return distances, inverse
+
+
+def _flat(points: VectorArray) -> np.ndarray:
+    return expect(points, LENGTH, "position").reshape(-1, 3)
+
+
+def electric_field(
+    points: VectorArray,
+    positions: VectorArray,
+    charges: QuantityArray,
+    chunk_size: int = CHUNK_SIZE,
+) -> VectorArray:
+    """
+    Coulomb field of point charges at the given points, which may have any shape (..., 3);
+    a point on top of a charge gets no contribution from it
+    """
+    flat = _flat(points)
+    sources = expect(positions, LENGTH, "position").reshape(-1, 3)
+    weights = np.broadcast_to(expect(charges, CHARGE, "charge"), len(sources))
+    weights = Constant.coulomb.value * weights
+    result = np.zeros_like(flat)
+    for rows, columns in _blocks(len(flat), len(sources), chunk_size):
+        distances, inverse = _distances(flat[rows], sources[columns])
+        result[rows] += np.einsum("ij,ijk->ik", weights[columns] * inverse, distances)
+    return VectorArray(result.reshape(points.value.shape), ELECTRIC_FIELD)
+
+
+def magnetic_field(
+    points: VectorArray,
+    positions: VectorArray,
+    elements: VectorArray,
+    chunk_size: int = CHUNK_SIZE,
+) -> VectorArray:
+    """
+    Biot-Savart field H of current elements I dl (or moving charges q v) at the given points;
+    multiply by Constant.mu_0 for the flux density B
+    """
+    flat = _flat(points)
+    sources = expect(positions, LENGTH, "position").reshape(-1, 3)
+    moments = np.broadcast_to(
+        expect(elements, CURRENT_ELEMENT, "current element"), sources.shape
+    )
+    moments = moments / (4 * np.pi)
+    result = np.zeros_like(flat)
+    for rows, columns in _blocks(len(flat), len(sources), chunk_size):
+        distances, inverse = _distances(flat[rows], sources[columns])
+        terms = np.cross(moments[columns][None, :, :], distances)
+        result[rows] += np.einsum("ij,ijk->ik", inverse, terms)
+    return VectorArray(result.reshape(points.value.shape), MAGNETIC_FIELD)
+
+
+def _pair(e: VectorArray, h: VectorArray) -> tuple[np.ndarray, np.ndarray]:
+    if e.value.shape != h.value.shape:
+        raise ValueError("electric and magnetic field must have the same shape")
+    e_values = expect(e, ELECTRIC_FIELD, "electric field").reshape(-1, 3)
+    h_values = expect(h, MAGNETIC_FIELD, "magnetic field").reshape(-1, 3)
+    return e_values, h_values
+
+
+def poynting(
+    e: VectorArray, h: VectorArray, chunk_size: int = CHUNK_SIZE
+) -> VectorArray:
+    """energy flux density E x H"""
+    e_values, h_values = _pair(e, h)
+    result = np.empty_like(e_values)
+    for start in range(0, len(result), chunk_size):
+        rows = slice(start, start + chunk_size)
+        result[rows] = np.cross(e_values[rows], h_values[rows])
+    return VectorArray(result.reshape(e.value.shape), ELECTRIC_FIELD * MAGNETIC_FIELD)
+
+
+def energy_density(
+    e: VectorArray, h: VectorArray, chunk_size: int = CHUNK_SIZE
+) -> QuantityArray:
+    """electromagnetic energy density (epsilon_0 E^2 + mu_0 H^2) / 2 in vacuum"""
+    e_values, h_values = _pair(e, h)
+    electric, magnetic = Constant.e_0.value / 2, Constant.mu_0.value / 2
+    result = np.empty(len(e_values))
+    for start in range(0, len(result), chunk_size):
+        rows = slice(start, start + chunk_size)
+        result[rows] = electric * np.einsum("ij,ij->i", e_values[rows], e_values[rows])
+        result[rows] += magnetic * np.einsum("ij,ij->i", h_values[rows], h_values[rows])
+    unit = Constant.e_0.unit * ELECTRIC_FIELD**2
+    return QuantityArray(result.reshape(e.value.shape[:-1]), unit)
@@ -0,0 +1,95 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from classes import Unit, Quantity, QuantityArray, Vector, VectorArray, NO_UNIT
+from classes import IncompatibleUnitsError
+from constants import Constant
+
+
+ACCELERATION = Unit([0, 1, -2])
+CHARGE = Unit([0, 0, 1, 0, 1])
+LENGTH = Unit([0, 1])
+
+
+def expect(value, unit: Unit, what: str):
+    """raw SI value of a Quantity, Vector or array after checking it has the expected unit"""
+    actual = getattr(value, "unit", None) or NO_UNIT
+    if Unit.checks and actual is not unit:
+        raise IncompatibleUnitsError("use", f"{str(actual)} as {what}", str(unit))
+    if isinstance(value, Vector):
+        return np.array([value._x, value._y, value._z], dtype=float)
+    return np.asarray(getattr(value, "value", value), dtype=float)
+
+
+class Force(ABC):
+    """Force model acting on the particles of a ParticleSystem
+
+    bind is called once when the system is set up and checks units; acceleration is called every
+    step with raw SI arrays of shape (n, 3) and returns the accelerations as such an array.
+    """
+
+    def bind(self, system) -> None:
+        pass
+
+    @abstractmethod
+    def acceleration(self, positions: np.ndarray, velocities: np.ndarray):
+        pass
+
+
+class UniformGravity(Force):
+    """the same acceleration for every particle, by default Constant.g_vector"""
+
+    def __init__(self, field: Vector | VectorArray | None = None) -> None:
+        self.field = field
+
+    def bind(self, system) -> None:
+        field = self.field if self.field is not None else Constant.g_vector
+        self._field = expect(field, ACCELERATION, "acceleration")
+
+    def acceleration(self, positions: np.ndarray, velocities: np.ndarray):
+        return self._field
+
+
+class Coulomb(Force):
+    """pairwise electrostatic forces between charged particles
+
+    Pairs farther apart than cutoff are ignored, and so are particles at the same position, which
+    would otherwise attract each other infinitely. The pairs are evaluated in blocks of rows, so
+    memory grows with block * n instead of n**2.
+    """
+
+    def __init__(
+        self,
+        charges: QuantityArray | Quantity,
+        cutoff: Quantity | None = None,
+        block: int = 512,
+    ) -> None:
+        self.charges = charges
+        self.cutoff = cutoff
+        self.block = block
+
+    def bind(self, system) -> None:
+        charges = expect(self.charges, CHARGE, "charge")
+        self._charges = np.broadcast_to(charges, (system.count,))
+        # the acceleration is coulomb * q_i * q_j / r**2 / m_i, with the mass checked by the system
+        self._factors = Constant.coulomb.value * self._charges / system.masses
+        self._cutoff = None
+        if self.cutoff is not None:
+            self._cutoff = expect(self.cutoff, LENGTH, "cutoff") ** 2
+
+    def acceleration(self, positions: np.ndarray, velocities: np.ndarray):
+        count = len(positions)
+        result = np.empty_like(positions)
+        for start in range(0, count, self.block):
+            stop = min(start + self.block, count)
+            distances = positions[start:stop, None, :] - positions[None, :, :]
+            squared = np.einsum("ijk,ijk->ij", distances, distances)
+            # masks the pairs of a particle with itself and with particles on top of it
+            squared[squared == 0] = np.inf
+            if self._cutoff is not None:
+                squared[squared > self._cutoff] = np.inf
+            weights = self._charges * squared**-1.5
+            result[start:stop] = np.einsum("ij,ijk->ik", weights, distances)
+            result[start:stop] *= self._factors[start:stop, None]
+        return result
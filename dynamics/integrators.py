@@ -0,0 +1,40 @@
+"""
+Integration schemes on raw arrays. Every scheme takes positions, velocities, the accelerations at
+these, the acceleration function and the time step, updates positions and velocities in place
+where possible and returns positions, velocities and accelerations after the step.
+"""
+
+
+def euler(positions, velocities, accelerations, acceleration, dt: float):
+    """explicit Euler, first order"""
+    positions += velocities * dt
+    velocities += accelerations * dt
+    return positions, velocities, acceleration(positions, velocities)
+
+
+def verlet(positions, velocities, accelerations, acceleration, dt: float):
+    """velocity Verlet, second order and symplectic for velocity independent forces"""
+    velocities += accelerations * (dt / 2)
+    positions += velocities * dt
+    accelerations = acceleration(positions, velocities)
+    velocities += accelerations * (dt / 2)
+    return positions, velocities, accelerations
+
+
+def rk4(positions, velocities, accelerations, acceleration, dt: float):
+    """classic fourth order Runge-Kutta"""
+    x2 = positions + velocities * (dt / 2)
+    v2 = velocities + accelerations * (dt / 2)
+    a2 = acceleration(x2, v2)
+    x3 = positions + v2 * (dt / 2)
+    v3 = velocities + a2 * (dt / 2)
+    a3 = acceleration(x3, v3)
+    x4 = positions + v3 * dt
+    v4 = velocities + a3 * dt
+    a4 = acceleration(x4, v4)
+    positions += (velocities + 2 * v2 + 2 * v3 + v4) * (dt / 6)
+    velocities += (accelerations + 2 * a2 + 2 * a3 + a4) * (dt / 6)
+    return positions, velocities, acceleration(positions, velocities)
+
+
+INTEGRATORS = {"euler": euler, "verlet": verlet, "rk4": rk4}
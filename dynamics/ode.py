@@ -0,0 +1,179 @@
+"""
+Initial value problems on unit-annotated states, integrated by scipy.integrate.solve_ivp.
+
+The right-hand side is evaluated once with units to check that every derivative has the unit of
+its state divided by time. scipy then works on one flat array of raw SI values, and the right-hand
+side is called on the state without units: quantities become plain numbers, arrays and vectors
+become dimensionless, while constants inside the right-hand side keep their units. Only the
+values of the derivatives are used. A right-hand side that fails without units, e.g. because it
+adds its state to a constant carrying a unit, keeps being evaluated with units.
+"""
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from classes import Unit, Quantity, QuantityArray, Vector, VectorArray, NO_UNIT
+from classes import IncompatibleUnitsError
+from .forces import expect
+
+
+TIME = Unit([0, 0, 1])
+
+
+def _unit_of(item) -> Unit:
+    unit = getattr(item, "unit", None)
+    return NO_UNIT if unit is None else unit
+
+
+def _raw(item) -> np.ndarray:
+    """values of a state or derivative as flat float array"""
+    if isinstance(item, Vector):
+        return np.array([item._x, item._y, item._z], dtype=float)
+    return np.ravel(np.asarray(getattr(item, "value", item), dtype=float))
+
+
+def _as_tuple(derivatives) -> tuple:
+    if isinstance(derivatives, (tuple, list)):
+        return tuple(derivatives)
+    return (derivatives,)
+
+
+def _plain(values: np.ndarray) -> QuantityArray:
+    """dimensionless QuantityArray, which unlike an ndarray combines with Quantity constants"""
+    array = object.__new__(QuantityArray)
+    array.value = values
+    array.unit = NO_UNIT
+    array.name = None
+    return array
+
+
+class _Layout:
+    """positions of the state items within the flat array used by scipy"""
+
+    def __init__(self, state: tuple) -> None:
+        self.items = []
+        offset = 0
+        for item in state:
+            if isinstance(item, Vector):
+                shape = (3,)
+            else:
+                shape = np.shape(getattr(item, "value", item))
+            size = int(np.prod(shape, dtype=int))
+            self.items.append((type(item), _unit_of(item), shape, offset, size))
+            offset += size
+        self.size = offset
+
+    def flatten(self, items) -> np.ndarray:
+        flat = np.empty(self.size)
+        for item, (_, _, _, offset, size) in zip(items, self.items):
+            flat[offset : offset + size] = _raw(item)
+        return flat
+
+    def unflatten(self, flat: np.ndarray, units: bool) -> list:
+        """state items from a flat array, with units or stripped as for the raw right-hand side"""
+        items = []
+        for kind, unit, shape, offset, size in self.items:
+            values = flat[offset : offset + size]
+            if kind is Vector:
+                vector_unit = unit if units and unit is not NO_UNIT else None
+                items.append(Vector(*values.tolist(), vector_unit))
+            elif kind is VectorArray:
+                items.append(
+                    VectorArray(values.reshape(shape), unit if units else None)
+                )
+            elif kind is QuantityArray or shape:
+                values = values.reshape(shape)
+                items.append(QuantityArray(values, unit) if units else _plain(values))
+            else:
+                items.append(Quantity(values[0], unit) if units else values[0])
+        return items
+
+    def trajectories(self, y: np.ndarray) -> list:
+        """state items over time, with time as the first axis"""
+        result = []
+        for kind, unit, shape, offset, size in self.items:
+            values = y[offset : offset + size].T.reshape((-1,) + shape)
+            if kind in (Vector, VectorArray):
+                result.append(VectorArray(values, unit))
+            else:
+                result.append(QuantityArray(values, unit))
+        return result
+
+
+class Solution:
+    """Result of solve: times and trajectories of the state items with their units"""
+
+    def __init__(self, t: QuantityArray, y, result) -> None:
+        self.t = t
+        self.y = y
+        self.result = result
+        self.success = result.success
+        self.message = result.message
+
+
+def _check(rhs, t0: float, state: tuple, layout: _Layout):
+    """evaluate rhs once with units and compare the derivative units to state units per time"""
+    derivatives = _as_tuple(rhs(Quantity(t0, TIME), *state))
+    if len(derivatives) != len(state):
+        raise ValueError(f"expected {len(state)} derivatives, got {len(derivatives)}")
+    for derivative, (_, unit, _, _, size) in zip(derivatives, layout.items):
+        expected = unit / TIME
+        if Unit.checks and _unit_of(derivative) is not expected:
+            raise IncompatibleUnitsError(
+                "integrate", str(_unit_of(derivative)), str(expected)
+            )
+        if _raw(derivative).size != size:
+            raise ValueError("derivatives must have the shape of their state")
+
+
+def solve(
+    rhs,
+    t_span: tuple[Quantity, Quantity],
+    state,
+    method: str = "RK45",
+    t_eval: QuantityArray | None = None,
+    **options,
+) -> Solution:
+    """
+    Solve d(state)/dt = rhs(t, *state) with scipy.integrate.solve_ivp.
+
+    rhs: function of the time and the state items returning one derivative per state item
+    t_span: start and end time as Quantities
+    state: initial state, a Quantity, QuantityArray, Vector or VectorArray or a tuple of them
+    method: any method of solve_ivp, e.g. "RK45", "DOP853", "Radau" or "LSODA"
+    t_eval: times at which to store the solution
+    options: passed to solve_ivp; max_step and first_step are given as Quantities, rtol and
+             atol apply to the raw SI values
+
+    Returns a Solution whose t is a QuantityArray of times and whose y holds a QuantityArray or
+    VectorArray per state item with time as first axis, or just one for a single state item.
+    """
+    single = not isinstance(state, (tuple, list))
+    state = (state,) if single else tuple(state)
+    t0, t1 = (float(expect(t, TIME, "time")) for t in t_span)
+    layout = _Layout(state)
+    _check(rhs, t0, state, layout)
+    for key in ("max_step", "first_step"):
+        if key in options:
+            options[key] = float(expect(options[key], TIME, key))
+    if t_eval is not None:
+        t_eval = expect(t_eval, TIME, "time")
+
+    y0 = layout.flatten(state)
+    try:
+        layout.flatten(_as_tuple(rhs(t0, *layout.unflatten(y0, False))))
+        units = False
+    except (TypeError, AttributeError, IncompatibleUnitsError):
+        # the right-hand side mixes its state with unit-carrying values of its own
+        units = True
+
+    def derivative(t: float, y: np.ndarray) -> np.ndarray:
+        time = Quantity(t, TIME) if units else t
+        return layout.flatten(_as_tuple(rhs(time, *layout.unflatten(y, units))))
+
+    result = solve_ivp(derivative, (t0, t1), y0, method, t_eval, **options)
+    trajectories = layout.trajectories(result.y)
+    return Solution(
+        QuantityArray(result.t, TIME),
+        trajectories[0] if single else tuple(trajectories),
+        result,
+    )
@@ -0,0 +1,123 @@
+import numpy as np
+from scipy.spatial import cKDTree
+
+from classes import Unit, Quantity, QuantityArray, Vector, VectorArray, NO_UNIT
+from classes import IncompatibleUnitsError
+from .forces import LENGTH, expect
+
+
+class SpatialIndex:
+    """k-d tree over positions answering radius and nearest neighbor queries
+
+    With a skin, update keeps the tree as long as no particle moved farther than the skin since
+    the last build. Queries then search the tree with the radius widened by the largest
+    displacement and filter the candidates by their current positions, so the results stay exact.
+    """
+
+    def __init__(
+        self,
+        positions: VectorArray,
+        skin: Quantity | None = None,
+        leafsize: int = 16,
+    ) -> None:
+        """
+        positions: VectorArray of positions with a length unit
+        skin: largest displacement tolerated by update before the tree is rebuilt
+        leafsize: number of points at which the tree stops splitting
+        """
+        self.unit = positions.unit
+        values = expect(positions, LENGTH, "position")
+        self.skin = 0.0 if skin is None else self._length(skin)
+        self.leafsize = leafsize
+        self.rebuilds = 0
+        self._build(values)
+
+    def _length(self, value) -> float:
+        if Unit.checks and value.unit is not self.unit:
+            raise IncompatibleUnitsError("compare", str(value.unit), str(self.unit))
+        return float(value.value)
+
+    def _points(self, points) -> np.ndarray:
+        unit = points.unit if points.unit is not None else NO_UNIT
+        if Unit.checks and unit is not self.unit:
+            raise IncompatibleUnitsError("compare", str(unit), str(self.unit))
+        if isinstance(points, Vector):
+            return np.array([points._x, points._y, points._z], dtype=float)
+        return points.value
+
+    def _build(self, values: np.ndarray) -> None:
+        self._reference = np.array(values, dtype=float)
+        self._current = self._reference
+        self._drift = 0.0
+        self._tree = cKDTree(self._reference, leafsize=self.leafsize)
+        self.rebuilds += 1
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def update(self, positions: VectorArray) -> bool:
+        """move the indexed particles to new positions, return whether the tree was rebuilt"""
+        values = self._points(positions)
+        if self.skin and values.shape == self._reference.shape:
+            moved = values - self._reference
+            drift = np.sqrt(np.einsum("ij,ij->i", moved, moved).max(initial=0.0))
+            if drift <= self.skin:
+                self._current = np.array(values, dtype=float)
+                self._drift = drift
+                return False
+        self._build(values)
+        return True
+
+    def _exact(self, point: np.ndarray, candidates, radius: float) -> np.ndarray:
+        candidates = np.asarray(candidates, dtype=np.intp)
+        if self._drift:
+            moved = self._current[candidates] - point
+            inside = np.einsum("ij,ij->i", moved, moved) <= radius**2
+            candidates = candidates[inside]
+        return np.sort(candidates)
+
+    def within(self, points: Vector | VectorArray, radius: Quantity):
+        """
+        indices of the particles within radius of a point, as sorted array;
+        for a VectorArray of points a list with one array per point
+        """
+        radius = self._length(radius)
+        values = self._points(points)
+        found = self._tree.query_ball_point(values, radius + self._drift)
+        if values.ndim == 1:
+            return self._exact(values, found, radius)
+        return [
+            self._exact(point, candidates, radius)
+            for point, candidates in zip(values.reshape(-1, 3), found.reshape(-1))
+        ]
+
+    def nearest(self, points: Vector | VectorArray, k: int = 1):
+        """distances and indices of the k nearest particles, sorted by distance"""
+        values = self._points(points)
+        if not self._drift:
+            distances, indices = self._tree.query(values, k=[*range(1, k + 1)])
+            return QuantityArray(distances, self.unit), indices
+        old, _ = self._tree.query(values, k=[k])
+        # the true k-th neighbor is at most drift closer and drift farther than in the tree
+        bounds = old[..., 0] + 2 * self._drift
+        flat = values.reshape(-1, 3)
+        distances = np.empty((len(flat), k))
+        indices = np.empty((len(flat), k), dtype=np.intp)
+        for row, (point, bound) in enumerate(zip(flat, np.ravel(bounds))):
+            candidates = np.asarray(self._tree.query_ball_point(point, bound), np.intp)
+            moved = self._current[candidates] - point
+            exact = np.sqrt(np.einsum("ij,ij->i", moved, moved))
+            order = np.argsort(exact, kind="stable")[:k]
+            distances[row], indices[row] = exact[order], candidates[order]
+        shape = values.shape[:-1] + (k,)
+        distances = QuantityArray(distances.reshape(shape), self.unit)
+        return distances, indices.reshape(shape)
+
+    def pairs(self, radius: Quantity) -> np.ndarray:
+        """(m, 2) array of index pairs i < j closer than radius"""
+        radius = self._length(radius)
+        pairs = self._tree.query_pairs(radius + 2 * self._drift, output_type="ndarray")
+        if self._drift:
+            moved = self._current[pairs[:, 0]] - self._current[pairs[:, 1]]
+            pairs = pairs[np.einsum("ij,ij->i", moved, moved) <= radius**2]
+        return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
@@ -0,0 +1,93 @@
+from time import perf_counter
+
+import numpy as np
+
+from classes import Unit, Quantity, QuantityArray, VectorArray
+from .forces import Force, ACCELERATION, LENGTH, expect
+from .integrators import INTEGRATORS
+
+
+MASS = Unit([1])
+SPEED = Unit([0, 1, -1])
+TIME = Unit([0, 0, 1])
+
+
+class ParticleSystem:
+    """Particles moved by pluggable force models
+
+    Units are checked once when the system is set up; the steps then run on raw SI arrays.
+    """
+
+    def __init__(
+        self,
+        positions: VectorArray,
+        velocities: VectorArray,
+        masses: QuantityArray | Quantity,
+        forces: list[Force] = (),
+        method: str = "verlet",
+    ) -> None:
+        """
+        positions: VectorArray of n positions with a length unit
+        velocities: VectorArray of n velocities with a speed unit
+        masses: QuantityArray of n masses or a single Quantity shared by all particles
+        forces: force models whose accelerations are added up
+        method: integration scheme, one of INTEGRATORS
+        """
+        if method not in INTEGRATORS:
+            raise ValueError(f"Unknown method: {method}")
+        self.method = method
+        self._x = expect(positions, LENGTH, "position").copy()
+        self._v = expect(velocities, SPEED, "velocity").copy()
+        if self._x.ndim != 2 or self._x.shape != self._v.shape:
+            raise ValueError("positions and velocities must have the same shape (n, 3)")
+        self.count = len(self._x)
+        self.masses = np.broadcast_to(expect(masses, MASS, "mass"), (self.count,))
+        self.forces = list(forces)
+        for force in self.forces:
+            force.bind(self)
+        self._a = self._acceleration(self._x, self._v)
+        self._time = 0.0
+        self.particle_steps_per_second = None
+
+    def _acceleration(self, positions: np.ndarray, velocities: np.ndarray):
+        total = np.zeros_like(positions)
+        for force in self.forces:
+            total += force.acceleration(positions, velocities)
+        return total
+
+    @property
+    def time(self) -> Quantity:
+        """time integrated so far"""
+        return Quantity(self._time, TIME)
+
+    @property
+    def positions(self) -> VectorArray:
+        return VectorArray(self._x.copy(), LENGTH)
+
+    @property
+    def velocities(self) -> VectorArray:
+        return VectorArray(self._v.copy(), SPEED)
+
+    @property
+    def accelerations(self) -> VectorArray:
+        return VectorArray(self._a.copy(), ACCELERATION)
+
+    @property
+    def kinetic_energy(self) -> Quantity:
+        speed_squared = np.einsum("ij,ij->i", self._v, self._v)
+        return Quantity(0.5 * np.dot(self.masses, speed_squared), MASS * SPEED**2)
+
+    def run(self, dt: Quantity, steps: int) -> "ParticleSystem":
+        """advance by steps steps of dt and record the throughput in particle steps per second"""
+        step = INTEGRATORS[self.method]
+        dt = float(expect(dt, TIME, "time step"))
+        x, v, a = self._x, self._v, self._a
+        start = perf_counter()
+        for _ in range(steps):
+            x, v, a = step(x, v, a, self._acceleration, dt)
+        elapsed = perf_counter() - start
+        self._x, self._v, self._a = x, v, a
+        self._time += dt * steps
+        if elapsed > 0:
+            self.particle_steps_per_second = self.count * steps / elapsed
+        return self
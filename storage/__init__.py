@@ -0,0 +1,3 @@
+from .chunked import read_chunks, write_chunks, ChunkWriter
+from .mapped import save_mapped, load_mapped, append_mapped, flush_mapped, read_header
+from .binary import encode, decode, encode_many, decode_many
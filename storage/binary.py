@@ -0,0 +1,171 @@
+"""
+Compact binary encoding of quantities and vectors.
+
+A message starts with MAGIC and a version byte, followed by runs of objects. A run holds objects
+of the same kind, unit and value type:
+
+    kind (1 byte)  value type (1 byte)  unit  number of values (varint)  values
+
+The unit is written once per run as its packed code (see classes.packed) in a zigzag varint,
+usually one or two bytes, or for non-integer exponents as a marker followed by seven float64.
+The values of a run are one contiguous little-endian array, one value per quantity and three per
+vector. Names are not encoded; they are looked up again when needed.
+"""
+import numpy as np
+
+from classes import Unit, Quantity, Vector, NO_UNIT
+
+# the constructors are called through their modules, so that classes.instrument sees them
+from classes import quantity, vector
+
+
+MAGIC = b"\x93PWB"
+VERSION = 1
+
+QUANTITY = 1
+VECTOR = 2
+# value type codes and their dtypes
+_DTYPES = {
+    ord("q"): np.dtype("<i8"),
+    ord("d"): np.dtype("<f8"),
+    ord("D"): np.dtype("<c16"),
+}
+_FRACTIONAL = 1
+
+
+_CODES = {int: ord("q"), bool: ord("q"), float: ord("d"), complex: ord("D")}
+
+
+def _code_of(value) -> int:
+    """value type code of a number"""
+    code = _CODES.get(type(value))
+    if code is None:
+        if not np.isscalar(value):
+            raise TypeError(f"cannot encode values of type {type(value).__name__}")
+        code = ord("D") if np.iscomplexobj(value) else ord("d")
+    return code
+
+
+def _common_code(*values) -> int:
+    """value type code able to hold all values"""
+    codes = {_code_of(value) for value in values}
+    if len(codes) == 1:
+        return codes.pop()
+    return ord("D") if ord("D") in codes else ord("d")
+
+
+def _write_varint(out: bytearray, number: int) -> None:
+    while number > 0x7F:
+        out.append((number & 0x7F) | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _read_varint(data, position: int) -> tuple[int, int]:
+    number, shift = 0, 0
+    while True:
+        byte = data[position]
+        position += 1
+        number |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return number, position
+        shift += 7
+
+
+def _write_unit(out: bytearray, unit: Unit) -> None:
+    code = unit._packed
+    if code is None:
+        out.append(_FRACTIONAL)
+        out += np.asarray(unit._nums, dtype="<f8").tobytes()
+    else:
+        zigzag = code << 1 if code >= 0 else ((-code) << 1) - 1
+        _write_varint(out, zigzag << 1)
+
+
+def _read_unit(data, position: int) -> tuple[Unit, int]:
+    field, position = _read_varint(data, position)
+    if field & _FRACTIONAL:
+        nums = np.frombuffer(data, "<f8", 7, position)
+        return Unit(nums.tolist()), position + 56
+    zigzag = field >> 1
+    code = zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1)
+    return Unit.from_packed(code), position
+
+
+def encode_many(items) -> bytes:
+    """encode a sequence of quantities, vectors and numbers, runs sharing a unit share its bytes"""
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    run_key, run = None, []
+
+    def flush() -> None:
+        kind, unit, code = run_key
+        out.append(kind)
+        out.append(code)
+        _write_unit(out, unit)
+        _write_varint(out, len(run))
+        out.extend(np.array(run, dtype=_DTYPES[code]).tobytes())
+
+    for item in items:
+        if type(item) == Quantity:
+            key = (QUANTITY, item.unit, _code_of(item.value))
+            values = (item.value,)
+        elif type(item) == Vector:
+            unit = item.unit if item.unit is not None else NO_UNIT
+            values = (item._x, item._y, item._z)
+            key = (VECTOR, unit, _common_code(*values))
+        elif isinstance(item, (int, float, complex)):
+            key = (QUANTITY, NO_UNIT, _code_of(item))
+            values = (item,)
+        else:
+            raise TypeError(f"cannot encode {type(item).__name__}")
+        if key != run_key:
+            if run:
+                flush()
+            run_key, run = key, []
+        run.extend(values)
+    if run:
+        flush()
+    return bytes(out)
+
+
+def decode_many(data: bytes) -> list:
+    """decode all objects of a message produced by encode_many or encode"""
+    data = memoryview(data)
+    if bytes(data[: len(MAGIC)]) != MAGIC:
+        raise ValueError("not a binary quantity message")
+    version = data[len(MAGIC)]
+    if version > VERSION:
+        raise ValueError(f"Unsupported version {version}")
+    position = len(MAGIC) + 1
+    items = []
+    while position < len(data):
+        kind, code = data[position], data[position + 1]
+        unit, position = _read_unit(data, position + 2)
+        count, position = _read_varint(data, position)
+        dtype = _DTYPES[code]
+        values = np.frombuffer(data, dtype, count, position).tolist()
+        position += count * dtype.itemsize
+        if kind == QUANTITY:
+            items.extend(quantity._new(value, unit) for value in values)
+        elif kind == VECTOR:
+            vector_unit = unit if unit is not NO_UNIT else None
+            items.extend(
+                vector._new(*values[i : i + 3], vector_unit) for i in range(0, count, 3)
+            )
+        else:
+            raise ValueError(f"Unknown kind {kind}")
+    return items
+
+
+def encode(item) -> bytes:
+    """encode a single Quantity, Vector or number"""
+    return encode_many((item,))
+
+
+def decode(data: bytes):
+    """decode a message holding a single object"""
+    items = decode_many(data)
+    if len(items) != 1:
+        raise ValueError(f"expected one object, got {len(items)}")
+    return items[0]
@@ -0,0 +1,167 @@
+import re
+from itertools import islice
+
+import numpy as np
+
+from classes import Unit, QuantityArray, VectorArray, NO_UNIT
+from classes.unit import BASE_SI
+
+
+# header cells look like "label [dimension]"; the dimension is a name from Unit.dimensions
+# or a composition of BASE_SI units like "kg m s^-2"; a bare cell is read as a dimension name
+_CELL = re.compile(r"^(?P<label>.*?)\s*\[(?P<dim>[^\]]*)\]$")
+_COMPONENTS = (".x", ".y", ".z")
+BINARY_DTYPE = np.dtype("<f8")
+
+
+def parse_unit(text: str) -> Unit:
+    """unit from a dimension name or a BASE_SI composition as given by str(unit)"""
+    if text in Unit.dimensions:
+        return Unit.from_dict(text)
+    nums = [0] * 7
+    for token in text.split():
+        symbol, _, exponent = token.partition("^")
+        if symbol not in BASE_SI:
+            raise ValueError(f"Unknown dimension or unit: {text}")
+        nums[BASE_SI.index(symbol)] += float(exponent) if exponent else 1
+    return Unit(nums)
+
+
+def format_unit(unit: Unit) -> str:
+    """dimension name of a unit if it has one, otherwise its BASE_SI composition"""
+    name = unit.get_name()
+    return name if name and "," not in name else str(unit)
+
+
+def _parse_header(line: str) -> list[tuple[str, Unit, list[int]]]:
+    """resolve the header once into (label, unit, column indices) per quantity or vector"""
+    columns = {}
+    for i, cell in enumerate(c.strip() for c in line.strip().split(",")):
+        match = _CELL.match(cell)
+        if match:
+            label, unit = match["label"], parse_unit(match["dim"])
+        elif cell in Unit.dimensions:
+            label, unit = cell, Unit.from_dict(cell)
+        else:
+            label, unit = cell, NO_UNIT
+        if label[-2:] in _COMPONENTS:
+            label = label[:-2]
+        if label in columns:
+            if columns[label][0] != unit:
+                raise ValueError(f"Components of {label} have different units")
+            columns[label][1].append(i)
+        else:
+            columns[label] = (unit, [i])
+    for label, (_, indices) in columns.items():
+        if len(indices) not in (1, 3):
+            raise ValueError(f"Column {label} needs one or three components")
+    return [(label, unit, indices) for label, (unit, indices) in columns.items()]
+
+
+def _to_chunk(rows: np.ndarray, header) -> dict:
+    chunk = {}
+    for label, unit, indices in header:
+        if len(indices) == 3:
+            chunk[label] = VectorArray(rows[:, indices], unit, label)
+        else:
+            chunk[label] = QuantityArray(rows[:, indices[0]], unit, label)
+    return chunk
+
+
+def read_chunks(path, chunk_size: int = 65536, binary: bool | None = None):
+    """
+    Stream a unit-annotated file, yielding dicts of label -> QuantityArray, VectorArray or,
+    for dimensionless columns, ndarray with at most chunk_size rows each.
+
+    The first line holds the comma-separated header, e.g. "t [time], position.x [length], ...".
+    Columns ending in .x, .y and .z are combined into vectors. The header is followed by
+    comma-separated rows, or for binary files (default for the .bin suffix) by raw little-endian
+    float64 rows.
+    """
+    if binary is None:
+        binary = str(path).endswith(".bin")
+    with open(path, "rb") as file:
+        header = _parse_header(file.readline().decode())
+        n_columns = sum(len(indices) for _, _, indices in header)
+        while True:
+            if binary:
+                row_size = n_columns * BINARY_DTYPE.itemsize
+                data = file.read(chunk_size * row_size)
+                if len(data) % row_size:
+                    raise ValueError(
+                        f"{path} is truncated: {len(data) % row_size} bytes left over "
+                        f"after the last complete row of {n_columns} columns"
+                    )
+                rows = np.frombuffer(data, dtype=BINARY_DTYPE).reshape(-1, n_columns)
+            else:
+                lines = [line for line in islice(file, chunk_size) if line.strip()]
+                if not lines:
+                    break
+                rows = np.loadtxt(lines, delimiter=",", ndmin=2)
+            if len(rows) == 0:
+                break
+            yield _to_chunk(rows, header)
+
+
+class ChunkWriter:
+    """
+    Write chunks as yielded by read_chunks to a file in the same format.
+
+    The header is taken from the first chunk; later chunks need the same labels and units.
+    """
+
+    def __init__(self, path, binary: bool | None = None) -> None:
+        if binary is None:
+            binary = str(path).endswith(".bin")
+        self.binary = binary
+        self.file = open(path, "wb")
+        self.header = None
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.file.close()
+
+    def write(self, chunk: dict) -> None:
+        if self.header is None:
+            self.header = [
+                (label, _unit(value), isinstance(value, VectorArray))
+                for label, value in chunk.items()
+            ]
+            self.file.write((self._header_line() + "\n").encode())
+        columns = []
+        for label, unit, _ in self.header:
+            value = chunk[label]
+            if _unit(value) != unit:
+                raise ValueError(f"Unit of column {label} changed")
+            columns.append(np.asarray(getattr(value, "value", value), dtype=float))
+        rows = np.column_stack(columns)
+        if self.binary:
+            self.file.write(rows.astype(BINARY_DTYPE).tobytes())
+        else:
+            np.savetxt(self.file, rows, delimiter=",", fmt="%.17g")
+
+    def _header_line(self) -> str:
+        cells = []
+        for label, unit, is_vector in self.header:
+            dim = f" [{format_unit(unit)}]" if unit != NO_UNIT else ""
+            if is_vector:
+                cells += [f"{label}{c}{dim}" for c in _COMPONENTS]
+            else:
+                cells.append(f"{label}{dim}")
+        return ",".join(cells)
+
+
+def _unit(value) -> Unit:
+    return getattr(value, "unit", NO_UNIT)
+
+
+def write_chunks(path, chunks, binary: bool | None = None) -> None:
+    """write an iterable of chunks as yielded by read_chunks"""
+    with ChunkWriter(path, binary) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
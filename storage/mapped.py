@@ -0,0 +1,126 @@
+import json
+
+import numpy as np
+
+from classes import Unit, QuantityArray, VectorArray, IncompatibleUnitsError, NO_UNIT
+
+
+# a file starts with MAGIC and a JSON header padded to HEADER_SIZE bytes, followed by the raw
+# values; the header keeps the data page aligned, so it can be memory-mapped without copying
+MAGIC = b"\x93PWU"
+VERSION = 1
+HEADER_SIZE = 4096
+# VectorArray holds float64, so vector files always hold little-endian float64 to be mapped as is
+VECTOR_DTYPE = np.dtype("<f8")
+
+
+def _header(array) -> dict:
+    if isinstance(array, VectorArray):
+        kind, values = "vector", array.value.astype(VECTOR_DTYPE, copy=False)
+    elif isinstance(array, QuantityArray):
+        kind, values = "quantity", array.value
+    else:
+        kind, values = "quantity", np.asarray(array)
+    unit = getattr(array, "unit", NO_UNIT)
+    return {
+        "version": VERSION,
+        "kind": kind,
+        "unit": list(unit._nums),
+        "name": getattr(array, "name", None),
+        "dtype": values.dtype.newbyteorder("<").str,
+        "shape": list(values.shape[1:]),
+        "length": len(values),
+    }
+
+
+def _write_header(file, header: dict) -> None:
+    text = json.dumps(header).encode()
+    if len(MAGIC) + len(text) + 1 > HEADER_SIZE:
+        raise ValueError("Header too large")
+    file.seek(0)
+    file.write(MAGIC + text.ljust(HEADER_SIZE - len(MAGIC) - 1) + b"\n")
+
+
+def read_header(path) -> dict:
+    """header of a mapped file, holding kind, unit exponents, name, dtype, shape and length"""
+    with open(path, "rb") as file:
+        block = file.read(HEADER_SIZE)
+    if not block.startswith(MAGIC):
+        raise ValueError(f"{path} is not a mapped quantity file")
+    header = json.loads(block[len(MAGIC) :])
+    if header["version"] > VERSION:
+        raise ValueError(f"Unsupported version {header['version']}")
+    return header
+
+
+def _values(array) -> np.ndarray:
+    values = getattr(array, "value", array)
+    if isinstance(array, VectorArray):
+        return np.ascontiguousarray(values, dtype=VECTOR_DTYPE)
+    return np.ascontiguousarray(
+        values, dtype=np.asarray(values).dtype.newbyteorder("<")
+    )
+
+
+def save_mapped(path, array) -> None:
+    """
+    save a QuantityArray, VectorArray or ndarray to a memory-mappable file; values of a
+    VectorArray are stored as float64, other values keep their dtype
+    """
+    with open(path, "wb") as file:
+        _write_header(file, _header(array))
+        file.write(_values(array).tobytes())
+
+
+def load_mapped(path, mode: str = "r"):
+    """
+    Open a mapped file without reading its values; pages are loaded on access.
+    Returns a QuantityArray, VectorArray or for dimensionless data an ndarray backed by the file.
+    mode: "r" for read-only, "r+" to write changes back to the file, "c" for copy-on-write
+    """
+    header = read_header(path)
+    if header["kind"] == "vector" and np.dtype(header["dtype"]) != VECTOR_DTYPE:
+        # VectorArray would silently copy the values into memory
+        raise ValueError(
+            f"Vector files must hold float64 values, not {header['dtype']}"
+        )
+    shape = (header["length"], *header["shape"])
+    if header["length"]:
+        values = np.memmap(
+            path, dtype=header["dtype"], mode=mode, offset=HEADER_SIZE, shape=shape
+        )
+    else:
+        values = np.empty(shape, dtype=header["dtype"])
+    unit = Unit(header["unit"])
+    if header["kind"] == "vector":
+        return VectorArray(values, unit, header["name"])
+    return QuantityArray(values, unit, header["name"])
+
+
+def flush_mapped(array) -> None:
+    """write changes to an array loaded with mode "r+" back to its file; no-op if not mapped"""
+    values = getattr(array, "value", array)
+    while values is not None and not isinstance(values, np.memmap):
+        values = values.base
+    if values is not None:
+        values.flush()
+
+
+def append_mapped(path, array) -> int:
+    """append values with the same unit and row shape to a mapped file, return the new length"""
+    header = read_header(path)
+    new = _header(array)
+    unit, new_unit = Unit(header["unit"]), Unit(new["unit"])
+    if unit != new_unit:
+        raise IncompatibleUnitsError("append", str(new_unit), str(unit))
+    if new["kind"] != header["kind"] or new["shape"] != header["shape"]:
+        raise ValueError("Cannot append values of a different shape")
+    values = _values(array).astype(header["dtype"], copy=False)
+    row_size = values.itemsize * int(np.prod(header["shape"], dtype=int))
+    with open(path, "r+b") as file:
+        file.seek(HEADER_SIZE + header["length"] * row_size)
+        file.write(values.tobytes())
+        file.truncate()
+        header["length"] += len(values)
+        _write_header(file, header)
+    return header["length"]
@@ -1,6 +1,13 @@
 import pytest
 
 from classes import Unit, Quantity
+from classes import registry
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """keep compiled dimension registries out of the user's cache directory"""
+    monkeypatch.setattr(registry, "CACHE_DIR", tmp_path / "registry-cache")
 
 
 @pytest.fixture
@@ -26,3 +33,20 @@ def hertz():
 @pytest.fixture
 def one_kilo(kilo):
     return Quantity(1, kilo)
+
+
+@pytest.fixture
+def restore_dimensions():
+    """undo changes a test makes to the registered dimensions and the naming of units"""
+    dimensions = dict(Unit.dimensions)
+    names = {unit: list(n) for unit, n in Unit._names.items()}
+    preferred = dict(Unit._preferred)
+    policy = Unit.name_policy
+    yield
+    Unit.dimensions.clear()
+    Unit.dimensions.update(dimensions)
+    Unit._names.clear()
+    Unit._names.update(names)
+    Unit._preferred.clear()
+    Unit._preferred.update(preferred)
+    Unit.name_policy = policy
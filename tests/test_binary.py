@@ -0,0 +1,67 @@
+import pickle
+
+import pytest
+
+from classes import Unit, Quantity, Vector, NO_UNIT
+from storage import encode, decode, encode_many, decode_many
+
+
+def test_roundtrip(meter, second):
+    items = [
+        Quantity(2.5, meter),
+        Quantity(3, meter),
+        Quantity(1 + 2j, meter / second),
+        Vector(1, 2.5, 3, meter),
+        Vector(1, 2, 3),
+        4.0,
+        Quantity(2.0, Unit([0.5])),
+    ]
+    decoded = decode_many(encode_many(items))
+    assert len(decoded) == len(items)
+    for item, result in zip(items, decoded):
+        assert type(result) == type(item)
+        if isinstance(item, Vector):
+            assert result == item
+        elif isinstance(item, Quantity):
+            assert result.value == item.value and result.unit is item.unit
+        else:
+            assert result == item
+    assert type(decoded[1].value) is int
+
+
+def test_single(meter):
+    data = encode(Quantity(2.0, meter))
+    assert len(data) == 18
+    assert len(data) * 5 < len(pickle.dumps(Quantity(2.0, meter)))
+    assert decode(data).unit is meter
+    with pytest.raises(ValueError):
+        decode(encode_many([1.0, 2.0]))
+
+
+def test_compact_stream(meter, second):
+    stream = [Quantity(float(i), meter / second) for i in range(1000)]
+    data = encode_many(stream)
+    assert len(data) < 8100
+    assert len(data) * 2 < len(pickle.dumps(stream))
+    assert [q.value for q in decode_many(data)] == [q.value for q in stream]
+
+
+def test_version(meter):
+    data = bytearray(encode(Quantity(1.0, meter)))
+    data[4] = 99
+    with pytest.raises(ValueError):
+        decode(bytes(data))
+    with pytest.raises(ValueError):
+        decode(b"nonsense")
+    with pytest.raises(TypeError):
+        encode("text")
+
+
+def test_pickle(meter):
+    q = Quantity(2.0, meter, "distance")
+    restored = pickle.loads(pickle.dumps(q))
+    assert restored.name == "distance" and restored.unit is meter
+    v = pickle.loads(pickle.dumps(Vector(1, 2, 3, meter)))
+    assert v == Vector(1, 2, 3, meter) and v.name == "length"
+    assert pickle.loads(pickle.dumps(Vector(1, 2, 3))).unit is None
+    assert pickle.loads(pickle.dumps(NO_UNIT)) is NO_UNIT
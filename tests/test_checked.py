@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+from classes import (
+    IncompatibleUnitsError,
+    NO_UNIT,
+    Quantity,
+    QuantityArray,
+    Unit,
+    Vector,
+    unit_checked,
+)
+from constants import Constant
+
+
+@pytest.fixture
+def speed(meter, second):
+    return meter / second
+
+
+@unit_checked
+def kinetic_energy(m, v):
+    return 0.5 * m * v**2
+
+
+def test_checked_once(kilo, speed):
+    e1 = kinetic_energy(Quantity(2.0, kilo), Quantity(3.0, speed))
+    assert len(kinetic_energy.signatures) == 1
+    e2 = kinetic_energy(Quantity(4.0, kilo), Quantity(1.0, speed))
+    assert e1.value == 9.0
+    assert e2.value == 2.0
+    assert e1.unit == e2.unit == Unit([1, 2, -2])
+
+
+def test_arrays(kilo, speed):
+    masses = QuantityArray([1.0, 2.0], kilo)
+    energies = kinetic_energy(masses, Quantity(2.0, speed))
+    energies = kinetic_energy(masses, Quantity(2.0, speed))
+    assert type(energies) == QuantityArray
+    assert np.array_equal(energies.value, [2, 4])
+
+
+def test_incompatible(kilo, meter):
+    @unit_checked
+    def total(a, b):
+        return a + b
+
+    with pytest.raises(IncompatibleUnitsError):
+        total(Quantity(1, kilo), Quantity(1, meter))
+    assert total.signatures == {}
+
+
+def test_check(kilo, speed):
+    assert kinetic_energy.check(kilo, speed) == Unit([1, 2, -2])
+    assert kinetic_energy.check(kilo, NO_UNIT) == kilo
+
+
+def test_internal_constants(second):
+    @unit_checked
+    def distance(t):
+        return Constant.c * t
+
+    d1 = distance(Quantity(1.0, second))
+    d2 = distance(Quantity(2.0, second))
+    assert d2.unit == d1.unit == Unit([0, 1])
+    assert d2.value == 2 * Constant.c.value
+
+
+def test_vectors(meter, second):
+    @unit_checked
+    def velocity(r, t):
+        return r / t
+
+    v1 = velocity(Vector(1, 2, 3, meter), Quantity(2.0, second))
+    v2 = velocity(Vector(2, 4, 6, meter), Quantity(2.0, second))
+    assert v2.unit == v1.unit == meter / second
+    assert v2 == Vector(1, 2, 3, meter / second)
+
+
+def test_single_evaluation(meter):
+    calls = []
+
+    @unit_checked
+    def scaled(a, factor):
+        calls.append(a)
+        return a * factor
+
+    scaled(Quantity(1.0, meter), 2)
+    # the first call runs the function once, with units
+    assert len(calls) == 1
+    assert scaled(Quantity(2.0, meter), 2).value == 4.0
+    with pytest.raises(TypeError):
+        scaled(Quantity(3.0, meter), None)
+    assert len(calls) == 3
+
+
+def test_plain_arguments(meter):
+    @unit_checked
+    def power(x, n):
+        return x**n
+
+    assert power(Quantity(2.0, meter), 2).unit == meter**2
+    cubed = power(Quantity(2.0, meter), 3)
+    assert cubed.unit == meter**3
+    assert cubed.value == 8.0
+
+    @unit_checked
+    def length(a, items):
+        return a * len(items)
+
+    length(Quantity(1.0, meter), [1, 2])
+    # unhashable plain arguments are never cached
+    assert length(Quantity(1.0, meter), [1, 2, 3]).value == 3.0
+    assert length.signatures == {}
+
+
+def test_units_required_decided_once(second):
+    calls = []
+
+    @unit_checked(probe=True)
+    def shifted(t):
+        calls.append(t)
+        return t + Quantity(1.0, second)
+
+    shifted(Quantity(1.0, second))
+    # the probe runs the function a second time on raw values
+    assert len(calls) == 2
+    calls.clear()
+    assert shifted(Quantity(2.0, second)).value == 3.0
+    assert len(calls) == 1
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from classes import QuantityArray, Unit, VectorArray
+from storage import ChunkWriter, read_chunks, write_chunks
+
+
+CSV = """t [time], position.x [length], position.y [length], position.z [length], id
+0, 1, 2, 3, 7
+1, 4, 5, 6, 8
+2, 7, 8, 9, 9
+"""
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text(CSV)
+    return path
+
+
+def test_read_chunks(csv_file, second, meter):
+    chunks = list(read_chunks(csv_file, chunk_size=2))
+    assert [len(c["t"]) for c in chunks] == [2, 1]
+    first = chunks[0]
+    assert type(first["t"]) == QuantityArray
+    assert first["t"].unit == second
+    assert type(first["position"]) == VectorArray
+    assert first["position"].unit == meter
+    assert np.array_equal(first["position"].value, [[1, 2, 3], [4, 5, 6]])
+    assert type(first["id"]) == np.ndarray
+
+
+def test_bare_dimension_header(tmp_path, restore_dimensions):
+    Unit.update_dimensions("mechanics")
+    path = tmp_path / "forces.csv"
+    path.write_text("force, weird [kg m^2 s^-3 A^-1]\n1.5, 2\n")
+    (chunk,) = read_chunks(path)
+    assert chunk["force"].unit == Unit.from_dict("force")
+    assert chunk["weird"].unit == Unit([1, 2, -3, 0, -1])
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".bin"])
+def test_roundtrip(csv_file, tmp_path, suffix):
+    out = tmp_path / f"copy{suffix}"
+    write_chunks(out, read_chunks(csv_file, chunk_size=2))
+    original = list(read_chunks(csv_file, chunk_size=10))[0]
+    copy = list(read_chunks(out, chunk_size=10))[0]
+    assert copy.keys() == original.keys()
+    for label in original:
+        assert np.array_equal(
+            np.asarray(getattr(copy[label], "value", copy[label])),
+            np.asarray(getattr(original[label], "value", original[label])),
+        )
+        assert getattr(copy[label], "unit", None) == getattr(
+            original[label], "unit", None
+        )
+
+
+def test_writer_unit_change(tmp_path, meter, second):
+    with ChunkWriter(tmp_path / "out.csv") as writer:
+        writer.write({"x": QuantityArray([1.0], meter)})
+        with pytest.raises(ValueError):
+            writer.write({"x": QuantityArray([1.0], second)})
+
+
+def test_truncated_binary(csv_file, tmp_path):
+    out = tmp_path / "copy.bin"
+    write_chunks(out, read_chunks(csv_file))
+    out.write_bytes(out.read_bytes()[:-3])
+    with pytest.raises(ValueError, match="truncated"):
+        list(read_chunks(out))
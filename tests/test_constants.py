@@ -0,0 +1,48 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from classes import Quantity, Unit
+from constants import Constant
+from constants.constants import CODATA, _LAZY
+
+
+def test_no_scipy_on_import():
+    statement = "import sys, constants; assert 'scipy' not in sys.modules"
+    root = Path(__file__).resolve().parent.parent
+    subprocess.run([sys.executable, "-c", statement], cwd=root, check=True)
+
+
+def test_cached():
+    assert Constant.c is Constant.c
+    assert type(Constant.c) == Quantity
+    assert Constant.c.name == "speed of light"
+
+
+def test_derived():
+    assert Constant.coulomb.unit == Unit([1, 3, -4, 0, -2])
+    assert Constant.hbar.value == pytest.approx(1.054571817e-34)
+
+
+def test_matches_scipy():
+    sc = pytest.importorskip("scipy.constants")
+    for key, value in CODATA.items():
+        assert value == pytest.approx(getattr(sc, key), rel=1e-8)
+
+
+@pytest.fixture
+def restore_codata():
+    saved = dict(CODATA)
+    yield
+    CODATA.update(saved)
+    for name, attribute in _LAZY.items():
+        setattr(Constant, name, attribute)
+
+
+def test_use_scipy(restore_codata):
+    pytest.importorskip("scipy.constants")
+    Constant.use_scipy()
+    assert type(Constant.e_0) == Quantity
+    assert Constant.coulomb.unit == Unit([1, 3, -4, 0, -2])
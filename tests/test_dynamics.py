@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from classes import Quantity, QuantityArray, VectorArray, IncompatibleUnitsError
+from constants import Constant
+from dynamics import ParticleSystem, Force, UniformGravity, Coulomb, INTEGRATORS
+
+
+def _system(n=4, forces=(), method="verlet", velocity_unit="m/s"):
+    positions = VectorArray(np.arange(3.0 * n).reshape(n, 3), "length")
+    velocities = VectorArray(np.zeros((n, 3)), velocity_unit)
+    return ParticleSystem(positions, velocities, Quantity(2.0, "mass"), forces, method)
+
+
+@pytest.mark.parametrize("method", ["verlet", "rk4"])
+def test_free_fall(method):
+    system = _system(forces=[UniformGravity()], method=method)
+    start = system.positions.value
+    system.run(Quantity(0.01, "time"), 100)
+    assert system.time.value == pytest.approx(1.0)
+    drop = start[:, 2] - system.positions.value[:, 2]
+    assert np.allclose(drop, Constant.g.value / 2)
+    assert np.allclose(system.velocities.value[:, 2], -Constant.g.value)
+    assert system.particle_steps_per_second > 0
+
+
+def test_euler_converges():
+    coarse = _system(forces=[UniformGravity()], method="euler")
+    fine = _system(forces=[UniformGravity()], method="euler")
+    coarse.run(Quantity(0.1, "time"), 10)
+    fine.run(Quantity(0.001, "time"), 1000)
+    exact = np.arange(12.0).reshape(4, 3)[:, 2] - Constant.g.value / 2
+    error = lambda s: np.abs(s.positions.value[:, 2] - exact).max()
+    assert error(fine) < error(coarse) / 50
+
+
+def test_coulomb_pair():
+    positions = VectorArray([[0.0, 0, 0], [1.0, 0, 0]], "length")
+    velocities = VectorArray(np.zeros((2, 3)), "m/s")
+    charges = QuantityArray([1e-6, 1e-6], "C")
+    system = ParticleSystem(
+        positions, velocities, Quantity(1.0, "mass"), [Coulomb(charges, block=1)]
+    )
+    a = system.accelerations.value
+    expected = Constant.coulomb.value * 1e-12
+    assert a[1, 0] == pytest.approx(expected)
+    assert np.allclose(a[0], -a[1])
+    cut = ParticleSystem(
+        positions,
+        velocities,
+        Quantity(1.0, "mass"),
+        [Coulomb(charges, Quantity(0.5, "length"))],
+    )
+    assert np.all(cut.accelerations.value == 0)
+
+
+def test_coulomb_coincident():
+    positions = VectorArray([[0.0, 0, 0], [0.0, 0, 0], [1.0, 0, 0]], "length")
+    velocities = VectorArray(np.zeros((3, 3)), "m/s")
+    charges = QuantityArray([1e-6, 1e-6, 1e-6], "C")
+    system = ParticleSystem(
+        positions, velocities, Quantity(1.0, "mass"), [Coulomb(charges)]
+    )
+    a = system.accelerations.value
+    assert np.all(np.isfinite(a))
+    assert a[2, 0] == pytest.approx(2 * Constant.coulomb.value * 1e-12)
+
+
+def test_force_is_abstract():
+    with pytest.raises(TypeError):
+        Force()
+
+
+def test_energy_conserved():
+    positions = VectorArray([[0.0, 0, 0], [1.0, 0, 0]], "length")
+    velocities = VectorArray([[0.0, 0, 0], [0.0, 0, 0]], "m/s")
+    charges = QuantityArray([1e-5, 1e-5], "C")
+    masses = QuantityArray([1.0, 1.0], "mass")
+    for method in INTEGRATORS:
+        system = ParticleSystem(
+            positions, velocities, masses, [Coulomb(charges)], method
+        )
+        system.run(Quantity(1e-3, "time"), 200)
+        distance = system.positions.value[1, 0] - system.positions.value[0, 0]
+        potential = Constant.coulomb.value * 1e-10 * (1 - 1 / distance)
+        assert system.kinetic_energy.value == pytest.approx(potential, rel=1e-2)
+
+
+def test_units_checked_once():
+    with pytest.raises(IncompatibleUnitsError):
+        _system(velocity_unit="length")
+    with pytest.raises(IncompatibleUnitsError):
+        _system().run(0.01, 1)
+    with pytest.raises(IncompatibleUnitsError):
+        _system(forces=[Coulomb(Quantity(1.0, "mass"))])
+    with pytest.raises(ValueError):
+        _system(method="leapfrog")
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from classes import Unit, QuantityArray, VectorArray, IncompatibleUnitsError
+from constants import Constant
+from dynamics import grid, electric_field, magnetic_field, poynting, energy_density
+
+
+CHARGE = Unit([0, 0, 1, 0, 1])
+
+
+def test_grid(meter):
+    axis = QuantityArray(np.linspace(-1, 1, 5), meter)
+    points = grid(axis, axis, QuantityArray([0.0, 1.0], meter))
+    assert points.value.shape == (5, 5, 2, 3)
+    assert np.array_equal(points.value[4, 0, 1], [1, -1, 1])
+
+
+def test_point_charge(meter):
+    axis = QuantityArray(np.linspace(-2, 2, 9), meter)
+    points = grid(axis, axis, axis)
+    positions = VectorArray([[0.0, 0, 0]], meter)
+    charges = QuantityArray([1e-9], CHARGE)
+    field = electric_field(points, positions, charges)
+    assert field.unit is Unit([1, 1, -3, 0, -1])
+    r = points.value[8, 4, 4]
+    assert np.allclose(field.value[8, 4, 4], Constant.coulomb.value * 1e-9 * r / 8)
+    assert np.all(field.value[4, 4, 4] == 0)
+
+
+def test_chunked_superposition(meter):
+    rng = np.random.default_rng(0)
+    points = VectorArray(rng.random((200, 3)) * 4 - 2, meter)
+    positions = VectorArray(rng.random((30, 3)), meter)
+    charges = QuantityArray(rng.normal(size=30) * 1e-9, CHARGE)
+    whole = electric_field(points, positions, charges)
+    chunked = electric_field(points, positions, charges, chunk_size=7)
+    assert np.allclose(whole.value, chunked.value)
+    elements = VectorArray(rng.random((30, 3)), Unit([0, 1, 0, 0, 1]))
+    h = magnetic_field(points, positions, elements)
+    assert np.allclose(h.value, magnetic_field(points, positions, elements, 5).value)
+
+
+def test_current_element(meter):
+    points = VectorArray([[2.0, 0, 0]], meter)
+    positions = VectorArray([[0.0, 0, 0]], meter)
+    elements = VectorArray([[0, 0, 3.0]], Unit([0, 1, 0, 0, 1]))
+    h = magnetic_field(points, positions, elements)
+    assert h.unit is Unit([0, -1, 0, 0, 1])
+    assert np.allclose(h.value, [[0, 3 / (4 * np.pi * 4), 0]])
+
+
+def test_derived(meter):
+    e = VectorArray([[6.8, 0, 0]] * 3, Unit([1, 1, -3, 0, -1]))
+    h = VectorArray([[0, 9.3, 0]] * 3, Unit([0, -1, 0, 0, 1]))
+    s = poynting(e, h, chunk_size=2)
+    assert s.unit is Unit([1, 0, -3])
+    assert np.allclose(s.value, [[0, 0, 6.8 * 9.3]] * 3)
+    u = energy_density(e, h, chunk_size=2)
+    assert u.unit is Unit([1, -1, -2])
+    expected = (Constant.e_0.value * 6.8**2 + Constant.mu_0.value * 9.3**2) / 2
+    assert np.allclose(u.value, expected)
+    with pytest.raises(IncompatibleUnitsError):
+        poynting(h, e)
+
+
+def test_units_checked(meter, second):
+    points = VectorArray(np.zeros((2, 3)), meter)
+    with pytest.raises(IncompatibleUnitsError):
+        electric_field(points, points, QuantityArray([1.0, 1.0], second))
+    with pytest.raises(IncompatibleUnitsError):
+        electric_field(
+            VectorArray(np.zeros((2, 3)), second),
+            points,
+            QuantityArray([1.0, 1.0], CHARGE),
+        )
@@ -0,0 +1,91 @@
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from classes import IncompatibleUnitsError, Quantity, Tensor, Unit, Vector, instrument
+from storage import decode_many, encode_many
+
+
+def test_counts(kilo, meter):
+    with instrument() as profile:
+        a = Quantity(2.0, kilo)
+        b = Quantity(3.0, meter)
+        _ = a * b
+        _ = Vector(1, 2, 3, meter)
+        _ = str(a)
+        with pytest.raises(IncompatibleUnitsError):
+            _ = a + b
+    summary = profile.summary(by_site=False)
+    assert summary["quantity construction"]["count"] == 3
+    assert summary["vector construction"]["count"] == 1
+    assert summary["unit multiply"]["count"] == 1
+    assert summary["incompatible units"]["count"] == 1
+    assert summary["dimension lookup"]["count"] == 1
+    assert summary["unit multiply"]["seconds"] > 0
+
+
+def test_fast_constructors(meter):
+    data = encode_many(
+        [Quantity(1.0, meter), Quantity(2.0, meter), Vector(1, 2, 3, meter)]
+    )
+    tensor = Tensor(np.eye(3), meter)
+    with instrument() as profile:
+        decode_many(data)
+        tensor.row(0)
+    summary = profile.summary(by_site=False)
+    assert summary["quantity construction"]["count"] == 2
+    assert summary["vector construction"]["count"] == 2
+
+
+def test_pickle(meter):
+    with instrument():
+        q = Quantity(1.0, meter) * 2
+        v = Vector(1, 2, 3, meter) * 2
+        assert pickle.loads(pickle.dumps(q)) == q
+        assert pickle.loads(pickle.dumps(v)) == v
+    assert pickle.loads(pickle.dumps(q)) == q
+
+
+def test_call_sites(kilo):
+    with instrument() as profile:
+        for _ in range(3):
+            _ = Quantity(1.0, kilo) * 2
+    sites = profile.summary()["quantity construction"]
+    assert all(site.startswith(__file__) for site in sites)
+    assert sum(s["count"] for s in sites.values()) == 6
+    assert "quantity construction" in profile.table()
+
+
+def test_disabled_restores_methods():
+    original = Unit.__dict__["__mul__"]
+    with instrument():
+        assert Unit.__dict__["__mul__"] is not original
+    assert Unit.__dict__["__mul__"] is original
+    assert Unit.__dict__["__new__"].__func__ is Unit.__new__
+
+
+def test_environment_variable():
+    root = Path(__file__).resolve().parent.parent
+    statement = "from classes import Quantity, Unit; Quantity(1, Unit([1])) * 2"
+    result = subprocess.run(
+        [sys.executable, "-c", statement],
+        cwd=root,
+        env={"PHYSICS_UNITS_INSTRUMENT": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "quantity construction" in result.stderr
+    result = subprocess.run(
+        [sys.executable, "-c", statement],
+        cwd=root,
+        env={"PHYSICS_UNITS_INSTRUMENT": "false"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stderr == ""
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from classes import Unit, Quantity, QuantityArray, IncompatibleUnitsError, lazy
+from constants import Constant
+
+
+def test_coulomb(meter):
+    r = QuantityArray(np.linspace(1, 2, 10001), meter)
+    q = Quantity(1e-6, Unit([0, 0, 1, 0, 1]))
+    expression = Constant.coulomb * q * q / lazy(r) ** 2
+    assert expression.unit is Unit([1, 1, -2])
+    eager = Constant.coulomb * q * q / r**2
+    result = expression.evaluate(block=256)
+    assert result.unit is eager.unit
+    assert np.allclose(result.value, eager.value)
+
+
+def test_constants_folded(meter, second):
+    folded = lazy(Constant.coulomb) * Constant.el_charge**2
+    assert folded.is_constant
+    expression = folded / lazy(np.ones(3))
+    assert expression.args[0] is folded
+
+
+def test_folded_as_floats(meter):
+    inverse = lazy(Quantity(2, meter)) ** -1
+    assert inverse.is_constant
+    assert inverse.evaluate() == Quantity(0.5, meter**-1)
+    assert lazy(2) is not lazy(2.0)
+    assert lazy(2) is lazy(2)
+
+
+def test_common_subexpressions(meter):
+    r = lazy(QuantityArray(np.arange(1.0, 5.0), meter), "r")
+    assert r**2 is r**2
+    expression = r**2 + r**2 * 3
+    assert str(expression) == "((r ** 2) + ((r ** 2) * 3))"
+    assert np.allclose(expression.evaluate().value, 4 * np.arange(1.0, 5.0) ** 2)
+
+
+def test_units_checked(meter, second):
+    r = lazy(QuantityArray(np.ones(3), meter))
+    with pytest.raises(IncompatibleUnitsError):
+        r + Quantity(1.0, second)
+    with pytest.raises(TypeError):
+        r.apply(np.exp)
+    ratio = (r / Quantity(2.0, meter)).apply(np.exp)
+    assert np.allclose(ratio.evaluate(), np.exp(0.5))
+
+
+def test_broadcast(meter):
+    x = QuantityArray(np.arange(3.0)[:, None], meter)
+    y = QuantityArray(np.arange(4.0), meter)
+    result = (lazy(x) * lazy(y) - x * x).evaluate(block=5)
+    assert result.shape == (3, 4)
+    assert np.allclose(result.value, (x * y - x * x).value)
+
+
+def test_arrays_on_left(meter):
+    product = QuantityArray(np.arange(3.0), meter) * lazy(Quantity(2.0, meter))
+    assert product.unit is meter**2
+    assert np.array_equal(product.evaluate().value, [0, 2, 4])
+    scaled = np.arange(3.0) - lazy(1.0)
+    assert np.array_equal(scaled.evaluate(), [-1, 0, 1])
+
+
+def test_names_not_shared(meter):
+    two = lazy(2, "two")
+    assert str(two) == "two"
+    assert str(lazy(2)) == "2"
+    assert lazy(2, "two") is two
+    x = lazy(QuantityArray(np.ones(3), meter), "x")
+    assert str(x * lazy(2)) == "(x * 2)"
+    area = lazy(x * x, "area")
+    assert str(area + x * x) == "(area + (x * x))"
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from classes import IncompatibleUnitsError, QuantityArray, Unit, VectorArray
+from storage import append_mapped, flush_mapped, load_mapped, read_header, save_mapped
+from storage.mapped import _write_header
+
+
+@pytest.fixture
+def positions(meter):
+    return VectorArray(np.arange(12.0).reshape(4, 3), meter, "position")
+
+
+def test_roundtrip(tmp_path, positions, meter):
+    path = tmp_path / "positions.pwu"
+    save_mapped(path, positions)
+    header = read_header(path)
+    assert header["unit"] == [0, 1, 0, 0, 0, 0, 0]
+    assert header["name"] == "position"
+    loaded = load_mapped(path)
+    assert type(loaded) == VectorArray
+    assert loaded.unit == meter
+    assert loaded.name == "position"
+    assert np.array_equal(loaded.value, positions.value)
+
+
+def test_zero_copy(tmp_path, second):
+    path = tmp_path / "times.pwu"
+    save_mapped(path, QuantityArray(np.zeros(1000), second))
+    times = load_mapped(path, mode="r+")
+    assert times.unit == second
+    times.value[3] = 7.0
+    flush_mapped(times)
+    assert load_mapped(path).value[3] == 7.0
+    with pytest.raises(ValueError):
+        load_mapped(path).value[0] = 1.0
+
+
+def test_vector_dtype(tmp_path, positions):
+    path = tmp_path / "positions.pwu"
+    save_mapped(path, positions)
+    assert read_header(path)["dtype"] == "<f8"
+    assert isinstance(load_mapped(path).value.base, np.memmap)
+    header = read_header(path)
+    header["dtype"] = "<f4"
+    with open(path, "r+b") as file:
+        _write_header(file, header)
+    with pytest.raises(ValueError, match="float64"):
+        load_mapped(path)
+
+
+def test_append(tmp_path, positions, second):
+    path = tmp_path / "series.pwu"
+    save_mapped(path, positions[:0])
+    assert len(load_mapped(path)) == 0
+    assert append_mapped(path, positions) == 4
+    assert append_mapped(path, positions[:2]) == 6
+    loaded = load_mapped(path)
+    assert np.array_equal(loaded.value[4:], positions.value[:2])
+    with pytest.raises(IncompatibleUnitsError):
+        append_mapped(path, VectorArray(np.zeros((1, 3)), second))
+    with pytest.raises(ValueError):
+        append_mapped(path, QuantityArray([1.0], positions.unit))
+
+
+def test_dimensionless(tmp_path):
+    path = tmp_path / "counts.pwu"
+    save_mapped(path, np.arange(5))
+    loaded = load_mapped(path)
+    assert type(loaded) == np.ndarray
+    assert loaded.tolist() == [0, 1, 2, 3, 4]
+
+
+def test_not_mapped(tmp_path):
+    path = tmp_path / "other.csv"
+    path.write_text("t [time]\n1\n")
+    with pytest.raises(ValueError):
+        load_mapped(path)
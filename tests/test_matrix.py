@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from classes import Unit, Quantity, DimensionalMatrix, IncompatibleUnitsError, NO_UNIT
+
+
+VOLT = Unit([1, 2, -3, 0, -1])
+AMPERE = Unit([0, 0, 0, 0, 1])
+SIEMENS = AMPERE / VOLT
+
+
+def _modified_nodal():
+    """two nodes joined by 2 S, node 1 grounded by 1 S and driven by a 10 V source"""
+    values = [[3.0, -2.0, 1.0], [-2.0, 2.0, 0.0], [1.0, 0.0, 0.0]]
+    return DimensionalMatrix(values, [AMPERE, AMPERE, VOLT], [VOLT, VOLT, AMPERE])
+
+
+def test_element_units():
+    a = _modified_nodal()
+    assert a.unit(0, 1) is SIEMENS
+    assert a.unit(0, 2) is NO_UNIT
+    assert a[2, 2].unit is VOLT / AMPERE
+    assert a[0, 0].value == 3.0
+
+
+def test_solve():
+    a = _modified_nodal()
+    b = DimensionalMatrix.vector(
+        [Quantity(0.0, AMPERE), Quantity(0.5, AMPERE), Quantity(10.0, VOLT)]
+    )
+    x = a.solve(b)
+    assert x.rows == (VOLT, VOLT, AMPERE)
+    v1, v2, current = x.column()
+    assert v1.value == pytest.approx(10.0) and v1.unit is VOLT
+    assert v2.value == pytest.approx(10.25)
+    assert current.unit is AMPERE
+    residual = a @ x - b
+    assert np.allclose(residual.value, 0)
+
+
+def test_inverse_transpose():
+    a = _modified_nodal()
+    identity = a @ a.inverse()
+    assert np.allclose(identity.value, np.eye(3))
+    assert all(identity.unit(i, i) is NO_UNIT for i in range(3))
+    t = a.T
+    assert all(t.unit(j, i) is a.unit(i, j) for i in range(3) for j in range(3))
+    assert a.det().unit is AMPERE / VOLT
+
+
+def test_incompatible(meter, second):
+    a = _modified_nodal()
+    with pytest.raises(IncompatibleUnitsError):
+        a @ a
+    with pytest.raises(IncompatibleUnitsError):
+        a.solve(DimensionalMatrix.vector([1.0, 2.0, 3.0]))
+    with pytest.raises(IncompatibleUnitsError):
+        a + a * Quantity(1.0, meter)
+    scaled = Quantity(2.0, meter) * a
+    assert scaled.unit(0, 1) is SIEMENS * meter
+    assert np.allclose((scaled / Quantity(2.0, meter) - a).value, 0)
+    with pytest.raises(TypeError):
+        a / a
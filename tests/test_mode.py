@@ -0,0 +1,67 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from classes import IncompatibleUnitsError, Quantity, QuantityArray, Unit, Vector
+from classes import checked, checks_enabled, set_checks, unchecked
+
+
+def test_unchecked(kilo, meter):
+    a, b = Quantity(1.0, kilo), Quantity(2.0, meter)
+    with unchecked():
+        assert not checks_enabled()
+        total = a + b
+        assert total.value == 3.0
+        assert a < b
+        assert (a * b).unit == Unit([1, 1])
+        assert Quantity(1.0, kilo).name is None
+        assert Vector(1, 2, 3, meter) - Vector(1, 1, 1, kilo) == Vector(0, 1, 2, meter)
+        masses = QuantityArray([1.0, 2.0], kilo)
+        assert (masses + QuantityArray([1.0, 1.0], meter)).value.tolist() == [2, 3]
+    assert checks_enabled()
+    with pytest.raises(IncompatibleUnitsError):
+        _ = a + b
+
+
+def test_unchecked_skips_unit_arithmetic(kilo, meter, monkeypatch):
+    def fail(*args):
+        raise AssertionError("unit arithmetic in unchecked mode")
+
+    monkeypatch.setattr(Unit, "__add__", fail)
+    monkeypatch.setattr(Unit, "__sub__", fail)
+    with unchecked():
+        assert (Quantity(1.0, kilo) + Quantity(2.0, meter)).unit == kilo
+        assert (Quantity(1.0, meter) - Quantity(2.0, kilo)).unit == meter
+        assert (Vector(1, 2, 3, meter) + Vector(1, 2, 3, kilo)).unit == meter
+
+
+def test_checked_scope(kilo, meter):
+    set_checks(False)
+    try:
+        with checked():
+            with pytest.raises(IncompatibleUnitsError):
+                _ = Quantity(1.0, kilo) + Quantity(2.0, meter)
+        assert not checks_enabled()
+    finally:
+        set_checks(True)
+
+
+def test_environment_variable():
+    root = Path(__file__).resolve().parent.parent
+    statement = "from classes import checks_enabled; assert not checks_enabled()"
+    subprocess.run(
+        [sys.executable, "-c", statement],
+        cwd=root,
+        env={"PHYSICS_UNITS_UNCHECKED": "1"},
+        check=True,
+    )
+    statement = "from classes import checks_enabled; assert checks_enabled()"
+    for value in ("0", "false", "No", ""):
+        subprocess.run(
+            [sys.executable, "-c", statement],
+            cwd=root,
+            env={"PHYSICS_UNITS_UNCHECKED": value},
+            check=True,
+        )
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from classes import Unit, Quantity, QuantityArray, Vector, VectorArray, NO_UNIT
+from classes import IncompatibleUnitsError
+from constants import Constant
+from dynamics import solve
+
+
+def test_projectile(meter, second):
+    def rhs(t, position, velocity):
+        return velocity, Constant.g_vector
+
+    start = Vector(0, 0, 0, meter)
+    speed = Vector(1, 0, 10, meter / second)
+    times = QuantityArray(np.linspace(0, 2, 5), second)
+    solution = solve(
+        rhs, (Quantity(0, second), Quantity(2, second)), (start, speed), t_eval=times
+    )
+    assert solution.success
+    positions, velocities = solution.y
+    assert isinstance(positions, VectorArray) and positions.unit is meter
+    assert velocities.unit is meter / second
+    assert solution.t.unit is second
+    t = times.value
+    assert np.allclose(positions.value[:, 0], t)
+    assert np.allclose(positions.value[:, 2], 10 * t - Constant.g.value / 2 * t**2)
+
+
+def test_decay_raw_fast_path(second):
+    calls = []
+    rate = Quantity(0.5, second.invert())
+
+    def rhs(t, amount):
+        calls.append(amount.unit)
+        return -rate * amount
+
+    amounts = QuantityArray([1.0, 2.0], Unit([0, 0, 0, 0, 0, 1]))
+    solution = solve(
+        rhs, (Quantity(0, second), Quantity(4, second)), amounts, rtol=1e-8
+    )
+    assert solution.y.value.shape == (len(solution.t), 2)
+    assert np.allclose(solution.y.value[-1], [np.exp(-2), 2 * np.exp(-2)], rtol=1e-6)
+    assert calls[0] is amounts.unit
+    assert set(calls[1:]) == {NO_UNIT}
+
+
+def test_oscillator_methods(meter, second):
+    omega = Quantity(2.0, second.invert())
+
+    def rhs(t, x, v):
+        return v, -(omega**2) * x
+
+    state = (Quantity(1.0, meter), Quantity(0.0, meter / second))
+    for method in ("RK45", "DOP853", "Radau"):
+        solution = solve(
+            rhs,
+            (Quantity(0, second), Quantity(np.pi, second)),
+            state,
+            method,
+            rtol=1e-9,
+            atol=1e-9,
+            max_step=Quantity(0.1, second),
+        )
+        assert solution.y[0].value[-1] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_units_checked_once(meter, second):
+    def wrong(t, position):
+        return position
+
+    with pytest.raises(IncompatibleUnitsError):
+        solve(wrong, (Quantity(0, second), Quantity(1, second)), Quantity(1.0, meter))
+    with pytest.raises(IncompatibleUnitsError):
+        solve(wrong, (Quantity(0, meter), Quantity(1, meter)), Quantity(1.0, meter))
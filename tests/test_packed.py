@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from classes import Unit, NO_UNIT
+from classes.packed import pack, unpack, pack_array, unpack_array
+
+
+DIMENSIONS = Path(__file__).resolve().parent.parent / "dimensions"
+
+
+def test_roundtrip_dimensions():
+    for path in DIMENSIONS.glob("*.json"):
+        for nums in json.loads(path.read_text()).values():
+            assert list(unpack(pack(nums))) == nums
+            unit = Unit(nums)
+            assert Unit.from_packed(unit.packed) is unit
+
+
+def test_arithmetic(kilo, meter, second):
+    speed = meter / second
+    assert Unit.from_packed(meter.packed - second.packed) is speed
+    assert Unit.from_packed(kilo.packed + speed.packed) is kilo * speed
+    assert Unit.from_packed(3 * meter.packed) is meter ** 3
+    assert NO_UNIT.packed == 0
+    assert str(Unit.from_packed(kilo.packed - meter.packed)) == "kg m^-1"
+
+
+def test_limits(kilo):
+    with pytest.raises(ValueError, match="non-integer"):
+        (kilo**0.5).packed
+    with pytest.raises(ValueError, match="8 bits"):
+        (kilo**200).packed
+    with pytest.raises(ValueError):
+        pack([128])
+    assert unpack(pack([-128, 127, -1])) == (-128, 127, -1, 0, 0, 0, 0)
+
+
+def test_arrays():
+    nums = np.array([[1, 2, -2, 0, 0, 0, 0], [-1, -3, 4, 0, 2, 0, 0], [0] * 7])
+    codes = pack_array(nums)
+    assert codes.dtype == np.int64
+    assert codes.tolist() == [pack(n) for n in nums.tolist()]
+    assert np.array_equal(unpack_array(codes), nums)
+    assert np.array_equal(unpack_array(codes[:2] - codes[1:]), nums[:2] - nums[1:])
@@ -0,0 +1,84 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from classes import (
+    Unit,
+    Quantity,
+    QuantityArray,
+    Vector,
+    VectorArray,
+    IncompatibleUnitsError,
+    parallel_map,
+)
+
+
+def kinetic_energy(masses, velocities):
+    return 0.5 * masses * velocities.dot(velocities)
+
+
+def torque(positions, force):
+    return positions.cross(force)
+
+
+def shifted(values, offset):
+    return values + offset
+
+
+def mixed_units(values):
+    if values.value[0] > 2:
+        return values * values
+    return values
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(2) as executor:
+        yield executor
+
+
+def test_quantity_result(kilo, meter, second, pool):
+    rng = np.random.default_rng(0)
+    masses = QuantityArray(rng.random(101), kilo)
+    velocities = VectorArray(rng.random((101, 3)), meter / second)
+    result = parallel_map(
+        kinetic_energy, masses, velocities, chunk_size=10, executor=pool
+    )
+    expected = kinetic_energy(masses, velocities)
+    assert result.unit is expected.unit
+    assert np.allclose(result.value, expected.value)
+
+
+def test_vector_result(meter, pool):
+    positions = VectorArray(np.arange(30.0).reshape(10, 3), meter)
+    force = Vector(0, 0, 2, Unit([1, 1, -2]))
+    result = parallel_map(torque, positions, force, chunk_size=3, executor=pool)
+    assert isinstance(result, VectorArray)
+    assert np.allclose(result.value, positions.cross(force).value)
+
+
+def test_plain_arrays(meter):
+    result = parallel_map(shifted, np.arange(5.0), 1.0, processes=2)
+    assert np.array_equal(result, np.arange(1.0, 6.0))
+    lengths = parallel_map(
+        shifted, QuantityArray(np.arange(5.0), meter), Quantity(1.0, meter), processes=2
+    )
+    assert lengths.unit is meter
+
+
+def test_units_verified(meter, pool):
+    values = QuantityArray(np.arange(5.0), meter)
+    with pytest.raises(IncompatibleUnitsError):
+        parallel_map(mixed_units, values, chunk_size=1, executor=pool)
+    with pytest.raises(ValueError):
+        parallel_map(shifted, values, np.arange(3.0), executor=pool)
+
+
+def test_unit_pickle(meter, second):
+    speed = meter / second
+    assert pickle.loads(pickle.dumps(speed)) is speed
+    assert pickle.dumps(Unit([0, 1.0, -1])) == pickle.dumps(speed)
+    root = Unit([0.5])
+    assert pickle.loads(pickle.dumps(root)) is root
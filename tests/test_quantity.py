@@ -54,7 +54,7 @@ def test_sub_unit_number(one_kilo):
 def test_multiply_units(one_kilo, one_meter):
     km = one_kilo * one_meter
     assert km.value == 1
-    assert km.unit._nums == [1, 1] + [0] * 5
+    assert km.unit._nums == (1, 1) + (0,) * 5
     assert str(km) == "1 kg m"
 
 
@@ -68,7 +68,7 @@ def test_multiply_number(one_kilo):
 def test_divide_units(one_kilo, one_meter):
     km = one_kilo / one_meter
     assert km.value == 1
-    assert km.unit._nums == [1, -1] + [0] * 5
+    assert km.unit._nums == (1, -1) + (0,) * 5
     assert str(km) == "1.0 kg m^-1"
 
 
@@ -104,7 +104,7 @@ def test_round(two_kilos, kilo):
     assert round(Quantity(2.4, kilo)) == two_kilos
 
 
-def test_name(meter, second):
+def test_name(meter, second, restore_dimensions):
     m = Quantity(1.0, meter)
     assert m.name == "length"
     s = Quantity(1.0, second)
@@ -114,3 +114,18 @@ def test_name(meter, second):
     Unit.update_dimensions("mechanics")
     v2 = m / s
     assert v2.name == "speed"
+
+
+def test_lazy_name(meter, second, restore_dimensions):
+    pop = Quantity(1.0, meter) / Quantity(2.0, second) ** 6
+    Unit.update_dimensions({"pop": [0, 1, -6]})
+    assert pop.name == "pop"
+    named = Quantity(3.0, meter, "distance")
+    assert named.name == "distance"
+    named.name = "width"
+    assert str(named) == "width: 3.0 m"
+
+
+def test_slots(one_kilo):
+    with pytest.raises(AttributeError):
+        one_kilo.other = 1
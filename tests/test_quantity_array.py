@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from classes import IncompatibleUnitsError, Quantity, QuantityArray, Unit
+
+
+@pytest.fixture
+def masses(kilo):
+    return QuantityArray([1.0, 2.0, 3.0], kilo)
+
+
+@pytest.fixture
+def lengths(meter):
+    return QuantityArray([2.0, 4.0, 6.0], meter)
+
+
+def test_no_unit():
+    arr = QuantityArray([1, 2], None)
+    assert type(arr) == np.ndarray
+
+
+def test_string(masses):
+    assert str(masses) == "mass: [1. 2. 3.] kg"
+    assert masses.shape == (3,)
+    assert len(masses) == 3
+
+
+def test_add_sub(masses, lengths, kilo):
+    total = masses + masses
+    assert total.unit == kilo
+    assert np.array_equal(total.value, [2, 4, 6])
+    diff = masses - Quantity(1, kilo)
+    assert np.array_equal(diff.value, [0, 1, 2])
+    with pytest.raises(IncompatibleUnitsError) as e:
+        _ = masses + lengths
+    assert "cannot add" in str(e.value)
+    with pytest.raises(IncompatibleUnitsError):
+        _ = masses - 1
+
+
+def test_mul_div(masses, lengths, one_kilo):
+    km = masses * lengths
+    assert km.unit == Unit([1, 1])
+    assert np.array_equal(km.value, [2, 8, 18])
+    assert np.array_equal((3 * masses).value, [3, 6, 9])
+    ratio = masses / one_kilo
+    assert type(ratio) == np.ndarray
+    inv = 1 / masses
+    assert inv.unit == Unit([-1])
+    scaled = one_kilo * lengths
+    assert scaled.unit == Unit([1, 1])
+
+
+def test_pow_round(lengths, meter):
+    area = lengths**2
+    assert area.name == "area"
+    assert np.array_equal(area.value, [4, 16, 36])
+    root = np.sqrt(area)
+    assert root.unit == meter
+    rounded = round(QuantityArray([1.26, 2.71], meter), 1)
+    assert np.array_equal(rounded.value, [1.3, 2.7])
+    with pytest.raises(TypeError):
+        _ = lengths ** np.array([1, 2, 3])
+
+
+def test_compare(masses, lengths, kilo):
+    mask = masses > Quantity(1.5, kilo)
+    assert mask.tolist() == [False, True, True]
+    assert (Quantity(1.5, kilo) < masses).tolist() == [False, True, True]
+    assert (masses == masses).all()
+    with pytest.raises(IncompatibleUnitsError) as e:
+        _ = masses < lengths
+    assert "cannot compare" in str(e.value)
+
+
+def test_broadcast(meter, second):
+    grid = QuantityArray(np.arange(3.0)[:, None], meter)
+    times = QuantityArray([1.0, 2.0], second)
+    speed = grid / times
+    assert speed.shape == (3, 2)
+    assert speed.unit == Unit([0, 1, -1])
+
+
+def test_indexing(masses, kilo):
+    assert masses[1] == Quantity(2.0, kilo)
+    part = masses[1:]
+    assert type(part) == QuantityArray
+    assert np.array_equal(part.value, [2, 3])
+    masses[0] = Quantity(5.0, kilo)
+    assert masses.value[0] == 5
+    with pytest.raises(IncompatibleUnitsError):
+        masses[0] = 5.0
+
+
+def test_reductions(masses, kilo):
+    assert masses.sum() == Quantity(6.0, kilo)
+    assert np.max(masses) == Quantity(3.0, kilo)
+    assert np.add.reduce(masses) == Quantity(6.0, kilo)
+    assert np.isfinite(masses).all()
+
+
+def test_unsupported_ufunc(masses):
+    with pytest.raises(TypeError):
+        np.exp(masses)
+
+
+def test_from_quantities(kilo, meter):
+    arr = QuantityArray.from_quantities([Quantity(1, kilo), Quantity(2, kilo)])
+    assert arr.unit == kilo
+    with pytest.raises(IncompatibleUnitsError):
+        QuantityArray.from_quantities([Quantity(1, kilo), Quantity(2, meter)])
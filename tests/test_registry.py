@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from classes import DimensionConflictError, Unit
+from classes import registry
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(registry, "_compiled", {})
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def pack(tmp_path):
+    path = tmp_path / "extra.json"
+    path.write_text(json.dumps({"jerk": [0, 1, -3], "energy": [1, 2, -2]}))
+    return path
+
+
+def test_independent_of_cwd(tmp_path, monkeypatch, cache, restore_dimensions):
+    monkeypatch.chdir(tmp_path)
+    Unit.update_dimensions("mechanics")
+    assert "speed" in Unit.dimensions
+    assert Unit.from_dict("speed").get_name() == "speed"
+
+
+def test_missing_file(cache, restore_dimensions):
+    with pytest.raises(FileNotFoundError):
+        Unit.update_dimensions("nonexistent")
+    with pytest.raises(TypeError):
+        Unit.update_dimensions("mechanics", filetype="xml")
+
+
+def test_merge(pack, cache, restore_dimensions):
+    Unit.load_dimensions("mechanics", "em", str(pack))
+    assert Unit([0, 1, -3]).get_name() == "jerk"
+    assert Unit.from_dict("energy").check_dimensions() == ["energy", "torque"]
+
+
+def test_conflicts(tmp_path, pack, cache, restore_dimensions):
+    other = tmp_path / "other.json"
+    other.write_text(json.dumps({"jerk": [0, 1, -2]}))
+    with pytest.raises(DimensionConflictError) as e:
+        Unit.load_dimensions(str(pack), str(other))
+    assert "jerk" in str(e.value)
+    Unit.update_dimensions({"jerk": [1]})
+    with pytest.raises(DimensionConflictError):
+        Unit.load_dimensions(str(pack))
+    Unit.load_dimensions(str(pack), override=True)
+    assert Unit.from_dict("jerk") == Unit([0, 1, -3])
+
+
+def test_cache(pack, cache, monkeypatch):
+    first = registry.load([str(pack)])
+    assert len(list(cache.glob("*.json"))) == 1
+    assert registry.load([str(pack)]) is first
+    monkeypatch.setattr(registry, "_compiled", {})
+
+    def fail(path):
+        raise AssertionError("parsed although cached")
+
+    monkeypatch.setattr(registry, "_parse", fail)
+    assert registry.load([str(pack)]) == first
+    assert first["index"][(0, 1, -3, 0, 0, 0, 0)] == ["jerk"]
+
+
+def test_fractional_exponents(tmp_path, cache):
+    path = tmp_path / "noise.json"
+    path.write_text(json.dumps({"noise density": [0, 0, -0.5, 0, 1]}))
+    cold = registry.load([str(path)])
+    registry._compiled.clear()
+    warm = registry.load([str(path)])
+    assert warm == cold
+    assert warm["dimensions"]["noise density"][2] == -0.5
+    assert Unit(warm["dimensions"]["noise density"]) is Unit([0, 0, -0.5, 0, 1])
+
+
+def test_corrupt_cache(pack, cache):
+    expected = registry.load([str(pack)])
+    for content in ("{not json", '{"dimensions": 1}', "[]"):
+        registry._compiled.clear()
+        (cache_file,) = cache.glob("*.json")
+        cache_file.write_text(content)
+        assert registry.load([str(pack)]) == expected
+
+
+def test_cache_invalidated(pack, cache):
+    registry.load([str(pack)])
+    pack.write_text(json.dumps({"snap": [0, 1, -4]}))
+    assert "snap" in registry.load([str(pack)])["dimensions"]
+
+
+def test_yaml(tmp_path, cache, restore_dimensions):
+    pytest.importorskip("yaml")
+    path = tmp_path / "extra.yaml"
+    path.write_text("jerk: [0, 1, -3]\n")
+    Unit.update_dimensions(str(path), filetype="yaml")
+    assert Unit.from_dict("jerk") == Unit([0, 1, -3])
@@ -0,0 +1,76 @@
+from math import pi
+
+import numpy as np
+import pytest
+
+from classes import (
+    Unit,
+    Quantity,
+    QuantityArray,
+    Vector,
+    VectorArray,
+    ScaledUnit,
+    IncompatibleUnitsError,
+    convert,
+    conversion_factor,
+)
+
+
+def test_parse(kilo, meter, second):
+    km = ScaledUnit.get("km")
+    assert km.scale == 1e3 and km.unit is meter
+    assert (
+        ScaledUnit.get("kg").scale == pytest.approx(1)
+        and ScaledUnit.get("kg").unit is kilo
+    )
+    kmh = ScaledUnit.get("km/h")
+    assert kmh.scale == pytest.approx(1 / 3.6) and kmh.unit is meter / second
+    newton = ScaledUnit.get("kg m s^-2")
+    assert newton.unit is ScaledUnit.get("N").unit
+    assert ScaledUnit.get("km") is km
+
+
+def test_unknown():
+    with pytest.raises(ValueError):
+        ScaledUnit.get("furlong")
+
+
+def test_quantity(meter):
+    q = Quantity(3, "km")
+    assert q.value == 3000 and q.unit is meter
+    assert q.to("cm") == pytest.approx(3e5)
+    assert Quantity(1, "eV").to("J") == pytest.approx(1.602176634e-19)
+    assert Quantity(1, "bar").to("Pa") == 1e5
+    assert Quantity(180, "deg") == pytest.approx(pi)
+    assert Quantity(2, "length").name == "length"
+
+
+def test_incompatible():
+    with pytest.raises(IncompatibleUnitsError):
+        Quantity(1, "km").to("s")
+    with pytest.raises(IncompatibleUnitsError):
+        convert(1.0, "eV", "m")
+
+
+def test_arrays(meter):
+    values = np.arange(5.0)
+    volts = QuantityArray(values, "mV")
+    assert np.allclose(volts.value, values * 1e-3)
+    assert np.allclose(volts.to("mV"), values)
+    positions = VectorArray(np.ones((4, 3)), "km")
+    assert positions.unit is meter
+    assert np.allclose(positions.to("m"), 1e3)
+
+
+def test_vector(meter):
+    v = Vector(1, 2, 3, "mm")
+    assert v.unit is meter
+    assert v.to("mm") == pytest.approx((1, 2, 3))
+
+
+def test_memoized():
+    conversion_factor.cache_clear()
+    conversion_factor("km", "m")
+    conversion_factor("km", "m")
+    assert conversion_factor.cache_info().hits == 1
+    assert convert(2.0, Unit([0, 1]), "km") == pytest.approx(2e-3)
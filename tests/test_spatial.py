@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from classes import Quantity, Vector, VectorArray, IncompatibleUnitsError
+from dynamics import SpatialIndex
+
+
+def _brute_within(values, point, radius):
+    return np.flatnonzero(np.linalg.norm(values - point, axis=1) <= radius)
+
+
+@pytest.fixture
+def positions():
+    rng = np.random.default_rng(0)
+    return VectorArray(rng.random((500, 3)) * 10, "length")
+
+
+def test_within(positions, meter):
+    index = SpatialIndex(positions)
+    probe = Vector(5, 5, 5, meter)
+    found = index.within(probe, Quantity(2, meter))
+    assert np.array_equal(found, _brute_within(positions.value, [5, 5, 5], 2))
+    probes = VectorArray([[1, 1, 1], [9, 9, 9]], meter)
+    found = index.within(probes, Quantity(200, "cm"))
+    assert np.array_equal(found[1], _brute_within(positions.value, [9, 9, 9], 2))
+
+
+def test_nearest(positions, meter):
+    index = SpatialIndex(positions)
+    distances, indices = index.nearest(Vector(5, 5, 5, meter), k=3)
+    expected = np.linalg.norm(positions.value - 5, axis=1)
+    assert np.array_equal(indices, np.argsort(expected)[:3])
+    assert distances.unit is meter
+    assert np.allclose(distances.value, np.sort(expected)[:3])
+
+
+def test_incremental_update(positions, meter):
+    index = SpatialIndex(positions, skin=Quantity(0.3, meter))
+    rng = np.random.default_rng(1)
+    moved = VectorArray(positions.value + rng.uniform(-0.1, 0.1, (500, 3)), meter)
+    assert not index.update(moved)
+    assert index.rebuilds == 1
+    found = index.within(Vector(5, 5, 5, meter), Quantity(2, meter))
+    assert np.array_equal(found, _brute_within(moved.value, [5, 5, 5], 2))
+    distances, indices = index.nearest(VectorArray([[5, 5, 5]], meter), k=4)
+    expected = np.linalg.norm(moved.value - 5, axis=1)
+    assert np.array_equal(indices[0], np.argsort(expected)[:4])
+    pairs = index.pairs(Quantity(0.5, meter))
+    gaps = np.linalg.norm(moved.value[:, None] - moved.value[None], axis=-1)
+    assert len(pairs) == np.count_nonzero(np.triu(gaps <= 0.5, k=1))
+    far = VectorArray(positions.value + 1.0, meter)
+    assert index.update(far)
+    assert index.rebuilds == 2
+
+
+def test_units(positions, meter, second):
+    index = SpatialIndex(positions)
+    with pytest.raises(IncompatibleUnitsError):
+        index.within(Vector(5, 5, 5, meter), Quantity(2, second))
+    with pytest.raises(IncompatibleUnitsError):
+        index.nearest(Vector(5, 5, 5))
+    with pytest.raises(IncompatibleUnitsError):
+        SpatialIndex(VectorArray(np.zeros((2, 3)), "time"))
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from classes import Unit, Quantity, Vector, VectorArray, IncompatibleUnitsError
+from classes import Tensor, TensorArray, Rotation, RotationArray
+
+
+def test_tensor_vector(kilo, meter):
+    inertia = Tensor(
+        [[2.0, 0.0, 0.0], [0.0, 3.0, 0.0], [0.0, 0.0, 4.0]], kilo * meter**2
+    )
+    omega = Vector(1.0, 1.0, 0.0, Unit([0, 0, -1]))
+    angular_momentum = inertia @ omega
+    assert isinstance(angular_momentum, Vector)
+    assert angular_momentum.unit is kilo * meter**2 / Unit([0, 0, 1])
+    assert (angular_momentum._x, angular_momentum._y) == (2.0, 3.0)
+    assert inertia.trace.value == 9.0
+    assert inertia.det().unit is (kilo * meter**2) ** 3
+    assert inertia.inverse().unit is (kilo * meter**2).invert()
+    assert inertia[1, 1] == Quantity(3.0, kilo * meter**2)
+    with pytest.raises(IncompatibleUnitsError):
+        inertia + Tensor.identity(meter)
+
+
+def test_tensor_construction(meter):
+    a, b = Vector(1, 2, 3, meter), Vector(4, 5, 6, meter)
+    t = Tensor.from_rows(a, b, a)
+    assert t.row(1) == b
+    assert t.column(0) == Vector(1, 4, 1, meter)
+    outer = Tensor.outer(a, b)
+    assert outer.unit is meter**2
+    assert np.allclose(outer.value, np.outer([1, 2, 3], [4, 5, 6]))
+    assert np.allclose((t @ Tensor.identity()).value, t.value)
+    with pytest.raises(IncompatibleUnitsError):
+        Tensor.from_rows(a, b, Vector(1, 1, 1))
+    values, axes = Tensor(
+        [[2.0, 1.0, 0], [1.0, 2.0, 0], [0, 0, 5.0]], meter
+    ).principal()
+    assert np.allclose(values.value, [1.0, 3.0, 5.0])
+    assert np.allclose(np.abs(axes[:, 2]), [0, 0, 1])
+
+
+def test_tensor_array(meter):
+    rng = np.random.default_rng(1)
+    tensors = TensorArray(rng.normal(size=(5, 3, 3)), meter)
+    vectors = VectorArray(rng.normal(size=(5, 3)))
+    result = tensors @ vectors
+    assert isinstance(result, VectorArray) and result.unit is meter
+    assert np.allclose(
+        result.value, np.einsum("nij,nj->ni", tensors.value, vectors.value)
+    )
+    assert isinstance(tensors[0], Tensor)
+    assert np.allclose((tensors * np.arange(5)).value[2], 2 * tensors.value[2])
+    assert np.all(tensors.T.T == tensors)
+
+
+def test_rotation(meter):
+    quarter = Rotation.from_axis_angle(Vector(0, 0, 2), 90, degs=True)
+    rotated = quarter.apply(Vector(1.0, 0.0, 0.0, meter))
+    assert rotated.unit is meter
+    assert np.allclose([rotated._x, rotated._y, rotated._z], [0, 1, 0])
+    assert quarter.angle == pytest.approx(np.pi / 2)
+    assert np.allclose(quarter.axis, [0, 0, 1])
+    assert (quarter * quarter).angle == pytest.approx(np.pi)
+    assert (quarter * quarter.inverse()).angle == pytest.approx(0)
+    back = Rotation.from_matrix(quarter.as_tensor())
+    assert np.allclose(back.matrix, quarter.matrix)
+    tensor = Tensor(np.diag([1.0, 2.0, 3.0]), meter)
+    assert np.allclose(quarter.apply(tensor).value, np.diag([2.0, 1.0, 3.0]))
+
+
+def test_rotation_array(meter):
+    rng = np.random.default_rng(2)
+    rotations = RotationArray(rng.normal(size=(100, 4)))
+    assert np.allclose(rotations.matrix @ rotations.inverse().matrix, np.eye(3))
+    back = RotationArray.from_matrix(rotations.matrix)
+    assert np.allclose(back.matrix, rotations.matrix)
+    vectors = VectorArray(rng.normal(size=(100, 3)), meter)
+    rotated = rotations.apply(vectors)
+    assert np.allclose(rotated.length, vectors.length)
+    assert np.allclose(rotations.inverse().apply(rotated).value, vectors.value)
+    composed = (rotations[0] * rotations[1]).apply(vectors[2])
+    nested = rotations[0].apply(rotations[1].apply(vectors[2]))
+    assert np.allclose(composed.to(meter), nested.to(meter))
+    angles = rng.uniform(0, np.pi, 100)
+    axes = rng.normal(size=(100, 3))
+    from_axes = RotationArray.from_axis_angle(axes, angles)
+    assert np.allclose(from_axes.angle, angles)
+    assert np.allclose(from_axes.axis, axes / np.linalg.norm(axes, axis=1)[:, None])
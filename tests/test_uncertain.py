@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from classes import (
+    Quantity,
+    QuantityArray,
+    Vector,
+    VectorArray,
+    UncertainQuantity,
+    UncertainVector,
+    IncompatibleUnitsError,
+    monte_carlo,
+    propagate,
+)
+
+
+def test_add_sub(meter):
+    a = UncertainQuantity(1.0, 0.3, meter)
+    b = UncertainQuantity(2.0, 0.4, meter)
+    assert (a + b).value == 3.0
+    assert (a + b).std == pytest.approx(0.5)
+    assert (b - a).std == pytest.approx(0.5)
+    c = a + Quantity(1.0, meter)
+    assert c.value == 2.0 and c.std == 0.3 and c.unit is meter
+    with pytest.raises(IncompatibleUnitsError):
+        a + UncertainQuantity(1.0, 0.1, "s")
+
+
+def test_mul_div_pow(meter, second):
+    length = UncertainQuantity(2.0, 0.02, meter)
+    time = UncertainQuantity(4.0, 0.08, second)
+    speed = length / time
+    assert speed.unit is meter / second
+    assert speed.relative == pytest.approx(np.hypot(0.01, 0.02))
+    area = length * length
+    assert area.unit is meter**2
+    squared = length**2
+    assert squared.relative == pytest.approx(0.02)
+    assert (3 * length).std == pytest.approx(0.06)
+    assert (1 / time).relative == pytest.approx(0.02)
+    assert (length * length).std == squared.std
+    assert (length - length).std == 0
+    ratio = length / length
+    assert ratio.value == 1.0 and ratio.std == 0
+    assert ratio.unit is meter / meter
+
+
+def test_arrays(meter):
+    values = UncertainQuantity([1.0, 2.0, 4.0], 0.1, "km")
+    assert np.allclose(values.value, [1e3, 2e3, 4e3])
+    assert np.allclose(values.std, 100)
+    scaled = values * QuantityArray([1.0, 2.0, 3.0], meter)
+    assert np.allclose(scaled.std, [100, 200, 300])
+    assert values[1].value == 2e3 and values[1].std == 100
+
+
+def test_vectors(meter, second):
+    a = UncertainVector([1.0, 0.0, 0.0], 0.1, meter)
+    b = Vector(0, 2, 0, "length")
+    assert np.allclose(a.cross(b).value, [0, 0, 2])
+    assert np.allclose(a.cross(b).std, [0.2, 0, 0.2])
+    assert a.dot(b).value == 0 and a.dot(b).std == pytest.approx(0.2)
+    assert a.magnitude.std == pytest.approx(0.1)
+    velocity = a / UncertainQuantity(2.0, 0.0, second)
+    assert velocity.unit is meter / second
+    assert (b + a).unit is meter
+    assert np.allclose((Quantity(2, second) * a).std, 0.2)
+
+
+def test_exact_vectors(meter, second):
+    time = UncertainQuantity(2.0, 0.1, second)
+    v = Vector(1.0, 2.0, 0.0, meter)
+    for product in (v * time, time * v):
+        assert type(product) == UncertainVector
+        assert product.unit is meter * second
+        assert np.allclose(product.value, [2, 4, 0])
+        assert np.allclose(product.std, [0.1, 0.2, 0])
+    array = VectorArray([[1.0, 0, 0], [0, 3.0, 0]], meter)
+    for product in (array * time, time * array):
+        assert np.allclose(product.std, [[0.1, 0, 0], [0, 0.3, 0]])
+    velocity = v / time
+    assert velocity.unit is meter / second
+    assert np.allclose(velocity.std, [0.025, 0.05, 0])
+    a = UncertainVector([1.0, 0.0, 0.0], 0.1, meter)
+    assert type(time * a) == UncertainVector
+    dot = v.dot(a)
+    assert dot.value == 1.0 and dot.std == pytest.approx(np.hypot(0.1, 0.2))
+    assert np.allclose(v.cross(a).value, -a.cross(v).value)
+
+
+def test_monte_carlo(meter):
+    length = UncertainQuantity(2.0, 0.02, meter)
+    linear = propagate(lambda x: x * x, length)
+    sampled = propagate(lambda x: x * x, length, method="monte_carlo", seed=1)
+    assert sampled.unit is meter**2
+    assert sampled.value == pytest.approx(linear.value, rel=1e-3)
+    assert sampled.std == pytest.approx(linear.std, rel=0.05)
+
+
+def test_monte_carlo_vectors(meter):
+    a = UncertainVector([[3.0, 4.0, 0.0]] * 2, 0.01, meter)
+    result = monte_carlo(lambda v: v.magnitude, a, samples=20000, seed=2)
+    assert np.allclose(result.value, 5, rtol=1e-3)
+    assert np.allclose(result.std, a.magnitude.std, rtol=0.05)
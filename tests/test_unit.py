@@ -1,5 +1,10 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
+import classes
 from classes import Unit, IncompatibleUnitsError, NO_UNIT
 
 
@@ -10,7 +15,7 @@ def kilo2():
 
 def test_add_kilos(kilo, kilo2):
     two_kilos = kilo + kilo2
-    assert two_kilos._nums == [1, 0, 0, 0, 0, 0, 0]
+    assert two_kilos._nums == (1, 0, 0, 0, 0, 0, 0)
     assert str(two_kilos) == "kg"
 
 
@@ -22,7 +27,7 @@ def test_add_different_units(kilo, meter):
 
 def test_sub_kilos(kilo, kilo2):
     two_kilos = kilo - kilo2
-    assert two_kilos._nums == [1, 0, 0, 0, 0, 0, 0]
+    assert two_kilos._nums == (1, 0, 0, 0, 0, 0, 0)
     assert str(two_kilos) == "kg"
 
 
@@ -34,25 +39,25 @@ def test_sub_different_units(kilo, meter):
 
 def test_multiply_units(kilo, meter):
     km = kilo * meter
-    assert km._nums == [1, 1, 0, 0, 0, 0, 0]
+    assert km._nums == (1, 1, 0, 0, 0, 0, 0)
     assert str(km) == "kg m"
 
 
 def test_multiply_same_unit(kilo):
     km = kilo * kilo
-    assert km._nums == [2, 0, 0, 0, 0, 0, 0]
+    assert km._nums == (2, 0, 0, 0, 0, 0, 0)
     assert str(km) == "kg^2"
 
 
 def test_multiply_inverses(second, hertz):
     n = second * hertz
-    assert n._nums == [0] * 7
+    assert n._nums == (0,) * 7
     assert str(n) == ""
 
 
 def test_divide_units(kilo, meter):
     km = kilo / meter
-    assert km._nums == [1, -1, 0, 0, 0, 0, 0]
+    assert km._nums == (1, -1, 0, 0, 0, 0, 0)
     assert str(km) == "kg m^-1"
 
 
@@ -63,22 +68,22 @@ def test_divide_same_unit(kilo):
 
 def test_power_int(kilo):
     k2 = kilo**2
-    assert k2._nums == [2] + [0] * 6
+    assert k2._nums == (2,) + (0,) * 6
     assert str(k2) == "kg^2"
     k5 = kilo**5
-    assert k5._nums == [5] + [0] * 6
+    assert k5._nums == (5,) + (0,) * 6
     assert str(k5) == "kg^5"
     k1 = kilo**-1
-    assert k1._nums == [-1] + [0] * 6
+    assert k1._nums == (-1,) + (0,) * 6
     assert str(k1) == "kg^-1"
 
 
 def test_power_float(kilo):
     k2 = kilo**2.5
-    assert k2._nums == [2.5] + [0] * 6
+    assert k2._nums == (2.5,) + (0,) * 6
     assert str(k2) == "kg^2.5"
     k5 = kilo**-0.5
-    assert k5._nums == [-0.5] + [0] * 6
+    assert k5._nums == (-0.5,) + (0,) * 6
     assert str(k5) == "kg^-0.5"
 
 
@@ -88,26 +93,26 @@ def test_equal(kilo, kilo2):
 
 def test_from_dict():
     meters = Unit.from_dict("length")
-    assert meters._nums == [0, 1, 0, 0, 0, 0, 0]
+    assert meters._nums == (0, 1, 0, 0, 0, 0, 0)
 
 
-def test_update_dict_from_dict():
+def test_update_dict_from_dict(restore_dimensions):
     nums = [1, -3, 0, 0, 0, 0, 0]
     dic = {"density": nums}
     Unit.update_dimensions(dic)
     assert "density" in Unit.dimensions.keys()
     dens = Unit.from_dict("density")
-    assert dens._nums == nums
+    assert dens._nums == tuple(nums)
 
 
-def test_update_dict_from_json():
+def test_update_dict_from_json(restore_dimensions):
     Unit.update_dimensions("mechanics")
     assert "speed" in Unit.dimensions
 
 
 def test_check_dimensions(meter):
     f = Unit.from_dict("length")
-    assert f._nums == [0, 1] + [0] * 5
+    assert f._nums == (0, 1) + (0,) * 5
     f = f * meter
     print(f)
     assert f.check_dimensions() == ["area"]
@@ -115,8 +120,68 @@ def test_check_dimensions(meter):
 
 def test_invert_kilo(kilo):
     inv = kilo.invert()
-    assert inv._nums == [-1] + [0] * 6
+    assert inv._nums == (-1,) + (0,) * 6
 
 
 def test_get_name(kilo):
     assert kilo.get_name() == "mass"
+
+
+def test_interned(kilo, kilo2, meter):
+    assert kilo is kilo2
+    assert kilo * meter is Unit([1, 1])
+    assert Unit([2.0]) is kilo ** 2
+    assert kilo / kilo is NO_UNIT
+
+
+def test_hashable(kilo, kilo2, meter):
+    units = {kilo: "mass", meter: "length"}
+    assert units[kilo2] == "mass"
+    assert len({kilo, kilo2, meter}) == 2
+
+
+def test_immutable_input():
+    nums = [1, 1]
+    Unit(nums)
+    assert nums == [1, 1]
+
+
+def test_update_dict_redefine(restore_dimensions):
+    Unit.update_dimensions({"stiffness": [1, 0, -2]})
+    Unit.update_dimensions({"stiffness": [1, 0, -2, 0, 0, 0, 0]})
+    assert Unit([1, 0, -2]).check_dimensions() == ["stiffness"]
+    Unit.update_dimensions({"stiffness": [1, 1, -2]})
+    assert Unit([1, 0, -2]).get_name() is None
+    assert "stiffness" in Unit([1, 1, -2]).check_dimensions()
+
+
+def test_name_policy(restore_dimensions):
+    Unit.update_dimensions("mechanics")
+    energy = Unit.from_dict("torque")
+    assert energy.check_dimensions() == ["energy", "torque"]
+    assert energy.get_name() == "energy"
+    Unit.set_name_policy("preferred", ["torque"])
+    assert energy.get_name() == "torque"
+    Unit.set_name_policy("all")
+    assert energy.get_name() == "energy, torque"
+    Unit.set_name_policy(None)
+    assert energy.get_name() is None
+    with pytest.raises(ValueError):
+        Unit.set_name_policy("ask")
+
+
+def test_optional_modules_imported_on_use():
+    statement = (
+        "import sys, classes; "
+        "names = ['lazy', 'parallel', 'uncertain', 'instrument', 'registry']; "
+        "assert not any(f'classes.{name}' in sys.modules for name in names); "
+        "assert callable(classes.lazy) and callable(classes.instrument)"
+    )
+    root = Path(__file__).resolve().parent.parent
+    subprocess.run([sys.executable, "-c", statement], cwd=root, check=True)
+    assert "parallel_map" in dir(classes)
+    with pytest.raises(AttributeError):
+        classes.missing
+    names = {}
+    exec("from classes import *", names)
+    assert names["lazy"] is classes.lazy and "monte_carlo" in names
@@ -109,7 +109,7 @@ def test_cross(vec1, vec2):
     assert vec2.cross(vec1) == -cp
 
 
-def test_name(vec_m):
+def test_name(vec_m, restore_dimensions):
     assert vec_m.name == "length"
     grav = Constant.g_vector
     assert grav.name == "gravitational vector"
@@ -122,3 +122,10 @@ def test_rmul(vec_m, one_kilo):
     mul = vec_m * one_kilo
     rmul = one_kilo * vec_m
     assert mul == rmul
+
+
+def test_slots(vec_m, meter):
+    with pytest.raises(AttributeError):
+        vec_m.other = 1
+    with pytest.raises(AttributeError):
+        meter.other = 1
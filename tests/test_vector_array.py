@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+
+from classes import IncompatibleUnitsError, Quantity, QuantityArray, Unit, Vector
+from classes import VectorArray
+
+
+@pytest.fixture
+def vecs1():
+    return VectorArray([[1, 2, 3], [1, 0, 0]])
+
+
+@pytest.fixture
+def vecs2():
+    return VectorArray([[4, 5, 6], [0, 1, 0]])
+
+
+@pytest.fixture
+def vecs_m(meter):
+    return VectorArray([[1, 2, 3], [0, 3, 4]], meter)
+
+
+def test_properties(vecs_m, meter):
+    assert vecs_m.shape == (2,)
+    assert len(vecs_m) == 2
+    assert vecs_m.name == "length"
+    assert type(vecs_m.x) == QuantityArray
+    assert vecs_m.x.unit == meter
+    assert np.array_equal(vecs_m.z.value, [3, 4])
+    assert np.allclose(vecs_m.length, [np.sqrt(14), 5])
+    assert vecs_m.magnitude.unit == meter
+    assert vecs_m[0] == Vector(1, 2, 3, meter)
+    with pytest.raises(ValueError):
+        VectorArray([1, 2])
+
+
+def test_from_vectors(meter):
+    arr = VectorArray.from_vectors([Vector(1, 2, 3, meter), Vector(4, 5, 6, meter)])
+    assert arr.unit == meter
+    assert np.array_equal(arr.y.value, [2, 5])
+    with pytest.raises(IncompatibleUnitsError):
+        VectorArray.from_vectors([Vector(1, 2, 3, meter), Vector(4, 5, 6)])
+
+
+def test_add_sub(vecs1, vecs2, vecs_m):
+    assert (vecs1 + vecs2 == Vector(5, 7, 9)).tolist() == [True, False]
+    assert (vecs2 - vecs1 == VectorArray([[3, 3, 3], [-1, 1, 0]])).all()
+    shifted = Vector(1, 1, 1) + vecs1
+    assert np.array_equal(shifted.value, [[2, 3, 4], [2, 1, 1]])
+    with pytest.raises(IncompatibleUnitsError):
+        _ = vecs1 + vecs_m
+
+
+def test_mul_div(vecs1, vecs_m, one_kilo, kilo, meter):
+    assert np.array_equal((3 * vecs1).value, [[3, 6, 9], [3, 0, 0]])
+    kv = one_kilo * vecs1
+    assert kv.unit == kilo
+    per_vec = vecs_m * QuantityArray([1.0, 2.0], kilo)
+    assert per_vec.unit == Unit([1, 1])
+    assert np.array_equal(per_vec.value, [[1, 2, 3], [0, 6, 8]])
+    halved = vecs_m / np.array([1.0, 2.0])
+    assert np.array_equal(halved.value, [[1, 2, 3], [0, 1.5, 2]])
+    assert halved.unit == meter
+
+
+def test_dot_cross(vecs1, vecs2, vecs_m, meter):
+    dots = vecs1.dot(vecs2)
+    assert type(dots) == np.ndarray
+    assert dots.tolist() == [32, 0]
+    dot_m = vecs1.dot(vecs_m)
+    assert dot_m.unit == meter
+    cp = vecs1.cross(vecs2)
+    assert np.allclose(cp.dot(vecs1), 0)
+    assert np.allclose(cp.dot(vecs2), 0)
+    assert (vecs2.cross(vecs1) == -cp).all()
+    single = vecs_m.cross(Vector(1, 0, 0, meter))
+    assert single.unit == meter**2
+
+
+def test_normalize_angle(vecs1, vecs2, vecs_m, meter):
+    normed = vecs_m.normalize()
+    assert np.allclose(normed.length, 1)
+    assert normed.unit == meter
+    angles = vecs1.angle(vecs2, degs=True)
+    assert np.isclose(angles[1], 90)
+    assert np.allclose(vecs1.angle(vecs1), 0)
+
+
+def test_project_split(vecs1, vecs2):
+    p, o = vecs1.split_parallel_orthogonal(vecs2)
+    assert np.allclose((p + o).value, vecs1.value)
+    assert np.allclose(p.dot(o), 0)
+    assert np.allclose(o.dot(vecs2), 0)
+
+
+def test_matches_vector(vecs1, vecs2):
+    dots = vecs1.dot(vecs2)
+    angles = vecs1.angle(vecs2)
+    for i in range(2):
+        assert dots[i] == vecs1[i].dot(vecs2[i])
+        assert np.isclose(angles[i], vecs1[i].angle(vecs2[i]))
+
+
+def test_invalid_operands(vecs1, vecs_m, meter):
+    v = Vector(1, 0, 0, meter)
+    with pytest.raises(TypeError, match="unsupported operand"):
+        vecs1 * vecs1
+    with pytest.raises(TypeError, match="unsupported operand"):
+        vecs_m * v
+    with pytest.raises(TypeError, match="unsupported operand"):
+        v / vecs_m
+    with pytest.raises(TypeError):
+        np.ones(3) + vecs1
+    crossed = v.cross(vecs_m)
+    assert crossed.unit == meter**2
+    assert (crossed == -vecs_m.cross(v)).all()
+    with pytest.raises(TypeError):
+        v.cross(np.ones(3))
+
+
+def test_indexing(meter):
+    three = VectorArray(np.arange(9.0).reshape(3, 3), meter)
+    x = three[:, 0]
+    assert type(x) == QuantityArray and x.unit is meter
+    assert np.array_equal(x.value, [0, 3, 6])
+    assert type(three[:, ::-1]) == QuantityArray
+    assert type(three[:, :2]) == QuantityArray
+    assert three[1, 2] == Quantity(5.0, meter)
+    assert three[1] == Vector(3, 4, 5, meter)
+    assert type(three[1:]) == VectorArray
+    assert type(three[..., :]) == VectorArray